@@ -0,0 +1,57 @@
+"""
+Sparse fieldsets and expandable relations for API responses.
+
+``?fields=id,date`` limits a read response to the listed top-level fields.
+``?expand=trials`` renders the listed nested relations in full; relations in a
+serializer's ``Meta.expandable_fields`` that are not expanded are rendered as
+lists of primary keys. Without ``?expand`` the serializer's
+``Meta.default_expand`` applies, which keeps existing responses unchanged.
+"""
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+
+def parse_field_list(request, param):
+    """Return the comma-separated names in ``param`` as a set, or None when absent."""
+    if request is None or param not in request.query_params:
+        return None
+    return {name.strip() for name in request.query_params[param].split(',') if name.strip()}
+
+
+def requested_fields(request):
+    return parse_field_list(request, 'fields')
+
+
+def is_sparse_request(request):
+    return requested_fields(request) is not None or parse_field_list(request, 'expand') is not None
+
+
+class SparseFieldsetMixin:
+    """ModelSerializer mixin applying ``?fields=`` and ``?expand=`` to the top-level serializer."""
+
+    def get_fields(self):
+        fields = super().get_fields()
+        request = self.context.get('request')
+        # Writes always see every field, so ?fields= cannot skip validation
+        if request is None or request.method not in SAFE_METHODS or not self._is_top_level():
+            return fields
+
+        only = requested_fields(request)
+        if only is not None:
+            fields = {name: field for name, field in fields.items() if name in only}
+
+        expand = parse_field_list(request, 'expand')
+        if expand is None:
+            expand = set(getattr(self.Meta, 'default_expand', ()))
+        for name in getattr(self.Meta, 'expandable_fields', ()):
+            if name in fields and name not in expand:
+                source = fields[name].source
+                kwargs = {'source': source} if source and source != name else {}
+                fields[name] = serializers.PrimaryKeyRelatedField(many=True, read_only=True, **kwargs)
+        return fields
+
+    def _is_top_level(self):
+        parent = self.parent
+        if isinstance(parent, serializers.ListSerializer):
+            parent = parent.parent
+        return parent is None
@@ -0,0 +1,75 @@
+"""
+Idempotency-Key support for retried POSTs.
+
+The first successful response for a (user, view, key) is kept in the cache
+and replayed for retries within IDEMPOTENCY['TTL'], without running the view
+again. A retry that arrives while the first request is still running gets 409;
+reusing a key with a different body gets 422. Failed responses are not stored,
+so a retry after an error runs the view again.
+"""
+import hashlib
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import status
+from rest_framework.response import Response
+
+HEADER = 'HTTP_IDEMPOTENCY_KEY'
+MAX_KEY_LENGTH = 255
+
+
+def get_config():
+    return {'TTL': 24 * 60 * 60, 'LOCK_TIMEOUT': 30, **getattr(settings, 'IDEMPOTENCY', {})}
+
+
+def idempotency_cache_key(request, view, key):
+    digest = hashlib.sha256(key.encode()).hexdigest()
+    return f'idempotency:{type(view).__name__}:{request.user.pk}:{digest}'
+
+
+def idempotent(handler):
+    """Decorate an APIView method so requests carrying an Idempotency-Key are replayed on retry."""
+
+    @wraps(handler)
+    def wrapper(self, request, *args, **kwargs):
+        key = request.META.get(HEADER)
+        if not key:
+            return handler(self, request, *args, **kwargs)
+        if len(key) > MAX_KEY_LENGTH:
+            return Response(
+                {'error': f'Idempotency-Key must be at most {MAX_KEY_LENGTH} characters.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        config = get_config()
+        cache_key = idempotency_cache_key(request, self, key)
+        body_hash = hashlib.sha256(request.body).hexdigest()
+
+        stored = cache.get(cache_key)
+        if stored is None:
+            if not cache.add(f'{cache_key}:lock', True, config['LOCK_TIMEOUT']):
+                return Response(
+                    {'error': 'A request with this Idempotency-Key is still being processed.'},
+                    status=status.HTTP_409_CONFLICT,
+                )
+            try:
+                response = handler(self, request, *args, **kwargs)
+                if status.is_success(response.status_code):
+                    cache.set(cache_key, {
+                        'body_hash': body_hash, 'status': response.status_code, 'data': response.data,
+                    }, config['TTL'])
+            finally:
+                cache.delete(f'{cache_key}:lock')
+            return response
+
+        if stored['body_hash'] != body_hash:
+            return Response(
+                {'error': 'This Idempotency-Key was already used with a different request body.'},
+                status=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            )
+        response = Response(stored['data'], status=stored['status'])
+        response['Idempotent-Replayed'] = 'true'
+        return response
+
+    return wrapper
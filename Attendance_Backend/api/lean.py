@@ -0,0 +1,135 @@
+"""
+Lean read serialization for list endpoints.
+
+A LeanSerializer renders ``queryset.values_list()`` rows with the field
+formatting of an existing ModelSerializer, so list responses are the same
+JSON without instantiating models or running per-field serializer machinery.
+"""
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.utils import timezone
+from rest_framework import ISO_8601, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+from .fieldsets import requested_fields
+
+# Fields whose to_representation() returns database values unchanged
+PASSTHROUGH_FIELDS = (
+    serializers.BooleanField,
+    serializers.CharField,
+    serializers.ChoiceField,
+    serializers.IntegerField,
+    serializers.ReadOnlyField,
+    serializers.SerializerMethodField,  # only reachable through ``sources``
+    serializers.SlugRelatedField,
+)
+
+
+def _iso_datetime(value):
+    value = value.isoformat()
+    if value.endswith('+00:00'):
+        value = value[:-6] + 'Z'
+    return value
+
+
+def build_formatter(field, current_timezone):
+    """Return a callable formatting a non-null database value like ``field``, or None for as-is."""
+    if isinstance(field, serializers.DateTimeField):
+        output_format = getattr(field, 'format', api_settings.DATETIME_FORMAT)
+        if output_format is None or not settings.USE_TZ:
+            return field.to_representation
+        field_timezone = getattr(field, 'timezone', current_timezone)
+        if output_format.lower() == ISO_8601:
+            return lambda value: _iso_datetime(value.astimezone(field_timezone))
+        return lambda value: value.astimezone(field_timezone).strftime(output_format)
+
+    if isinstance(field, (serializers.DateField, serializers.TimeField)):
+        default = api_settings.DATE_FORMAT if isinstance(field, serializers.DateField) else api_settings.TIME_FORMAT
+        output_format = getattr(field, 'format', default)
+        if output_format is None:
+            return None
+        if output_format.lower() == ISO_8601:
+            return lambda value: value.isoformat()
+        return lambda value: value.strftime(output_format)
+
+    if isinstance(field, serializers.PrimaryKeyRelatedField):
+        return None if field.pk_field is None else field.pk_field.to_representation
+
+    if isinstance(field, PASSTHROUGH_FIELDS):
+        return None
+
+    if isinstance(field, (serializers.BaseSerializer, serializers.ManyRelatedField)):
+        raise ImproperlyConfigured(
+            f"LeanSerializer cannot render nested field {field.field_name!r}; exclude it or give it a source."
+        )
+    return field.to_representation
+
+
+class LeanSerializer:
+    """
+    Subclass with ``serializer_class`` and, for method or related fields, a
+    ``sources`` mapping of field name to values() lookup::
+
+        class TimeRecordLeanSerializer(LeanSerializer):
+            serializer_class = TimeRecordSerializer
+            sources = {'rate_per_hour': 'user__work_profile__rate_per_hour'}
+
+        TimeRecordLeanSerializer(queryset).data
+    """
+    serializer_class = None
+    sources = {}
+
+    _columns = None
+
+    def __init__(self, queryset, fields=None):
+        self.queryset = queryset
+        self.only = fields  # optional set of field names, as from ?fields=
+
+    @classmethod
+    def get_columns(cls):
+        """(name, lookup, serializer field) per readable field, in serializer order; built once."""
+        if cls.__dict__.get('_columns') is None:
+            columns = []
+            for name, field in cls.serializer_class().fields.items():
+                if field.write_only:
+                    continue
+                if name in cls.sources:
+                    lookup = cls.sources[name]
+                elif isinstance(field, serializers.SerializerMethodField) or field.source == '*':
+                    raise ImproperlyConfigured(f"{cls.__name__} needs a source for field {name!r}.")
+                else:
+                    lookup = field.source.replace('.', '__')
+                columns.append((name, lookup, field))
+            cls._columns = columns
+        return cls._columns
+
+    @property
+    def data(self):
+        columns = self.get_columns()
+        if self.only is not None:
+            columns = [column for column in columns if column[0] in self.only]
+        current_timezone = timezone.get_current_timezone()
+        names = [name for name, _, _ in columns]
+        formatters = list(enumerate(build_formatter(field, current_timezone) for _, _, field in columns))
+        formatters = [(index, formatter) for index, formatter in formatters if formatter is not None]
+
+        rows = []
+        for values in self.queryset.values_list(*[lookup for _, lookup, _ in columns]):
+            values = list(values)
+            for index, formatter in formatters:
+                if values[index] is not None:
+                    values[index] = formatter(values[index])
+            rows.append(dict(zip(names, values)))
+        return rows
+
+
+class LeanListMixin:
+    """Serve unpaginated ``list`` actions through ``lean_serializer_class``."""
+    lean_serializer_class = None
+
+    def list(self, request, *args, **kwargs):
+        if self.lean_serializer_class is None or self.paginator is not None:
+            return super().list(request, *args, **kwargs)
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(self.lean_serializer_class(queryset, fields=requested_fields(request)).data)
@@ -0,0 +1,108 @@
+"""
+Token-bucket throttles backed by the shared cache.
+
+Each bucket is stored as a single "theoretical arrival time" (the GCRA form of
+a token bucket): one cache read and one write per request, whatever the rate.
+A rate of ``"30/min"`` refills one token every two seconds and lets a client
+burst up to 30 requests from a full bucket.
+
+Rates come from ``REST_FRAMEWORK['DEFAULT_THROTTLE_RATES']`` and are read on
+every check, so overriding the setting takes effect immediately. A view is
+throttled under its ``throttle_scope``; a scope without a configured rate is
+not throttled. Views using ``UnsafeMethodThrottleMixin`` only spend tokens on
+writes.
+"""
+import hashlib
+import time
+
+from django.core.cache import cache as default_cache
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.settings import api_settings
+from rest_framework.throttling import BaseThrottle
+
+DURATIONS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+
+def parse_rate(rate):
+    """``"30/min"`` -> (30, 60)."""
+    count, period = rate.split('/')
+    return int(count), DURATIONS[period[0]]
+
+
+class TokenBucketThrottle(BaseThrottle):
+    cache = default_cache
+    timer = time.time
+    scope_suffix = ''
+
+    def get_scope(self, view):
+        scope = getattr(view, 'throttle_scope', None)
+        return scope + self.scope_suffix if scope else None
+
+    def get_ident_key(self, request):
+        raise NotImplementedError('.get_ident_key() must be overridden')
+
+    def allow_request(self, request, view):
+        self.wait_time = None
+        scope = self.get_scope(view)
+        rate = api_settings.DEFAULT_THROTTLE_RATES.get(scope) if scope else None
+        if rate is None:
+            return True
+
+        capacity, period = parse_rate(rate)
+        interval = period / capacity
+        key = f'throttle:{scope}:{self.get_ident_key(request)}'
+        now = self.timer()
+
+        arrival = max(self.cache.get(key, now), now)
+        # A full bucket lets ``capacity`` requests through back to back
+        allowed_at = arrival - (period - interval)
+        if allowed_at > now:
+            self.wait_time = allowed_at - now
+            return False
+
+        self.cache.set(key, arrival + interval, timeout=int(arrival + interval - now) + 1)
+        return True
+
+    def wait(self):
+        return self.wait_time
+
+
+class UserTokenBucketThrottle(TokenBucketThrottle):
+    """Per user under ``throttle_scope``; anonymous requests are keyed by client IP."""
+
+    def get_ident_key(self, request):
+        if request.user and request.user.is_authenticated:
+            return f'user:{request.user.pk}'
+        return f'ip:{self.get_ident(request)}'
+
+
+class CredentialTokenBucketThrottle(TokenBucketThrottle):
+    """
+    Per submitted email under ``throttle_scope``, for login: employees behind
+    one site NAT each get their own bucket, and guessing at one account is
+    limited wherever the guesses come from. Requests without an email are
+    keyed by client IP.
+    """
+
+    def get_ident_key(self, request):
+        email = request.data.get('email') if hasattr(request.data, 'get') else None
+        if isinstance(email, str) and email.strip():
+            return 'email:' + hashlib.sha256(email.strip().lower().encode()).hexdigest()
+        return f'ip:{self.get_ident(request)}'
+
+
+class IPTokenBucketThrottle(TokenBucketThrottle):
+    """Per client IP under ``<throttle_scope>_ip``, e.g. a site tablet shared by a whole shift."""
+    scope_suffix = '_ip'
+
+    def get_ident_key(self, request):
+        return f'ip:{self.get_ident(request)}'
+
+
+class UnsafeMethodThrottleMixin:
+    """Throttle writes only, so status polls on the same view do not spend the budget."""
+
+    def get_throttles(self):
+        if self.request.method in SAFE_METHODS:
+            return []
+        return super().get_throttles()
@@ -1,5 +1,7 @@
 from django.urls import path, include
+from .views import MetricsView
 
 urlpatterns = [
     path("", include("accounts.urls")),
+    path("metrics/", MetricsView.as_view(), name="metrics"),
 ]
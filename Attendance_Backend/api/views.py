@@ -0,0 +1,12 @@
+from django.http import HttpResponse
+from rest_framework.permissions import IsAdminUser
+from rest_framework.views import APIView
+from Attendance_Backend.metrics import registry
+
+
+class MetricsView(APIView):
+    """Request metrics of this worker process in the Prometheus text format."""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
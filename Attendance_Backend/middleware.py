@@ -0,0 +1,151 @@
+from contextlib import ExitStack
+from time import perf_counter
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+from django.middleware.gzip import GZipMiddleware
+from django.utils.cache import patch_vary_headers
+from django.utils.regex_helper import _lazy_re_compile
+from .metrics import registry
+from .querylog import QueryInspector, get_config
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    brotli = None
+
+re_accepts_brotli = _lazy_re_compile(r'\bbr\b')
+
+
+class RequestStats:
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.render_time = 0.0
+        self._render_started = None
+
+    def record_query(self, execute, sql, params, many, context):
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += perf_counter() - start
+            self.queries += 1
+
+    def start_render(self):
+        self._render_started = perf_counter()
+
+    def finish_render(self, response):
+        if self._render_started is not None:
+            self.render_time = perf_counter() - self._render_started
+
+
+def view_label(request):
+    match = getattr(request, 'resolver_match', None)
+    if match is None:
+        return 'unresolved'
+    return match.view_name or match.route or 'unnamed'
+
+
+class RequestMetricsMiddleware:
+    """
+    Records query count, DB time, render time and response size per view.
+
+    The numbers are returned in a Server-Timing header and aggregated into the
+    histograms served by the admin-only metrics endpoint.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.server_timing = getattr(settings, 'REQUEST_METRICS', {}).get('SERVER_TIMING', True)
+
+    def __call__(self, request):
+        stats = request._request_stats = RequestStats()
+        start = perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(stats.record_query))
+            response = self.get_response(request)
+        duration = perf_counter() - start
+
+        labels = {'view': view_label(request), 'method': request.method}
+        registry.increment('http_requests_total', status=response.status_code, **labels)
+        registry.observe('http_request_duration_seconds', duration, **labels)
+        registry.observe('http_request_db_duration_seconds', stats.db_time, **labels)
+        registry.observe('http_request_db_queries', stats.queries, **labels)
+        registry.observe('http_response_render_duration_seconds', stats.render_time, **labels)
+        if not response.streaming:
+            registry.observe('http_response_size_bytes', len(response.content), **labels)
+
+        if self.server_timing:
+            response['Server-Timing'] = (
+                f'db;dur={stats.db_time * 1000:.2f};desc="{stats.queries} queries", '
+                f'render;dur={stats.render_time * 1000:.2f}, '
+                f'total;dur={duration * 1000:.2f}'
+            )
+        return response
+
+    def process_template_response(self, request, response):
+        # Runs right before DRF renders the response body
+        stats = getattr(request, '_request_stats', None)
+        if stats is not None:
+            stats.start_render()
+            response.add_post_render_callback(stats.finish_render)
+        return response
+
+
+class QueryInspectionMiddleware:
+    """Logs N+1 query patterns and slow queries per request when QUERY_INSPECTION is enabled."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if not get_config()['ENABLED']:
+            raise MiddlewareNotUsed
+
+    def __call__(self, request):
+        inspector = QueryInspector(label=f"[{request.method} {request.path}]")
+        with inspector.capture():
+            response = self.get_response(request)
+        inspector.log_repeated()
+        return response
+
+
+class CompressionMiddleware(GZipMiddleware):
+    """
+    GZipMiddleware with the size threshold from RESPONSE_COMPRESSION, using
+    brotli instead of gzip when the client accepts it and the brotli package
+    is installed.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        config = getattr(settings, 'RESPONSE_COMPRESSION', {})
+        self.min_size = config.get('MIN_SIZE', 1024)
+        self.brotli_quality = config.get('BROTLI_QUALITY', 5)
+
+    def process_response(self, request, response):
+        if not response.streaming and len(response.content) < self.min_size:
+            return response
+        if response.get('Content-Type', '').startswith('text/event-stream'):
+            # A compressor buffers output, which would hold events back
+            return response
+        if (
+            brotli is None
+            or response.streaming
+            or response.has_header('Content-Encoding')
+            or not re_accepts_brotli.search(request.META.get('HTTP_ACCEPT_ENCODING', ''))
+        ):
+            return super().process_response(request, response)
+
+        patch_vary_headers(response, ('Accept-Encoding',))
+        compressed = brotli.compress(response.content, quality=self.brotli_quality)
+        if len(compressed) >= len(response.content):
+            return response
+        response.content = compressed
+        response.headers['Content-Length'] = str(len(compressed))
+        # Same ETag weakening as GZipMiddleware
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response.headers['ETag'] = 'W/' + etag
+        response.headers['Content-Encoding'] = 'br'
+        return response
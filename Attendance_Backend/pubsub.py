@@ -0,0 +1,72 @@
+"""
+Publish/subscribe for pushing events to open streaming connections.
+
+``get_broker()`` returns the broker named by PUBSUB['BACKEND']. The default
+InProcessBroker only reaches subscribers in the same process, which is enough
+for a single ASGI worker. Running several workers needs a broker backed by a
+shared server (Redis, Postgres LISTEN/NOTIFY, ...) with the same two methods:
+
+* ``publish(channel, message)``: callable from sync code, never blocks.
+* ``subscribe(channel)``: an async context manager yielding an object whose
+  ``await get()`` returns the next message.
+"""
+import asyncio
+import threading
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from functools import lru_cache
+
+from django.conf import settings
+from django.utils.module_loading import import_string
+
+DEFAULT_BACKEND = 'Attendance_Backend.pubsub.InProcessBroker'
+
+
+def _offer(queue, message):
+    # A subscriber that stopped reading loses its oldest message, not the newest
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(message)
+
+
+class InProcessBroker:
+    """Fans messages out to asyncio queues of subscribers in this process."""
+
+    def __init__(self, queue_size=100):
+        self.queue_size = queue_size
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def publish(self, channel, message):
+        """Deliver ``message`` to every current subscriber of ``channel``; return how many."""
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for loop, queue in subscribers:
+            try:
+                loop.call_soon_threadsafe(_offer, queue, message)
+            except RuntimeError:  # the subscriber's event loop has closed
+                pass
+        return len(subscribers)
+
+    @asynccontextmanager
+    async def subscribe(self, channel):
+        subscriber = (asyncio.get_running_loop(), asyncio.Queue(self.queue_size))
+        with self._lock:
+            self._subscribers[channel].add(subscriber)
+        try:
+            yield subscriber[1]
+        finally:
+            with self._lock:
+                self._subscribers[channel].discard(subscriber)
+                if not self._subscribers[channel]:
+                    del self._subscribers[channel]
+
+    def subscriber_count(self, channel):
+        with self._lock:
+            return len(self._subscribers.get(channel, ()))
+
+
+@lru_cache(maxsize=None)
+def get_broker():
+    config = getattr(settings, 'PUBSUB', {})
+    return import_string(config.get('BACKEND', DEFAULT_BACKEND))(**config.get('OPTIONS', {}))
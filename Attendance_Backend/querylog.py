@@ -0,0 +1,133 @@
+"""
+Query inspection: N+1 detection and slow-query logging.
+
+Executed SQL is grouped by a normalized template. A template repeated
+N_PLUS_ONE_THRESHOLD times within one request is reported together with the
+serializer field that issued it. Stacks are only captured for the repeat that
+crosses the threshold and for slow queries, which keeps the per-query cost to
+a regex and a counter increment.
+"""
+import logging
+import re
+import sys
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+from time import perf_counter
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger('attendance.queries')
+
+DEFAULT_CONFIG = {
+    'ENABLED': False,
+    'N_PLUS_ONE_THRESHOLD': 5,
+    'SLOW_QUERY_MS': 200,
+}
+
+_IN_LIST = re.compile(r'\bIN \((?:\s*%s\s*,)*\s*%s\s*\)', re.IGNORECASE)
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r'\b\d+(?:\.\d+)?\b')
+_SPACE = re.compile(r'\s+')
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'QUERY_INSPECTION', {})}
+
+
+def normalize_sql(sql):
+    """Reduce a query to its template so per-row repeats group together."""
+    sql = _STRING.sub('%s', sql)
+    sql = _NUMBER.sub('%s', sql)
+    sql = _IN_LIST.sub('IN (...)', sql)
+    return _SPACE.sub(' ', sql).strip()
+
+
+def _project_frames(frame, limit=5):
+    base = str(settings.BASE_DIR)
+    frames = []
+    while frame is not None and len(frames) < limit:
+        filename = frame.f_code.co_filename
+        if filename.startswith(base) and 'site-packages' not in filename:
+            frames.append(f"{filename[len(base) + 1:]}:{frame.f_lineno} in {frame.f_code.co_name}")
+        frame = frame.f_back
+    return frames
+
+
+def find_origin(frame=None):
+    """Name the serializer field (``Serializer.field``) or project code running a query."""
+    from rest_framework.fields import Field
+
+    frame = frame or sys._getframe(1)
+    current = frame
+    while current is not None:
+        owner = current.f_locals.get('self')
+        if isinstance(owner, Field) and owner.field_name and owner.parent is not None:
+            return f"{type(owner.parent).__name__}.{owner.field_name}"
+        current = current.f_back
+    project = _project_frames(frame, limit=1)
+    return project[0] if project else 'unknown'
+
+
+class NPlusOneDetected(AssertionError):
+    pass
+
+
+class QueryInspector:
+    def __init__(self, threshold=None, slow_ms=None, label=''):
+        config = get_config()
+        self.threshold = threshold or config['N_PLUS_ONE_THRESHOLD']
+        self.slow_ms = config['SLOW_QUERY_MS'] if slow_ms is None else slow_ms
+        self.label = label
+        self.counts = Counter()
+        self.origins = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        start = perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed_ms = (perf_counter() - start) * 1000
+            template = normalize_sql(sql)
+            self.counts[template] += 1
+            if self.counts[template] == self.threshold:
+                self.origins[template] = find_origin()
+            if elapsed_ms >= self.slow_ms:
+                logger.warning(
+                    "Slow query (%.1f ms) %s: %s\n  %s",
+                    elapsed_ms, self.label, sql, '\n  '.join(_project_frames(sys._getframe(1))),
+                )
+
+    @contextmanager
+    def capture(self):
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(self))
+            yield self
+
+    @property
+    def repeated(self):
+        """(template, count, origin) for every template at or above the threshold."""
+        return [
+            (template, count, self.origins.get(template, 'unknown'))
+            for template, count in self.counts.most_common()
+            if count >= self.threshold
+        ]
+
+    def describe(self):
+        return '\n'.join(
+            f"{count}x from {origin}: {template}" for template, count, origin in self.repeated
+        )
+
+    def log_repeated(self):
+        if self.repeated:
+            logger.warning("Possible N+1 queries %s:\n%s", self.label, self.describe())
+
+
+@contextmanager
+def assert_no_n_plus_one(threshold=None):
+    """Fail (e.g. in tests) when the block repeats any query template ``threshold`` times."""
+    inspector = QueryInspector(threshold=threshold, slow_ms=float('inf'))
+    with inspector.capture():
+        yield inspector
+    if inspector.repeated:
+        raise NPlusOneDetected(f"Repeated queries detected:\n{inspector.describe()}")
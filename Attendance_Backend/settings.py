@@ -52,10 +52,31 @@ INSTALLED_APPS = [
     'import_export',
     'clients',
     'goals',
+    'locations',
+    'reports',
     'django_filters',
 ]
 
+# Process profile. API workers (SERVICE_ROLE=api) never serve the admin, so
+# they skip discovering the ModelAdmins and what only those need: jazzmin and
+# import_export, which loads openpyxl. That is most of their import time (see
+# benchmarks/bench_startup.py). Admin and worker (cron, management command)
+# processes keep the default, 'all'.
+SERVICE_ROLE = os.getenv('SERVICE_ROLE', 'all')
+SERVE_ADMIN = SERVICE_ROLE != 'api'
+
+if not SERVE_ADMIN:
+    INSTALLED_APPS.remove('jazzmin')
+    INSTALLED_APPS.remove('import_export')
+    # The admin's models stay installed (deleting a user cascades to LogEntry)
+    INSTALLED_APPS[INSTALLED_APPS.index('django.contrib.admin')] = 'django.contrib.admin.apps.SimpleAdminConfig'
+if not DEBUG:
+    INSTALLED_APPS.remove('django_extensions')  # shell_plus and friends, development only
+
 MIDDLEWARE = [
+    'Attendance_Backend.middleware.RequestMetricsMiddleware',
+    'Attendance_Backend.middleware.QueryInspectionMiddleware',
+    'Attendance_Backend.middleware.CompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -85,9 +106,6 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'Attendance_Backend.wsgi.application'
 
-USE_TZ = True
-TIME_ZONE = 'America/New_York'  # Set your appropriate timezone
-
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
@@ -98,6 +116,24 @@ DATABASES = {
     }
 }
 
+# Cache
+# Local memory is per process; point CACHE_URL at Redis when running several
+# workers so cached reads and invalidations are shared between them.
+if os.getenv('CACHE_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('CACHE_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'attendance',
+        }
+    }
+
 AUTH_USER_MODEL = "accounts.User"
 
 
@@ -119,6 +155,23 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# Password hashing
+# The first hasher encodes new passwords; the others still verify older hashes,
+# which Django rewrites with the first one on the next successful login.
+# PASSWORD_HASH_PROFILE picks the cost (see accounts.hashers.HASH_PROFILES).
+PASSWORD_HASH_PROFILE = os.getenv('PASSWORD_HASH_PROFILE', 'default')
+
+PASSWORD_HASHERS = [
+    'accounts.hashers.ProfilePBKDF2PasswordHasher',
+    'accounts.hashers.ProfileScryptPasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+]
+
+if os.getenv('PASSWORD_HASH_ALGORITHM') == 'scrypt':
+    PASSWORD_HASHERS[0], PASSWORD_HASHERS[1] = PASSWORD_HASHERS[1], PASSWORD_HASHERS[0]
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": (
         "rest_framework.authentication.BasicAuthentication",
@@ -126,9 +179,34 @@ REST_FRAMEWORK = {
         "rest_framework_simplejwt.authentication.JWTAuthentication",
     ),
     'DEFAULT_FILTER_BACKENDS': ['django_filters.rest_framework.DjangoFilterBackend'],
+    # orjson-backed when installed, DRF's stdlib json otherwise
+    'DEFAULT_RENDERER_CLASSES': [
+        'Attendance_Backend.api.renderers.FastJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ],
+    'DEFAULT_PARSER_CLASSES': [
+        'Attendance_Backend.api.renderers.FastJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ],
     "DEFAULT_PERMISSION_CLASSES": ("rest_framework.permissions.AllowAny",),
+    # Proxies in front of the app: client IPs for throttling are read that far
+    # back in X-Forwarded-For. 0 uses REMOTE_ADDR, so the header cannot be spoofed.
+    'NUM_PROXIES': int(os.getenv('NUM_PROXIES', '0')),
     'DATE_FORMAT': "%m/%d/%Y",
     'DATE_INPUT_FORMATS': ["%m/%d/%Y"],
+    # Token-bucket scopes (Attendance_Backend.api.throttling); "N/period" allows
+    # bursts of N and refills at N per period. "<scope>_ip" rates apply per client IP.
+    'DEFAULT_THROTTLE_RATES': {
+        'login': '10/min',     # per submitted email
+        # A site logging in at shift start shares one NAT address
+        'login_ip': '600/min',
+        'register': '5/min',
+        'clock': '20/min',
+        # Clock writes only come from site networks, where a whole shift shares one
+        # NAT address: sized for a site clocking in together, not for a single device
+        'clock_ip': '1200/min',
+    },
 }
 
 # Simple JSON Web Token Authentication Settings
@@ -138,6 +216,98 @@ SIMPLE_JWT = {
     "UPDATE_LAST_LOGIN": True,
 }
 
+# Per-request instrumentation (Attendance_Backend.middleware.RequestMetricsMiddleware)
+# Aggregated histograms are served to staff at /api/metrics/.
+REQUEST_METRICS = {
+    'SERVER_TIMING': True,  # add a Server-Timing header to every response
+}
+
+# gzip (or brotli, when installed) for responses of at least MIN_SIZE bytes
+# (Attendance_Backend.middleware.CompressionMiddleware)
+RESPONSE_COMPRESSION = {
+    'MIN_SIZE': 1024,
+    'BROTLI_QUALITY': 5,  # 0-11; 4-6 keeps per-response CPU close to gzip
+}
+
+# N+1 and slow-query logging to the 'attendance.queries' logger
+# (Attendance_Backend.middleware.QueryInspectionMiddleware)
+QUERY_INSPECTION = {
+    'ENABLED': os.getenv('QUERY_INSPECTION', str(DEBUG)).lower() in ('1', 'true', 'yes'),
+    'N_PLUS_ONE_THRESHOLD': 5,   # same query template this many times per request
+    'SLOW_QUERY_MS': 200,
+}
+
+# Replay window for POSTs sent with an Idempotency-Key header
+# (Attendance_Backend.api.idempotency)
+IDEMPOTENCY = {
+    'TTL': 24 * 60 * 60,   # seconds a stored response is replayed for
+    'LOCK_TIMEOUT': 30,    # longest a first request holds its key; retries meanwhile get 409
+}
+
+# Batch sync of clock events recorded while a device was offline
+# (POST /api/attendance/sync/, see employee.offline)
+OFFLINE_SYNC = {
+    'MAX_EVENTS': 500,
+    'MAX_AGE_DAYS': 7,
+    'CLOCK_SKEW_SECONDS': 300,
+    'KEY_LIFETIME_HOURS': 24,  # events a key signs must fall between issue and expiry
+}
+
+# Clock-state transitions pushed over server-sent events
+# (GET /api/attendance/stream/, see employee.streams). The in-process broker
+# only reaches streams held by the same worker; with several ASGI workers
+# point BACKEND at a shared broker (see Attendance_Backend.pubsub).
+PUBSUB = {
+    'BACKEND': 'Attendance_Backend.pubsub.InProcessBroker',
+    'OPTIONS': {'queue_size': 100},
+}
+CLOCK_STREAM = {
+    'HEARTBEAT_SECONDS': 15,
+    'MAX_SECONDS': 60 * 60,
+    'RETRY_MS': 3000,
+}
+
+# Nightly closing of forgotten check-outs and resumes
+# (python manage.py close_stale_clock_records)
+CLOCK_RECONCILIATION = {
+    'SHIFT_END': '17:00',     # site time a forgotten shift is closed at
+    'MAX_SHIFT_HOURS': 12,    # an auto-closed shift never runs longer than this
+    'BATCH_SIZE': 500,
+}
+
+# Precomputed per-site reports (python manage.py generate_reports, from cron;
+# served from MEDIA_ROOT by GET /api/reports/<id>/download/)
+REPORTS = {
+    'TIMESHEET_ANCHOR': '2026-01-05',  # first day of a biweekly pay period
+    'FORMATS': ['xlsx'],
+    'PERIODS_BACK': 1,
+    'MAX_AGE': 5 * 60,
+}
+
+# Server-rendered charts (GET /api/charts/..., see reports.charts). Batches of
+# POOL_MIN_BATCH or more uncached charts render in POOL_SIZE worker processes.
+CHARTS = {
+    'POOL_SIZE': 2,
+    'POOL_MIN_BATCH': 4,
+    'CACHE_TIMEOUT': 24 * 60 * 60,
+    'MAX_AGE': 5 * 60,
+}
+
+# Nightly archiving of old closed clock records
+# (python manage.py archive_clock_records, see employee.archive)
+CLOCK_ARCHIVE = {
+    'HORIZON_DAYS': 400,  # site days kept in the live tables
+    'BATCH_SIZE': 1000,   # rows moved per transaction
+}
+
+# Audit log of admin edits to clock records (see employee.audit)
+CLOCK_AUDIT = {
+    'ASYNC': True,        # False: write entries as the edit commits
+    'FLUSH_SECONDS': 2,   # longest an entry waits in the buffer
+    'FLUSH_SIZE': 100,    # entries that trigger an early flush
+    'MAX_BUFFER': 10000,  # entries kept while the database is unreachable
+}
+
 CSRF_COOKIE_HTTPONLY = False  # Allows the frontend to access the CSRF token
 
 # django-cors-headers settings
@@ -195,6 +365,8 @@ TEMPLATES = [
 
 LANGUAGE_CODE = 'en-us'
 
+# Default site time zone: attendance days are bucketed in it unless the
+# user's Location has its own (Attendance_Backend.sitetime).
 TIME_ZONE = 'America/Phoenix'
 
 USE_TZ = True
@@ -210,6 +382,10 @@ USE_I18N = True
 
 STATIC_URL = 'static/'
 
+# Generated files (reports)
+MEDIA_URL = 'media/'
+MEDIA_ROOT = BASE_DIR / 'media'
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
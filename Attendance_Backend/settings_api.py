@@ -0,0 +1,44 @@
+"""
+API-only settings profile, for workers behind the JWT API:
+
+    DJANGO_SETTINGS_MODULE=Attendance_Backend.settings_api
+
+Same apps, database and API behaviour as Attendance_Backend.settings, without
+what only the admin and browser sessions use: the admin site and its apps
+(SERVICE_ROLE=api), the session, CSRF, auth, messages and clickjacking
+middleware, session/basic authentication and the browsable API. Requests go
+through six middleware instead of eleven; see benchmarks/bench_profiles.py.
+Admin, cron and management processes keep the default settings.
+"""
+import os
+
+# Read by the base settings to leave the admin apps out
+os.environ['SERVICE_ROLE'] = 'api'
+
+from .settings import *  # noqa: E402,F401,F403
+from .settings import REST_FRAMEWORK, TEMPLATES  # noqa: E402
+
+ROOT_URLCONF = 'Attendance_Backend.urls_api'
+
+MIDDLEWARE = [
+    'Attendance_Backend.middleware.RequestMetricsMiddleware',
+    'Attendance_Backend.middleware.QueryInspectionMiddleware',
+    'Attendance_Backend.middleware.CompressionMiddleware',
+    'corsheaders.middleware.CorsMiddleware',
+    'django.middleware.security.SecurityMiddleware',
+    'django.middleware.common.CommonMiddleware',
+]
+
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    # Bearer tokens only: no session, so no CSRF to enforce
+    'DEFAULT_AUTHENTICATION_CLASSES': ('rest_framework_simplejwt.authentication.JWTAuthentication',),
+    'DEFAULT_RENDERER_CLASSES': ['Attendance_Backend.api.renderers.FastJSONRenderer'],
+}
+
+# Nothing is rendered from templates without the admin and browsable API
+TEMPLATES = [{**TEMPLATES[0], 'OPTIONS': {**TEMPLATES[0]['OPTIONS'], 'context_processors': []}}]
+
+# The admin app stays installed for its models (SimpleAdminConfig) but is never
+# served, so its middleware and template requirements do not apply
+SILENCED_SYSTEM_CHECKS = ['admin.E402', 'admin.E404', 'admin.E408', 'admin.E409', 'admin.E410']
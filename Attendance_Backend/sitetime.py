@@ -0,0 +1,128 @@
+"""
+Site time: the zone attendance days are bucketed in.
+
+Helpers take an optional location code and use that Location's time zone, or
+settings.TIME_ZONE without one. Use them instead of ``timezone.localdate()``,
+which follows the zone activated for the current request, so a shift lands on
+the same day in the API, the admin, reconciliation and exports.
+
+Each process keeps a location's zone for ZONE_TTL seconds. Saving a Location
+clears the zones of the process that saved it; other workers pick the change
+up within ZONE_TTL.
+"""
+import time
+from datetime import timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo
+
+from django.conf import settings
+from django.core.signals import setting_changed
+from django.dispatch import receiver
+from django.utils import timezone
+
+UTC = dt_timezone.utc
+# Offset changes are months apart, so weekly samples find any change in a span
+OFFSET_SAMPLE_INTERVAL = timedelta(days=7)
+ZONE_TTL = 60  # seconds
+
+_zones = {}  # location code -> (expires at, zone)
+
+
+def site_zone(location=None):
+    now = time.monotonic()
+    cached = _zones.get(location)
+    if cached is not None and cached[0] > now:
+        return cached[1]
+    name = None
+    if location is not None:
+        from locations.models import Location
+
+        name = Location.objects.filter(code=location).values_list('time_zone', flat=True).first()
+    zone = ZoneInfo(name or settings.TIME_ZONE)
+    _zones[location] = (now + ZONE_TTL, zone)
+    return zone
+
+
+def known_sites():
+    """Every Location code, after None for people without a site; caches their zones."""
+    from locations.models import Location
+
+    expires = time.monotonic() + ZONE_TTL
+    codes = [None]
+    for code, name in Location.objects.values_list('code', 'time_zone'):
+        _zones[code] = (expires, ZoneInfo(name))
+        codes.append(code)
+    return codes
+
+
+def user_sites(user_ids):
+    """``{user id: Location code or None}`` for the site each user works at."""
+    from settings.models import UserSettings
+
+    sites = dict(UserSettings.objects.filter(user_id__in=user_ids).values_list('user_id', 'site_id'))
+    return {user_id: sites.get(user_id) for user_id in user_ids}
+
+
+def user_site(user_id):
+    return user_sites([user_id])[user_id]
+
+
+def clear_site_zones():
+    _zones.clear()
+
+
+@receiver(setting_changed)
+def _time_zone_changed(setting, **kwargs):
+    if setting == 'TIME_ZONE':
+        clear_site_zones()
+
+
+def site_now(location=None):
+    return timezone.now().astimezone(site_zone(location))
+
+
+def site_today(location=None):
+    return site_now(location).date()
+
+
+def to_site_time(value, location=None):
+    """``value`` in site time; naive values are taken as UTC, as the database stores them."""
+    if value is None:
+        return None
+    if timezone.is_naive(value):
+        value = value.replace(tzinfo=UTC)
+    return value.astimezone(site_zone(location))
+
+
+def site_date(value, location=None):
+    return to_site_time(value, location).date()
+
+
+def fixed_offset(zone, start, end):
+    """The UTC offset ``zone`` keeps over [start, end], or None if it changes."""
+    offset = start.astimezone(zone).utcoffset()
+    moment = start
+    while moment < end:
+        moment = min(moment + OFFSET_SAMPLE_INTERVAL, end)
+        if moment.astimezone(zone).utcoffset() != offset:
+            return None
+    return offset
+
+
+def site_dates(values, location=None):
+    """
+    ``site_date`` for a list of aware datetimes, keeping None.
+
+    When the zone keeps one offset over the span (Arizona has no DST), UTC
+    values are shifted by that offset instead of being converted one by one.
+    """
+    zone = site_zone(location)
+    present = [value for value in values if value is not None]
+    offset = fixed_offset(zone, min(present), max(present)) if present else None
+    if offset is None:
+        return [None if value is None else value.astimezone(zone).date() for value in values]
+    return [
+        None if value is None
+        else (value + offset).date() if value.tzinfo is UTC
+        else value.astimezone(zone).date()
+        for value in values
+    ]
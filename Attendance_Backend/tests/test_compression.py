@@ -0,0 +1,58 @@
+import gzip
+from unittest import skipIf
+
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, override_settings
+
+from Attendance_Backend import middleware
+from Attendance_Backend.middleware import CompressionMiddleware
+
+BODY = b'{"client":"C-1","service":"DTA1"},' * 200
+
+
+def compress(body, accept_encoding, etag=None):
+    def get_response(request):
+        response = HttpResponse(body, content_type="application/json")
+        if etag:
+            response["ETag"] = etag
+        return response
+
+    request = RequestFactory().get("/", HTTP_ACCEPT_ENCODING=accept_encoding)
+    return CompressionMiddleware(get_response)(request)
+
+
+class CompressionMiddlewareTest(SimpleTestCase):
+
+    def test_gzip(self):
+        response = compress(BODY, "gzip, deflate", etag='"abc"')
+
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertEqual(response["ETag"], 'W/"abc"')
+        self.assertIn("Accept-Encoding", response["Vary"])
+        self.assertEqual(gzip.decompress(response.content), BODY)
+        self.assertLess(len(response.content), len(BODY) / 10)
+
+    @override_settings(RESPONSE_COMPRESSION={"MIN_SIZE": 10_000})
+    def test_below_threshold_is_sent_as_is(self):
+        response = compress(BODY, "gzip")
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+        self.assertEqual(response.content, BODY)
+
+    def test_without_accept_encoding(self):
+        response = compress(BODY, "")
+
+        self.assertFalse(response.has_header("Content-Encoding"))
+
+    @skipIf(middleware.brotli is None, "brotli is not installed")
+    def test_brotli_preferred(self):
+        response = compress(BODY, "gzip, br")
+
+        self.assertEqual(response["Content-Encoding"], "br")
+        self.assertEqual(middleware.brotli.decompress(response.content), BODY)
+
+    @skipIf(middleware.brotli is not None, "brotli is installed")
+    def test_br_only_client_without_brotli(self):
+        response = compress(BODY, "br")
+
+        self.assertFalse(response.has_header("Content-Encoding"))
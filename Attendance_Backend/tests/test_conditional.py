@@ -0,0 +1,110 @@
+import time
+from datetime import date, datetime
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.http import http_date
+from rest_framework.test import APITestCase
+
+from clients.models import Client
+from employee.models import TimeRecord, UserWorkProfile
+from settings.models import Document, UserSettings
+
+User = get_user_model()
+
+
+class ConditionalGetTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        self.client.force_authenticate(user=self.user)
+
+    def add_client(self, client_id):
+        return Client.objects.create(
+            user=self.user, clientId=client_id, firstName="Ann", lastName="Lee", dob=date(1990, 5, 4),
+            location="Guadalupe", billType="DDD only", phone="555", guardian="Bob",
+        )
+
+    def assertNotModified(self, url, etag, queries=1):
+        with self.assertNumQueries(queries):
+            response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_unchanged_list_is_not_modified(self):
+        self.add_client("C-1")
+        url = reverse("client-list")
+
+        response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn("Last-Modified", response)
+        self.assertIn("private", response["Cache-Control"])
+        self.assertNotModified(url, response["ETag"])
+
+    def test_update_insert_and_delete_change_the_etag(self):
+        first = self.add_client("C-1")
+        url = reverse("client-list")
+        etags = [self.client.get(url)["ETag"]]
+
+        first.status = "inactive"
+        first.save()
+        etags.append(self.client.get(url)["ETag"])
+        second = self.add_client("C-2")
+        etags.append(self.client.get(url)["ETag"])
+        first.delete()
+        etags.append(self.client.get(url)["ETag"])
+
+        self.assertEqual(len(set(etags)), 4)
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etags[2])
+        self.assertEqual([row["clientId"] for row in response.json()], [second.clientId])
+
+    def test_detail_and_query_string_have_their_own_etag(self):
+        client = self.add_client("C-1")
+        list_etag = self.client.get(reverse("client-list"))["ETag"]
+        detail_url = reverse("client-detail", args=[client.pk])
+
+        response = self.client.get(detail_url)
+
+        self.assertNotEqual(response["ETag"], list_etag)
+        self.assertNotEqual(self.client.get(reverse("client-list"), {"format": "json"})["ETag"], list_etag)
+        self.assertNotModified(detail_url, response["ETag"])
+
+    def test_if_modified_since_does_not_hide_deletes(self):
+        self.add_client("C-1")
+        self.add_client("C-2").delete()
+        url = reverse("client-list")
+
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=http_date(time.time() + 3600))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([row["clientId"] for row in response.json()], ["C-1"])
+
+    def test_time_history_tracks_work_profile(self):
+        check_in = timezone.make_aware(datetime(2026, 3, 1, 8, 0))
+        TimeRecord.objects.create(user=self.user, date=check_in.date(), check_in=check_in)
+        url = reverse("time-history")
+        etag = self.client.get(url)["ETag"]
+        self.assertNotModified(url, etag)
+
+        UserWorkProfile.objects.filter(user=self.user).update(rate_per_hour=20)
+
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+    def test_settings_track_documents(self):
+        settings = UserSettings.objects.create(
+            user=self.user, street_address="1 Main St", city="Phoenix", state="AZ",
+            zip_code="85001", manager_name="Jane",
+        )
+        url = reverse("user-settings")
+        etag = self.client.get(url)["ETag"]
+        self.assertNotModified(url, etag, queries=0)  # fingerprint comes from the settings cache
+
+        Document.objects.create(user_settings=settings, name="CPR", effective_start="2026-01-01", effective_end="2027-01-01")
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([doc["name"] for doc in response.json()["documents"]], ["CPR"])
@@ -0,0 +1,76 @@
+from datetime import date, time
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from clients.models import AttendanceRecord, Client
+from goals.models import DailyProgress, Trial
+from settings.models import Document, UserSettings
+
+User = get_user_model()
+
+
+class SparseFieldsetTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        self.client.force_authenticate(user=self.user)
+        self.customer = Client.objects.create(
+            user=self.user, clientId="C-1", firstName="Ann", lastName="Lee", dob=date(1990, 5, 4),
+            location="Guadalupe", billType="DDD only", phone="555", guardian="Bob",
+        )
+
+    def test_fields_limit_lean_list(self):
+        AttendanceRecord.objects.create(
+            client="C-1", time_in=time(8, 30), time_out=time(15), service="DTT",
+            location="GUADALUPE_DTT", date=date(2026, 3, 2),
+        )
+
+        response = self.client.get(reverse("attendance-list"), {"fields": "client,date,unknown"})
+
+        self.assertEqual(response.json(), [{"client": "C-1", "date": "03/02/2026"}])
+
+    def test_fields_limit_detail(self):
+        response = self.client.get(reverse("client-detail", args=[self.customer.pk]), {"fields": "id,clientId"})
+
+        self.assertEqual(response.json(), {"id": self.customer.pk, "clientId": "C-1"})
+
+    def test_trials_expand_by_default_and_collapse_to_ids(self):
+        progress = DailyProgress.objects.create(client=self.customer, date=date(2026, 3, 2), location="Guadalupe")
+        trial = Trial.objects.create(daily_progress=progress, trial_number=1, percentage="50%")
+        url = reverse("dailyprogress-detail", args=[progress.pk])
+
+        self.assertEqual(self.client.get(url).json()["trials"][0]["percentage"], "50%")
+        self.assertEqual(self.client.get(url, {"expand": ""}).json()["trials"], [trial.pk])
+        self.assertEqual(
+            self.client.get(url, {"fields": "id,trials", "expand": "trials"}).json()["trials"][0]["id"],
+            trial.pk,
+        )
+
+    def test_writes_ignore_fields(self):
+        response = self.client.patch(
+            reverse("client-detail", args=[self.customer.pk]) + "?fields=id", {"status": "inactive"}, format="json",
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.customer.refresh_from_db()
+        self.assertEqual(self.customer.status, "inactive")
+
+    def test_sparse_settings_bypass_cache(self):
+        settings = UserSettings.objects.create(
+            user=self.user, street_address="1 Main St", city="Phoenix", state="AZ",
+            zip_code="85001", manager_name="Jane",
+        )
+        document = Document.objects.create(
+            user_settings=settings, name="CPR", effective_start="2026-01-01", effective_end="2027-01-01",
+        )
+        url = reverse("user-settings")
+        self.client.get(url)
+
+        response = self.client.get(url, {"fields": "city,documents", "expand": ""})
+
+        self.assertEqual(response.json(), {"city": "Phoenix", "documents": [document.pk]})
+        self.assertEqual(self.client.get(url).json()["documents"][0]["name"], "CPR")
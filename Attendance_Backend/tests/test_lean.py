@@ -0,0 +1,108 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.core.exceptions import ImproperlyConfigured
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import serializers
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APITestCase
+
+from Attendance_Backend.api.lean import LeanSerializer
+from clients.models import AttendanceRecord, Client
+from clients.serializers import (
+    AttendanceRecordLeanSerializer, AttendanceRecordSerializer, ClientLeanSerializer, ClientSerializer,
+)
+from employee.models import TimeRecord, UserWorkProfile
+from employee.serializers import TimeRecordLeanSerializer, TimeRecordSerializer
+
+User = get_user_model()
+
+
+class LeanSerializerTest(TestCase):
+    """Lean output must render to exactly the bytes the DRF serializers produce."""
+
+    def assertSameJSON(self, lean_class, serializer_class, queryset):
+        self.assertEqual(
+            JSONRenderer().render(lean_class(queryset).data),
+            JSONRenderer().render(serializer_class(queryset, many=True).data),
+        )
+
+    def test_time_records(self):
+        user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        UserWorkProfile.objects.filter(user=user).update(rate_per_hour=Decimal('18.50'))
+        other = User.objects.create_user(name="Jane Roe", email="jroe@gmail.com", password=None)
+        for day, owner in enumerate([user, user, other]):
+            check_in = timezone.make_aware(datetime(2026, 3, 1, 8, 5)) + timedelta(days=day)
+            TimeRecord.objects.create(
+                user=owner, date=check_in.date(), check_in=check_in,
+                check_out=check_in + timedelta(hours=8) if day else None,
+                hours_worked=Decimal('7.5') if day else None, total_paused_time=0.25,
+            )
+
+        queryset = TimeRecord.objects.order_by('-date', '-check_in')
+        self.assertSameJSON(TimeRecordLeanSerializer, TimeRecordSerializer, queryset)
+
+    def test_clients_and_attendance(self):
+        user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        Client.objects.create(
+            user=user, clientId="C-1", firstName="Ann", lastName="Lee", dob=date(1990, 5, 4),
+            location="Guadalupe", billType="DDD only", phone="555", guardian="Bob",
+        )
+        AttendanceRecord.objects.create(
+            client="C-1", time_in=time(8, 30), time_out=time(15, 0, 30), service="DTA1",
+            location="GUADALUPE_DTA", date=date(2026, 3, 2), one_on_one=True,
+        )
+
+        self.assertSameJSON(ClientLeanSerializer, ClientSerializer, Client.objects.all())
+        self.assertSameJSON(AttendanceRecordLeanSerializer, AttendanceRecordSerializer, AttendanceRecord.objects.all())
+
+    def test_method_field_without_source_is_rejected(self):
+        class Broken(LeanSerializer):
+            serializer_class = TimeRecordSerializer
+
+        with self.assertRaises(ImproperlyConfigured):
+            Broken(TimeRecord.objects.none()).data
+
+    def test_nested_serializer_is_rejected(self):
+        class NestedSerializer(serializers.ModelSerializer):
+            user = ClientSerializer()
+
+            class Meta:
+                model = TimeRecord
+                fields = ['id', 'user']
+
+        class Broken(LeanSerializer):
+            serializer_class = NestedSerializer
+
+        with self.assertRaises(ImproperlyConfigured):
+            Broken(TimeRecord.objects.none()).data
+
+
+class LeanListViewTest(APITestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        self.client.force_authenticate(user=self.user)
+
+    def test_time_history_matches_serializer(self):
+        check_in = timezone.make_aware(datetime(2026, 3, 1, 8, 0))
+        TimeRecord.objects.create(user=self.user, date=check_in.date(), check_in=check_in)
+
+        response = self.client.get(reverse("time-history"))
+
+        records = TimeRecord.objects.filter(user=self.user)
+        self.assertEqual(response.content, JSONRenderer().render(TimeRecordSerializer(records, many=True).data))
+
+    def test_attendance_list_is_filtered(self):
+        for day, client in enumerate(["C-1", "C-2"], start=1):
+            AttendanceRecord.objects.create(
+                client=client, time_in=time(8), time_out=time(15), service="DTT",
+                location="GUADALUPE_DTT", date=date(2026, 3, day),
+            )
+
+        response = self.client.get(reverse("attendance-list"), {"client": "C-2"})
+
+        self.assertEqual([row["client"] for row in response.json()], ["C-2"])
@@ -0,0 +1,43 @@
+from django.contrib.auth import get_user_model
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from Attendance_Backend.metrics import registry
+
+User = get_user_model()
+
+
+class RequestMetricsTest(APITestCase):
+
+    def setUp(self):
+        registry.clear()
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        self.admin = User.objects.create_superuser(name="Admin", email="admin@example.com", password=None)
+
+    def test_server_timing_header(self):
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(reverse("time-history"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertRegex(response["Server-Timing"], r'^db;dur=[\d.]+;desc="\d+ queries", render;dur=[\d.]+, total;dur=[\d.]+$')
+
+    def test_metrics_endpoint_reports_per_view_histograms(self):
+        self.client.force_authenticate(user=self.user)
+        self.client.get(reverse("time-history"))
+        self.client.force_authenticate(user=self.admin)
+
+        response = self.client.get(reverse("metrics"))
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain; version=0.0.4"))
+        body = response.content.decode()
+        self.assertIn('http_requests_total{method="GET",status="200",view="time-history"} 1', body)
+        self.assertIn('http_request_db_queries_count{method="GET",view="time-history"} 1', body)
+        self.assertIn('http_request_duration_seconds_bucket{method="GET",view="time-history",le="+Inf"} 1', body)
+
+    def test_metrics_endpoint_is_admin_only(self):
+        self.client.force_authenticate(user=self.user)
+
+        self.assertEqual(self.client.get(reverse("metrics")).status_code, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,40 @@
+import asyncio
+import threading
+
+from django.test import SimpleTestCase
+
+from Attendance_Backend.pubsub import InProcessBroker
+
+
+class InProcessBrokerTest(SimpleTestCase):
+
+    async def test_publish_reaches_subscribers_of_the_channel(self):
+        broker = InProcessBroker()
+        async with broker.subscribe('a') as first, broker.subscribe('a') as second, broker.subscribe('b') as other:
+            self.assertEqual(broker.publish('a', {'n': 1}), 2)
+            self.assertEqual(await first.get(), {'n': 1})
+            self.assertEqual(await second.get(), {'n': 1})
+            self.assertTrue(other.empty())
+
+    async def test_publish_from_another_thread(self):
+        broker = InProcessBroker()
+        async with broker.subscribe('a') as queue:
+            thread = threading.Thread(target=broker.publish, args=('a', 'hello'))
+            thread.start()
+            self.assertEqual(await asyncio.wait_for(queue.get(), 1), 'hello')
+            thread.join()
+
+    async def test_slow_subscriber_keeps_newest_messages(self):
+        broker = InProcessBroker(queue_size=2)
+        async with broker.subscribe('a') as queue:
+            for n in range(3):
+                broker.publish('a', n)
+            await asyncio.sleep(0)
+            self.assertEqual([queue.get_nowait(), queue.get_nowait()], [1, 2])
+
+    async def test_unsubscribe_on_exit(self):
+        broker = InProcessBroker()
+        async with broker.subscribe('a'):
+            self.assertEqual(broker.subscriber_count('a'), 1)
+        self.assertEqual(broker.subscriber_count('a'), 0)
+        self.assertEqual(broker.publish('a', 'nobody'), 0)
@@ -0,0 +1,73 @@
+from datetime import date, datetime, timedelta
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from Attendance_Backend.querylog import NPlusOneDetected, assert_no_n_plus_one, normalize_sql
+from clients.models import Client
+from employee.models import TimeRecord
+from employee.serializers import TimeRecordSerializer
+from goals.models import DailyProgress, Trial
+
+User = get_user_model()
+
+
+def add_time_records(user, days):
+    for day in range(days):
+        check_in = timezone.make_aware(datetime(2026, 3, 1, 8, 0)) + timedelta(days=day)
+        TimeRecord.objects.create(user=user, date=check_in.date(), check_in=check_in)
+
+
+class NormalizeSqlTest(TestCase):
+
+    def test_literals_and_in_lists_collapse(self):
+        self.assertEqual(
+            normalize_sql('SELECT * FROM t WHERE id IN (%s, %s, %s) AND name = \'x\' AND n > 10'),
+            normalize_sql('SELECT *  FROM t WHERE id IN (%s) AND name = \'yy\' AND n > 3'),
+        )
+
+
+class NPlusOneDetectionTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        add_time_records(self.user, days=6)
+
+    def test_flags_repeated_queries_with_serializer_field(self):
+        records = TimeRecord.objects.filter(user=self.user)
+
+        with self.assertRaises(NPlusOneDetected) as caught:
+            with assert_no_n_plus_one():
+                TimeRecordSerializer(records, many=True).data
+
+        self.assertIn("TimeRecordSerializer.rate_per_hour", str(caught.exception))
+
+
+class ViewQueryPatternTest(APITestCase):
+    """Build-breaking guard against N+1 regressions in list endpoints."""
+
+    def setUp(self):
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        self.client.force_authenticate(user=self.user)
+
+    def test_time_history(self):
+        add_time_records(self.user, days=6)
+
+        with assert_no_n_plus_one():
+            self.client.get(reverse("time-history"))
+
+    def test_daily_progress_list(self):
+        client = Client.objects.create(
+            user=self.user, clientId="C1", firstName="Ann", lastName="Lee", dob=date(1990, 1, 1),
+            location="Guadalupe", billType="DDD only", phone="555", guardian="Mom",
+        )
+        for day in range(1, 7):
+            progress = DailyProgress.objects.create(client=client, date=date(2026, 3, day), location="Guadalupe")
+            Trial.objects.create(daily_progress=progress, trial_number=1, percentage="50%")
+
+        with assert_no_n_plus_one():
+            response = self.client.get("/api/progress/")
+
+        self.assertEqual(len(response.data), 6)
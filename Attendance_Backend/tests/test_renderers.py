@@ -0,0 +1,74 @@
+import io
+from datetime import date, datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest import skipIf
+from uuid import UUID
+
+from django.test import SimpleTestCase
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from Attendance_Backend.api import renderers
+from Attendance_Backend.api.renderers import FastJSONParser, FastJSONRenderer
+
+
+class FastJSONRendererTest(SimpleTestCase):
+
+    def test_matches_drf_renderer(self):
+        data = [{
+            'hours_worked': Decimal('7.50'),
+            'rate_per_hour': Decimal('18.25'),
+            'date': date(2026, 3, 2),
+            'check_in': datetime(2026, 3, 2, 15, 5, 0, 123456, tzinfo=dt_timezone.utc),
+            'time_in': time(8, 30),
+            'duration': timedelta(minutes=90),
+            'id': UUID('12345678-1234-5678-1234-567812345678'),
+            'label': gettext_lazy('Active'),
+            'name': 'Zoë\u2028line\u2029',
+            'paused': 0.25,
+            'null': None,
+            1: 'int key',
+        }]
+
+        self.assertEqual(FastJSONRenderer().render(data), JSONRenderer().render(data))
+
+    def test_indent_falls_back_to_stdlib(self):
+        data = {'a': [1, 2]}
+        media_type = 'application/json; indent=2'
+
+        self.assertEqual(
+            FastJSONRenderer().render(data, media_type),
+            JSONRenderer().render(data, media_type),
+        )
+
+    def test_oversized_integer_falls_back_to_stdlib(self):
+        self.assertEqual(FastJSONRenderer().render({'n': 2 ** 70}), b'{"n":1180591620717411303424}')
+
+    def test_none_renders_empty(self):
+        self.assertEqual(FastJSONRenderer().render(None), b'')
+
+
+class FastJSONParserTest(SimpleTestCase):
+
+    def test_matches_drf_parser(self):
+        body = '{"reason": "Lunch é", "items": [1, 2.5, null, true]}'.encode()
+
+        self.assertEqual(
+            FastJSONParser().parse(io.BytesIO(body)),
+            JSONParser().parse(io.BytesIO(body)),
+        )
+
+    def test_invalid_json_raises_parse_error(self):
+        for body in (b'{"a": ', b'{"a": NaN}', b''):
+            with self.subTest(body=body), self.assertRaises(ParseError):
+                FastJSONParser().parse(io.BytesIO(body))
+
+    @skipIf(renderers.orjson is None, "orjson is not installed")
+    def test_non_utf8_body_uses_stdlib(self):
+        body = '{"name": "Zoë"}'.encode('latin-1')
+
+        data = FastJSONParser().parse(io.BytesIO(body), parser_context={'encoding': 'latin-1'})
+
+        self.assertEqual(data, {'name': 'Zoë'})
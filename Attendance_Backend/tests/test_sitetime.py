@@ -0,0 +1,42 @@
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from zoneinfo import ZoneInfo
+
+from django.test import SimpleTestCase, override_settings
+
+from Attendance_Backend.sitetime import fixed_offset, site_date, site_dates, site_zone, to_site_time
+
+UTC = dt_timezone.utc
+
+
+class SiteTimeTest(SimpleTestCase):
+
+    def test_site_zone_is_cached_and_follows_settings(self):
+        self.assertIs(site_zone(), site_zone())
+        self.assertEqual(site_zone().key, 'America/Phoenix')
+        with override_settings(TIME_ZONE='America/New_York'):
+            self.assertEqual(site_zone().key, 'America/New_York')
+        self.assertEqual(site_zone().key, 'America/Phoenix')
+
+    def test_site_date_crosses_utc_midnight(self):
+        # 03:00 UTC is 20:00 the previous evening in Arizona
+        self.assertEqual(site_date(datetime(2026, 3, 4, 3, 0, tzinfo=UTC)), date(2026, 3, 3))
+
+    def test_naive_values_are_utc(self):
+        self.assertEqual(to_site_time(datetime(2026, 3, 4, 3, 0)), datetime(2026, 3, 4, 3, 0, tzinfo=UTC))
+        self.assertIsNone(to_site_time(None))
+
+    def test_fixed_offset(self):
+        start, end = datetime(2026, 1, 1, tzinfo=UTC), datetime(2026, 12, 31, tzinfo=UTC)
+        self.assertEqual(fixed_offset(ZoneInfo('America/Phoenix'), start, end), timedelta(hours=-7))
+        self.assertIsNone(fixed_offset(ZoneInfo('America/New_York'), start, end))
+
+    def test_site_dates_matches_per_value_conversion(self):
+        values = [datetime(2026, 1, 1, tzinfo=UTC) + timedelta(hours=5 * n) for n in range(2000)]
+        values[7] = None
+        values[8] = values[9].astimezone(ZoneInfo('Asia/Tokyo'))
+        expected = [None if value is None else site_date(value) for value in values]
+
+        self.assertEqual(site_dates(values), expected)
+        with override_settings(TIME_ZONE='America/New_York'):
+            self.assertEqual(site_dates(values), [None if value is None else site_date(value) for value in values])
+        self.assertEqual(site_dates([None]), [None])
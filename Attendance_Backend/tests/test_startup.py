@@ -0,0 +1,72 @@
+import json
+import os
+import subprocess
+import sys
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+# What a fresh worker loads before its first request
+PROBE = """
+import json, sys
+import django
+django.setup()
+from django.urls import get_resolver, resolve, Resolver404
+get_resolver().url_patterns
+try:
+    resolve('/admin/')
+    admin = True
+except Resolver404:
+    admin = False
+print(json.dumps({'admin': admin, 'modules': sorted({name.split('.')[0] for name in sys.modules})}))
+"""
+
+
+# An unauthenticated API request through the API-only profile
+API_PROFILE_PROBE = """
+import json
+import django
+django.setup()
+from django.conf import settings
+from django.test import Client
+response = Client(HTTP_HOST='localhost').get('/api/locations/')
+print(json.dumps({
+    'status': response.status_code,
+    'authenticate': response.get('WWW-Authenticate'),
+    'middleware': settings.MIDDLEWARE,
+}))
+"""
+
+
+def start_process(role, probe=PROBE, settings_module='Attendance_Backend.settings'):
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': settings_module, 'SERVICE_ROLE': role}
+    result = subprocess.run(
+        [sys.executable, '-c', probe], cwd=settings.BASE_DIR, env=env, capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+class StartupProfileTest(SimpleTestCase):
+
+    def test_api_workers_skip_admin_dependencies(self):
+        process = start_process('api')
+
+        self.assertFalse(process['admin'])
+        for package in ('jazzmin', 'import_export', 'openpyxl'):
+            self.assertNotIn(package, process['modules'])
+
+    def test_default_profile_serves_admin(self):
+        process = start_process('all')
+
+        self.assertTrue(process['admin'])
+        self.assertIn('import_export', process['modules'])
+
+    def test_api_settings_profile(self):
+        process = start_process('api', PROBE, 'Attendance_Backend.settings_api')
+        request = start_process('api', API_PROFILE_PROBE, 'Attendance_Backend.settings_api')
+
+        self.assertFalse(process['admin'])
+        self.assertNotIn('openpyxl', process['modules'])
+        self.assertEqual((request['status'], request['authenticate']), (401, 'Bearer realm="api"'))
+        for middleware in ('SessionMiddleware', 'CsrfViewMiddleware', 'MessageMiddleware'):
+            self.assertFalse([name for name in request['middleware'] if name.endswith(middleware)])
@@ -0,0 +1,119 @@
+from unittest import mock
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APIRequestFactory, APITestCase
+
+from Attendance_Backend.api.throttling import TokenBucketThrottle, UserTokenBucketThrottle, parse_rate
+
+User = get_user_model()
+
+
+def throttle_rates(**rates):
+    return override_settings(REST_FRAMEWORK={**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': rates})
+
+
+class ScopedView:
+    throttle_scope = 'test'
+
+
+class TokenBucketThrottleTest(SimpleTestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.now = 1_000_000.0
+        patcher = mock.patch.object(TokenBucketThrottle, 'timer', side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def allow(self):
+        request = APIRequestFactory().get('/')
+        request.user = None
+        throttle = UserTokenBucketThrottle()
+        return throttle.allow_request(request, ScopedView()), throttle.wait()
+
+    def test_parse_rate(self):
+        self.assertEqual(parse_rate('30/min'), (30, 60))
+        self.assertEqual(parse_rate('5/hour'), (5, 3600))
+
+    @throttle_rates(test='3/min')
+    def test_burst_then_refill(self):
+        self.assertEqual([self.allow()[0] for _ in range(3)], [True, True, True])
+
+        allowed, wait = self.allow()
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(wait, 20)
+
+        self.now += 20
+        self.assertTrue(self.allow()[0])
+        self.assertFalse(self.allow()[0])
+
+    @throttle_rates(test='3/min')
+    def test_idle_bucket_does_not_exceed_capacity(self):
+        self.allow()
+        self.now += 3600
+
+        self.assertEqual([self.allow()[0] for _ in range(4)], [True, True, True, False])
+
+    @throttle_rates()
+    def test_scope_without_rate_is_not_throttled(self):
+        self.assertTrue(all(self.allow()[0] for _ in range(100)))
+
+
+class EndpointThrottleTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    @throttle_rates(login='2/min')
+    def test_login_is_shed_before_the_database(self):
+        payload = {'email': 'nobody@example.com', 'password': 'wrong'}
+        for _ in range(2):
+            self.client.post(reverse('login'), payload, format='json')
+
+        with self.assertNumQueries(0):
+            response = self.client.post(reverse('login'), payload, format='json')
+
+        self.assertEqual(response.status_code, 429)
+        self.assertIn('Retry-After', response)
+
+    @throttle_rates(login='2/min', login_ip='5/min')
+    def test_login_is_limited_per_email_then_per_ip(self):
+        url = reverse('login')
+        attempt = lambda email, **extra: self.client.post(
+            url, {'email': email, 'password': 'wrong'}, format='json', **extra,
+        ).status_code
+
+        self.assertEqual([attempt('ann@example.com') for _ in range(3)], [401, 401, 429])
+        # Someone else behind the same address still has their own bucket
+        self.assertEqual(attempt('BOB@example.com'), 401)
+        # ...until the address as a whole is out of tokens; a forged
+        # X-Forwarded-For does not move the request to a fresh bucket
+        self.assertEqual(attempt('cy@example.com'), 401)
+        self.assertEqual(attempt('dee@example.com', HTTP_X_FORWARDED_FOR='203.0.113.9'), 429)
+
+    @throttle_rates(clock='2/min', clock_ip='3/min')
+    def test_clock_user_and_ip_scopes(self):
+        first = User.objects.create_user(name='John Doe', email='jdoe@gmail.com', password=None)
+        second = User.objects.create_user(name='Jane Roe', email='jroe@gmail.com', password=None)
+        url = reverse('resume')
+
+        self.client.force_authenticate(first)
+        self.assertEqual([self.client.post(url).status_code for _ in range(2)], [400, 400])
+
+        # Same IP: the shared bucket has one token left, so the second user is
+        # refused by the IP scope while their own bucket still has a token
+        self.client.force_authenticate(second)
+        self.assertEqual([self.client.post(url).status_code for _ in range(2)], [400, 429])
+
+    @throttle_rates(clock='1/min', clock_ip='1/min')
+    def test_clock_status_poll_is_not_throttled(self):
+        user = User.objects.create_user(name='John Doe', email='jdoe@gmail.com', password=None)
+        self.client.force_authenticate(user)
+        url = reverse('resume')
+
+        self.assertEqual([self.client.get(url).status_code for _ in range(3)], [200, 200, 200])
+        self.assertEqual(self.client.post(url).status_code, 400)
@@ -14,15 +14,11 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
-from django.urls import path, include
+from django.urls import path
 
-urlpatterns = [
-    path('admin/', admin.site.urls),
-    path("api/", include("Attendance_Backend.api.urls")),
-    path("api/attendance/", include("employee.urls")),
-    path("api/user/", include("settings.urls")),
-    path('', include('clients.urls')),
-    path('api/', include('goals.urls')),
-    ]
+from .urls_api import urlpatterns
 
+if settings.SERVE_ADMIN:
+    urlpatterns = [path('admin/', admin.site.urls), *urlpatterns]
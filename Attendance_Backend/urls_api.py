@@ -0,0 +1,15 @@
+"""
+URLconf of the API-only profile (Attendance_Backend.settings_api): every API
+route, no admin site.
+"""
+from django.urls import path, include
+
+urlpatterns = [
+    path("api/", include("Attendance_Backend.api.urls")),
+    path("api/attendance/", include("employee.urls")),
+    path("api/user/", include("settings.urls")),
+    path('', include('clients.urls')),
+    path('api/', include('goals.urls')),
+    path('api/', include('locations.urls')),
+    path('api/', include('reports.urls')),
+]
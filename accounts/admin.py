@@ -1,7 +1,27 @@
-from django.contrib import admin
+from pathlib import Path
+
+from django import forms
+from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from django.contrib.auth.models import Group
+from django.shortcuts import redirect
+from django.template.response import TemplateResponse
+from django.urls import path
 from accounts.models import User, UserProfile
+from accounts.onboarding import bulk_onboard, load_rows
+
+
+class EmployeeImportForm(forms.Form):
+    file = forms.FileField(help_text="CSV or XLSX with at least email and name columns.")
+
+    def clean_file(self):
+        upload = self.cleaned_data['file']
+        file_format = Path(upload.name).suffix.lstrip('.').lower()
+        try:
+            self.rows = load_rows(upload.read(), file_format)
+        except ValueError as exc:
+            raise forms.ValidationError(str(exc))
+        return upload
 
 
 @admin.register(User)
@@ -39,6 +59,38 @@ class UserAdmin(BaseUserAdmin):
     search_fields = ('email', 'name')
     ordering = ('email',)
     filter_horizontal = ('groups', 'user_permissions')
+    change_list_template = 'admin/accounts/user/change_list.html'
+
+    def get_urls(self):
+        urls = [
+            path(
+                'import-employees/',
+                self.admin_site.admin_view(self.import_employees_view),
+                name='accounts_user_import_employees',
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def import_employees_view(self, request):
+        """Bulk onboarding upload: users, work profiles and settings in one pass."""
+        if not self.has_add_permission(request):
+            return redirect('admin:accounts_user_changelist')
+
+        form = EmployeeImportForm(request.POST or None, request.FILES or None)
+        if request.method == 'POST' and form.is_valid():
+            report = bulk_onboard(form.rows)
+            for line, email, message in report.errors:
+                self.message_user(request, f"Line {line} ({email}): {message}", level=messages.ERROR)
+            self.message_user(request, f"Employee import finished: {report}.", level=messages.SUCCESS)
+            return redirect('admin:accounts_user_changelist')
+
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'title': 'Import employees',
+            'form': form,
+        }
+        return TemplateResponse(request, 'admin/accounts/user/import_employees.html', context)
 
 
 
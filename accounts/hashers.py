@@ -0,0 +1,43 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher, ScryptPasswordHasher
+from django.core.exceptions import ImproperlyConfigured
+
+# Cost parameters per PASSWORD_HASH_PROFILE.
+# "default" matches Django's own defaults, "balanced" uses the OWASP minimum
+# for PBKDF2-SHA256 and "fast" is only meant for local development and tests.
+HASH_PROFILES = {
+    'default': {'pbkdf2_iterations': 1_000_000, 'scrypt_work_factor': 2 ** 14},
+    'balanced': {'pbkdf2_iterations': 600_000, 'scrypt_work_factor': 2 ** 14},
+    'fast': {'pbkdf2_iterations': 10_000, 'scrypt_work_factor': 2 ** 10},
+}
+
+
+def get_hash_profile():
+    name = getattr(settings, 'PASSWORD_HASH_PROFILE', 'default')
+    try:
+        return HASH_PROFILES[name]
+    except KeyError:
+        raise ImproperlyConfigured(
+            f"Unknown PASSWORD_HASH_PROFILE {name!r}; choose one of {', '.join(HASH_PROFILES)}."
+        )
+
+
+class ProfilePBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+    PBKDF2-SHA256 with the iteration count taken from the active hash profile.
+
+    Hashes made with a different count report must_update(), so Django rewrites
+    them on the user's next successful login.
+    """
+
+    @property
+    def iterations(self):
+        return get_hash_profile()['pbkdf2_iterations']
+
+
+class ProfileScryptPasswordHasher(ScryptPasswordHasher):
+    """Scrypt with the work factor taken from the active hash profile."""
+
+    @property
+    def work_factor(self):
+        return get_hash_profile()['scrypt_work_factor']
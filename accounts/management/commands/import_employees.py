@@ -0,0 +1,33 @@
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.onboarding import DEFAULT_CHUNK_SIZE, bulk_onboard, load_rows
+
+
+class Command(BaseCommand):
+    help = "Bulk-create employees, their work profiles and settings from a CSV or XLSX file."
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="CSV or XLSX file with an email and name column.")
+        parser.add_argument('--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE)
+        parser.add_argument(
+            '--workers', type=int, default=None,
+            help="Processes used to hash passwords (default: one per CPU).",
+        )
+
+    def handle(self, *args, **options):
+        path = Path(options['path'])
+        file_format = path.suffix.lstrip('.').lower()
+        try:
+            rows = load_rows(path.read_bytes(), file_format)
+        except (OSError, ValueError) as exc:
+            raise CommandError(str(exc))
+
+        report = bulk_onboard(rows, chunk_size=options['chunk_size'], workers=options['workers'])
+
+        for line, email, message in report.errors:
+            self.stderr.write(f"Line {line} ({email or 'no email'}): {message}")
+        for email in report.skipped:
+            self.stdout.write(f"Skipped existing employee {email}")
+        self.stdout.write(self.style.SUCCESS(f"Onboarding finished: {report}"))
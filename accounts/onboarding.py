@@ -0,0 +1,185 @@
+"""
+Bulk employee onboarding.
+
+Creates users together with their work profile and settings rows using
+bulk_create in chunks. bulk_create skips the post_save signal that normally
+creates the work profile, so those rows are inserted here in the same chunk.
+It also skips model validation, so each row's profile and settings are
+full_clean()ed first and a row that fails is reported rather than inserted.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from decimal import Decimal, InvalidOperation
+
+import django
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+
+from employee.models import UserWorkProfile
+from locations.models import Location
+from settings.models import UserSettings
+
+User = get_user_model()
+
+WORK_PROFILE_FIELDS = ('rate_per_hour', 'biweekly_total_hours')
+SETTINGS_FIELDS = (
+    'street_address', 'address2', 'city', 'state', 'zip_code', 'manager_name',
+    'provider_id', 'payroll_id', 'location', 'gender', 'race', 'marital_status',
+    'services_provided',
+)
+
+DEFAULT_CHUNK_SIZE = 200
+
+# Below this many passwords the process pool costs more than it saves.
+PARALLEL_HASH_THRESHOLD = 20
+
+
+class OnboardingReport:
+    def __init__(self):
+        self.created = []
+        self.skipped = []
+        self.errors = []
+
+    def __str__(self):
+        return (
+            f"{len(self.created)} created, {len(self.skipped)} skipped, "
+            f"{len(self.errors)} errors"
+        )
+
+
+def load_rows(data, file_format):
+    """Parse CSV or XLSX content into a list of dicts keyed by lower-cased header."""
+    import tablib
+
+    if file_format not in ('csv', 'xlsx'):
+        raise ValueError(f"Unsupported file format {file_format!r}; use csv or xlsx.")
+    if file_format == 'csv' and isinstance(data, bytes):
+        data = data.decode('utf-8-sig')
+
+    try:
+        dataset = tablib.Dataset().load(data, format=file_format)
+    except Exception as exc:
+        raise ValueError(f"Could not read the {file_format} file: {exc}")
+    headers = [(header or '').strip().lower() for header in dataset.headers or []]
+    rows = []
+    for values in dataset:
+        row = {}
+        for header, value in zip(headers, values):
+            if header:
+                row[header] = '' if value is None else str(value).strip()
+        rows.append(row)
+    return rows
+
+
+def hash_passwords(passwords, workers=None):
+    """Hash passwords, spreading the work over a process pool for large batches."""
+    if workers == 1 or len(passwords) < PARALLEL_HASH_THRESHOLD:
+        return [make_password(password) for password in passwords]
+
+    chunksize = max(len(passwords) // ((workers or 4) * 4), 1)
+    with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as pool:
+        return list(pool.map(make_password, passwords, chunksize=chunksize))
+
+
+def _decimal(row, field):
+    value = row.get(field)
+    if not value:
+        return None
+    try:
+        return Decimal(value)
+    except InvalidOperation:
+        raise ValidationError(f"{field} must be a number, got {value!r}.")
+
+
+def _messages(exc):
+    if hasattr(exc, 'error_dict'):
+        return ' '.join(
+            f"{field}: {message}" for field, messages in exc.message_dict.items() for message in messages
+        )
+    return ' '.join(exc.messages)
+
+
+def _clean_rows(rows, report):
+    existing = set(
+        User.objects.filter(
+            email__in=[User.objects.normalize_email(row.get('email', '')) for row in rows]
+        ).values_list('email', flat=True)
+    )
+    # Same rule as UserSettings.location (validate_location_code), checked in one query
+    locations = set(Location.objects.filter(is_active=True).values_list('code', flat=True))
+    seen = set()
+    cleaned = []
+    for line, row in enumerate(rows, start=2):  # line 1 is the header
+        email = User.objects.normalize_email(row.get('email', ''))
+        try:
+            validate_email(email)
+            if not row.get('name'):
+                raise ValidationError("name is required.")
+            if row.get('location') and row['location'] not in locations:
+                raise ValidationError(f"Unknown location {row['location']!r}.")
+            work_profile = {field: _decimal(row, field) for field in WORK_PROFILE_FIELDS}
+            UserWorkProfile(**work_profile).full_clean(exclude=['user'])
+            user_settings = {field: row[field] for field in SETTINGS_FIELDS if row.get(field)}
+            if user_settings:
+                # location was checked against ``locations`` above
+                UserSettings(**user_settings).full_clean(exclude=['user', 'location'])
+        except ValidationError as exc:
+            report.errors.append((line, email, _messages(exc)))
+            continue
+
+        if email in existing or email in seen:
+            report.skipped.append(email)
+            continue
+        seen.add(email)
+
+        cleaned.append({
+            'email': email,
+            'name': row['name'],
+            'phone': row.get('phone') or None,
+            'password': row.get('password') or None,
+            'work_profile': work_profile,
+            'settings': user_settings,
+        })
+    return cleaned
+
+
+def _create_chunk(chunk, hashes):
+    with transaction.atomic():
+        User.objects.bulk_create([
+            User(email=row['email'], name=row['name'], phone=row['phone'], password=password)
+            for row, password in zip(chunk, hashes)
+        ])
+        user_ids = dict(
+            User.objects.filter(email__in=[row['email'] for row in chunk]).values_list('email', 'pk')
+        )
+        UserWorkProfile.objects.bulk_create([
+            UserWorkProfile(user_id=user_ids[row['email']], **row['work_profile'])
+            for row in chunk
+        ])
+        user_settings = [
+            UserSettings(user_id=user_ids[row['email']], **row['settings'])
+            for row in chunk if row['settings']
+        ]
+        for row_settings in user_settings:
+            row_settings.site_id = row_settings.location  # bulk_create skips save()
+        UserSettings.objects.bulk_create(user_settings)
+
+
+def bulk_onboard(rows, chunk_size=DEFAULT_CHUNK_SIZE, workers=None):
+    """
+    Create users, work profiles and settings for ``rows``.
+
+    Rows whose email already exists are skipped; invalid rows are reported with
+    their file line number. Rows without a password get an unusable one.
+    """
+    report = OnboardingReport()
+    cleaned = _clean_rows(rows, report)
+    hashes = hash_passwords([row['password'] for row in cleaned], workers=workers)
+
+    for start in range(0, len(cleaned), chunk_size):
+        chunk = cleaned[start:start + chunk_size]
+        _create_chunk(chunk, hashes[start:start + chunk_size])
+        report.created.extend(row['email'] for row in chunk)
+    return report
@@ -1,4 +1,5 @@
 from rest_framework.test import APITestCase
+from django.core.cache import cache
 from django.urls import reverse
 from rest_framework import status
 from django.contrib.auth import get_user_model
@@ -10,6 +11,7 @@ User = get_user_model()
 class AuthenticationTest(APITestCase):
 
     def setUp(self):
+        cache.clear()  # login/register throttle buckets
         data = self.get_data()
         self.user = User.objects.create_user(**data)
         self.url = reverse("login")
@@ -66,6 +68,7 @@ class AuthenticationTest(APITestCase):
 class RegistrationTest(APITestCase):
 
     def setUp(self):
+        cache.clear()  # login/register throttle buckets
         self.url = reverse("register")
 
     def test_registration_with_valid_data(self):
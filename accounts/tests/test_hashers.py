@@ -0,0 +1,52 @@
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.test import override_settings
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from accounts.hashers import HASH_PROFILES
+
+User = get_user_model()
+
+
+@override_settings(PASSWORD_HASH_PROFILE='fast')
+class PasswordRehashTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()  # login/register throttle buckets
+        self.user = User.objects.create_user(**self.get_data())
+        self.url = reverse("login")
+
+    def login(self):
+        data = self.get_data()
+        payload = {"email": data["email"], "password": data["password"]}
+        return self.client.post(self.url, payload, format="json")
+
+    def test_new_password_uses_profile_iterations(self):
+        algorithm, iterations, _ = self.user.password.split("$", 2)
+        self.assertEqual(algorithm, "pbkdf2_sha256")
+        self.assertEqual(int(iterations), HASH_PROFILES["fast"]["pbkdf2_iterations"])
+
+    def test_login_rehashes_when_profile_changes(self):
+        with self.settings(PASSWORD_HASH_PROFILE="balanced"):
+            response = self.login()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        iterations = int(self.user.password.split("$")[1])
+        self.assertEqual(iterations, HASH_PROFILES["balanced"]["pbkdf2_iterations"])
+
+    def test_login_rehashes_when_algorithm_changes(self):
+        hashers = list(settings.PASSWORD_HASHERS)
+        hashers[0], hashers[1] = hashers[1], hashers[0]
+        with self.settings(PASSWORD_HASHERS=hashers):
+            response = self.login()
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.user.refresh_from_db()
+        self.assertTrue(self.user.password.startswith("scrypt$"))
+
+    def get_data(self):
+        return {"name": "John Doe", "email": "jdoe@gmail.com", "password": "pa$$w0rd!"}
@@ -0,0 +1,97 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from accounts.onboarding import bulk_onboard, load_rows
+from employee.models import UserWorkProfile
+from locations.models import Location
+from settings.models import UserSettings
+
+User = get_user_model()
+
+CSV = (
+    "Email,Name,Password,Rate_per_hour,Street_address,City,State,Zip_code,Manager_name\n"
+    "ann@example.com,Ann,s3cret!pw,18.50,1 Main St,Tempe,AZ,85281,Maria\n"
+    "bob@example.com,Bob,,,,,,,\n"
+    "not-an-email,Broken,,,,,,,\n"
+)
+
+ADDRESS = {
+    'street_address': '1 Main St', 'city': 'Tempe', 'state': 'AZ', 'zip_code': '85281', 'manager_name': 'Maria',
+}
+
+
+@override_settings(PASSWORD_HASH_PROFILE='fast')
+class BulkOnboardingTest(TestCase):
+
+    def test_creates_users_profiles_and_settings(self):
+        report = bulk_onboard(load_rows(CSV, 'csv'), chunk_size=1, workers=1)
+
+        self.assertEqual(sorted(report.created), ["ann@example.com", "bob@example.com"])
+        self.assertEqual(len(report.errors), 1)
+
+        ann = User.objects.get(email="ann@example.com")
+        self.assertTrue(ann.check_password("s3cret!pw"))
+        self.assertEqual(str(ann.work_profile.rate_per_hour), "18.50")
+        self.assertEqual(ann.settings.city, "Tempe")
+
+        bob = User.objects.get(email="bob@example.com")
+        self.assertFalse(bob.has_usable_password())
+        self.assertTrue(UserWorkProfile.objects.filter(user=bob).exists())
+        self.assertFalse(UserSettings.objects.filter(user=bob).exists())
+
+    def test_existing_emails_are_skipped(self):
+        User.objects.create_user(email="ann@example.com", name="Ann", password="x")
+
+        report = bulk_onboard(load_rows(CSV, 'csv'), workers=1)
+
+        self.assertEqual(report.skipped, ["ann@example.com"])
+        self.assertEqual(User.objects.filter(email="ann@example.com").count(), 1)
+
+    def test_import_employees_command(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "employees.csv"
+            path.write_text(CSV)
+            out = StringIO()
+            call_command("import_employees", str(path), "--workers", "1", stdout=out, stderr=StringIO())
+
+        self.assertIn("2 created", out.getvalue())
+        self.assertEqual(User.objects.count(), 2)
+
+    def test_settings_are_linked_to_their_site(self):
+        rows = [
+            {'email': 'ann@example.com', 'name': 'Ann', **ADDRESS, 'location': 'hcbs'},
+            {'email': 'cy@example.com', 'name': 'Cy', **ADDRESS, 'location': 'nowhere'},
+        ]
+
+        report = bulk_onboard(rows, workers=1)
+
+        self.assertEqual(report.errors, [(3, 'cy@example.com', "Unknown location 'nowhere'.")])
+        self.assertEqual(User.objects.get(email='ann@example.com').settings.site_id, 'hcbs')
+
+    def test_settings_are_validated_before_the_bulk_insert(self):
+        rows = [
+            {'email': 'ann@example.com', 'name': 'Ann', **ADDRESS, 'gender': 'unknown', 'race': 'martian'},
+            {'email': 'bob@example.com', 'name': 'Bob', 'city': 'Mesa'},
+            {'email': 'cy@example.com', 'name': 'Cy', **ADDRESS, 'marital_status': 'married'},
+        ]
+
+        report = bulk_onboard(rows, workers=1)
+
+        self.assertEqual(report.created, ['cy@example.com'])
+        self.assertEqual([(line, email) for line, email, _ in report.errors], [(2, 'ann@example.com'), (3, 'bob@example.com')])
+        self.assertIn("gender: Value 'unknown' is not a valid choice.", report.errors[0][2])
+        self.assertIn("race: Value 'martian' is not a valid choice.", report.errors[0][2])
+        self.assertIn("street_address: This field cannot be blank.", report.errors[1][2])
+        self.assertFalse(User.objects.filter(email__in=['ann@example.com', 'bob@example.com']).exists())
+
+    def test_inactive_location_is_rejected(self):
+        Location.objects.filter(code='hcbs').update(is_active=False)
+
+        report = bulk_onboard([{'email': 'ann@example.com', 'name': 'Ann', 'location': 'hcbs'}], workers=1)
+
+        self.assertEqual(report.errors, [(2, 'ann@example.com', "Unknown location 'hcbs'.")])
@@ -9,17 +9,22 @@ from rest_framework.views import APIView
 from django.contrib.auth.password_validation import validate_password
 from django.contrib.auth import update_session_auth_hash
 from django.contrib.auth import get_user_model
+from Attendance_Backend.api.throttling import CredentialTokenBucketThrottle, IPTokenBucketThrottle, UserTokenBucketThrottle
 
 User = get_user_model()
 
 
 class LoginView(TokenObtainPairView):
     serializer_class = LoginSerializer
+    throttle_classes = [CredentialTokenBucketThrottle, IPTokenBucketThrottle]
+    throttle_scope = 'login'
 
 
 class RegisterView(generics.CreateAPIView):
     permission_classes = (permissions.AllowAny,)
     serializer_class = RegisterSerializer
+    throttle_classes = [UserTokenBucketThrottle]
+    throttle_scope = 'register'
 
     def create(self, request, *args, **kwargs):
 
@@ -87,7 +92,8 @@ class ChangePasswordView(APIView):
             validate_password(new_password, user)
             user.set_password(new_password)
             user.save()
-            update_session_auth_hash(request, user)
+            if hasattr(request, 'session'):  # no sessions in the API-only profile
+                update_session_auth_hash(request, user)
             return Response({"detail": "Password updated successfully"}, status=status.HTTP_200_OK)
         except Exception as e:
             return Response({"detail": str(e)}, status=status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,53 @@
+"""
+Login CPU cost per password-hash profile.
+
+Measures the raw check_password() cost for each hasher/profile pair and a full
+POST to the login endpoint, which is what a single API login costs a worker.
+"""
+from common import measure, report, setup, test_database
+
+setup()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.contrib.auth.hashers import check_password, make_password  # noqa: E402
+from django.test import Client, override_settings  # noqa: E402
+from django.urls import reverse  # noqa: E402
+
+from accounts.hashers import HASH_PROFILES  # noqa: E402
+
+PASSWORD = 'pa$$w0rd!'
+ALGORITHMS = ('pbkdf2_sha256', 'scrypt')
+
+
+def bench_hashers(rounds):
+    for profile in HASH_PROFILES:
+        with override_settings(PASSWORD_HASH_PROFILE=profile):
+            for algorithm in ALGORITHMS:
+                encoded = make_password(PASSWORD, hasher=algorithm)
+                seconds = measure(lambda: check_password(PASSWORD, encoded), rounds)
+                report(f"check_password {algorithm} [{profile}]", seconds, 'login')
+
+
+def bench_login_view(rounds):
+    User = get_user_model()
+    client = Client()
+    url = reverse('login')
+    payload = {'email': 'bench@example.com', 'password': PASSWORD}
+    # Measure hashing, not the login throttle
+    no_throttling = {**settings.REST_FRAMEWORK, 'DEFAULT_THROTTLE_RATES': {}}
+    for profile in HASH_PROFILES:
+        with override_settings(PASSWORD_HASH_PROFILE=profile, REST_FRAMEWORK=no_throttling):
+            User.objects.filter(email=payload['email']).delete()
+            User.objects.create_user(name='Bench', **payload)
+            seconds = measure(
+                lambda: client.post(url, payload, content_type='application/json'),
+                rounds,
+            )
+            report(f"POST {url} [{profile}]", seconds, 'login')
+
+
+if __name__ == '__main__':
+    bench_hashers(rounds=5)
+    with test_database():
+        bench_login_view(rounds=5)
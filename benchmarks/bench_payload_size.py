@@ -0,0 +1,45 @@
+"""
+Wire size of list payloads: full vs ?fields= sparse responses, uncompressed
+and compressed.
+
+Uses the same rows as bench_serializers and sends requests through the full
+middleware stack, so the sizes are what a tablet downloads.
+"""
+from common import setup, test_database
+
+setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.urls import reverse  # noqa: E402
+from rest_framework.test import APIClient  # noqa: E402
+
+from Attendance_Backend import middleware  # noqa: E402
+from bench_serializers import ROWS, populate  # noqa: E402
+
+CASES = [
+    ('attendance-list', {}),
+    ('attendance-list', {'fields': 'client,date,time_in,time_out'}),
+    ('client-list', {}),
+    ('client-list', {'fields': 'id,firstName,lastName'}),
+    ('time-history', {}),
+    ('time-history', {'fields': 'date,check_in,check_out,hours_worked'}),
+]
+
+
+def size(client, url, params, encoding):
+    response = client.get(url, params, HTTP_ACCEPT_ENCODING=encoding)
+    return len(response.content)
+
+
+if __name__ == '__main__':
+    encodings = ['identity', 'gzip'] + (['br'] if middleware.brotli else [])
+    with test_database():
+        populate(ROWS)
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.get(email='bench@example.com'))
+        print(f"{'endpoint':<72}" + ''.join(f"{encoding:>12}" for encoding in encodings))
+        for name, params in CASES:
+            url = reverse(name)
+            label = url + (f"?fields={params['fields']}" if params else '')
+            sizes = [size(client, url, params, encoding) for encoding in encodings]
+            print(f"{label:<72}" + ''.join(f"{value / 1024:10.1f}kB" for value in sizes))
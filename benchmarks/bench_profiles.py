@@ -0,0 +1,52 @@
+"""
+Per-request overhead of the default settings versus the API-only profile
+(Attendance_Backend.settings_api).
+
+Settings are fixed once Django is set up, so each profile is measured in its
+own process, through the full handler and middleware chain of the test client:
+an authenticated list that runs one small query, and the same list without a
+token, which is refused before any query.
+"""
+import logging
+import os
+import subprocess
+import sys
+
+from common import ROOT
+
+PROFILES = ['Attendance_Backend.settings', 'Attendance_Backend.settings_api']
+ROUNDS = 2000
+
+
+def bench_requests(rounds):
+    from django.contrib.auth import get_user_model
+    from django.test import Client
+    from django.urls import reverse
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    from common import measure, report
+
+    logging.getLogger('django.request').setLevel(logging.ERROR)  # one "Unauthorized" line per 401
+    user = get_user_model().objects.create_user(name='Bench', email='bench@example.com', password=None)
+    client = Client(HTTP_AUTHORIZATION=f'Bearer {RefreshToken.for_user(user).access_token}')
+    anonymous = Client()
+    url = reverse('location-list')
+
+    report(f"GET {url} (JWT)", measure(lambda: client.get(url), rounds), 'request')
+    report(f"GET {url} (no token, 401)", measure(lambda: anonymous.get(url), rounds), 'request')
+
+
+if __name__ == '__main__':
+    if '--child' in sys.argv:
+        from common import setup, test_database
+
+        setup()
+        with test_database():
+            bench_requests(ROUNDS)
+    else:
+        for profile in PROFILES:
+            print(profile)
+            subprocess.run(
+                [sys.executable, __file__, '--child'], cwd=ROOT, check=True,
+                env={**os.environ, 'DJANGO_SETTINGS_MODULE': profile},
+            )
@@ -0,0 +1,53 @@
+"""
+JSON rendering and parsing cost for large list payloads.
+
+Compares DRF's stdlib JSONRenderer/JSONParser with the orjson-backed
+FastJSONRenderer/FastJSONParser on TimeHistoryView and AttendanceRecordViewSet
+sized payloads, then times the full GET of both endpoints.
+"""
+from io import BytesIO
+
+from common import measure, report, setup, test_database
+
+setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.urls import reverse  # noqa: E402
+from rest_framework.parsers import JSONParser  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+from rest_framework.test import APIClient  # noqa: E402
+
+from Attendance_Backend.api import renderers  # noqa: E402
+from Attendance_Backend.api.renderers import FastJSONParser, FastJSONRenderer  # noqa: E402
+from bench_serializers import ROWS, populate  # noqa: E402
+from clients.models import AttendanceRecord  # noqa: E402
+from clients.serializers import AttendanceRecordLeanSerializer  # noqa: E402
+from employee.models import TimeRecord  # noqa: E402
+from employee.serializers import TimeRecordLeanSerializer  # noqa: E402
+
+
+def bench_payload(label, data, rounds):
+    body = JSONRenderer().render(data)
+    assert FastJSONRenderer().render(data) == body, f"{label}: rendered output differs"
+    report(f"{label} render JSONRenderer", measure(lambda: JSONRenderer().render(data), rounds))
+    report(f"{label} render FastJSONRenderer", measure(lambda: FastJSONRenderer().render(data), rounds))
+
+    report(f"{label} parse JSONParser", measure(lambda: JSONParser().parse(BytesIO(body)), rounds))
+    report(f"{label} parse FastJSONParser", measure(lambda: FastJSONParser().parse(BytesIO(body)), rounds))
+
+
+def bench_endpoints(rounds):
+    client = APIClient()
+    client.force_authenticate(get_user_model().objects.get(email='bench@example.com'))
+    for name in ('time-history', 'attendance-list'):
+        url = reverse(name)
+        report(f"GET {url} ({ROWS} rows)", measure(lambda: client.get(url), rounds), 'request')
+
+
+if __name__ == '__main__':
+    print(f"orjson {'available' if renderers.orjson else 'not installed, fallback only'}")
+    with test_database():
+        populate(ROWS)
+        bench_payload('TimeHistory', TimeRecordLeanSerializer(TimeRecord.objects.all()).data, rounds=10)
+        bench_payload('Attendance', AttendanceRecordLeanSerializer(AttendanceRecord.objects.all()).data, rounds=10)
+        bench_endpoints(rounds=5)
@@ -0,0 +1,78 @@
+"""
+List serialization throughput: DRF serializers against the lean values() path.
+
+Fills a throwaway database with time, client and attendance rows and reports
+rows/second for each list serializer and its LeanSerializer counterpart. Both
+include the query, which is what a list request pays.
+"""
+from common import measure, report, setup, test_database
+
+setup()
+
+from datetime import date, datetime, time, timedelta  # noqa: E402
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.utils import timezone  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from clients.models import AttendanceRecord, Client  # noqa: E402
+from clients.serializers import (  # noqa: E402
+    AttendanceRecordLeanSerializer, AttendanceRecordSerializer, ClientLeanSerializer, ClientSerializer,
+)
+from employee.models import TimeRecord  # noqa: E402
+from employee.serializers import TimeRecordLeanSerializer, TimeRecordSerializer  # noqa: E402
+
+ROWS = 5000
+
+
+def populate(rows):
+    User = get_user_model()
+    user = User.objects.create_user(name='Bench', email='bench@example.com', password=None)
+    start = timezone.make_aware(datetime(2020, 1, 1, 8, 0))
+    TimeRecord.objects.bulk_create([
+        TimeRecord(
+            user=user, date=(start + timedelta(days=n)).date(), check_in=start + timedelta(days=n),
+            check_out=start + timedelta(days=n, hours=8), hours_worked=8, total_paused_time=0.5,
+        )
+        for n in range(rows)
+    ])
+    Client.objects.bulk_create([
+        Client(
+            user=user, clientId=f'C-{n}', firstName='Ann', lastName=f'Lee {n}', dob=date(1990, 1, 1),
+            location='Guadalupe', billType='DDD only', phone='555-0100', guardian='Bob',
+        )
+        for n in range(rows)
+    ])
+    AttendanceRecord.objects.bulk_create([
+        AttendanceRecord(
+            client=f'C-{n}', time_in=time(8, 30), time_out=time(15), service='DTA1',
+            location='GUADALUPE_DTA', date=date(2026, 3, 2),
+        )
+        for n in range(rows)
+    ])
+
+
+def bench_pair(label, serializer_class, lean_class, queryset, rounds):
+    full = measure(lambda: serializer_class(queryset.all(), many=True).data, rounds)
+    lean = measure(lambda: lean_class(queryset.all()).data, rounds)
+    assert (
+        JSONRenderer().render(serializer_class(queryset.all(), many=True).data)
+        == JSONRenderer().render(lean_class(queryset.all()).data)
+    ), f"{label}: lean output differs"
+    report(f"{label} ModelSerializer", full / ROWS, 'row')
+    report(f"{label} LeanSerializer", lean / ROWS, 'row')
+    print(f"{'':<48} {full / lean:.1f}x faster")
+
+
+if __name__ == '__main__':
+    with test_database():
+        populate(ROWS)
+        bench_pair(
+            'TimeRecord', TimeRecordSerializer, TimeRecordLeanSerializer,
+            TimeRecord.objects.select_related('user__work_profile'), rounds=3,
+        )
+        bench_pair('Client', ClientSerializer, ClientLeanSerializer, Client.objects.all(), rounds=3)
+        bench_pair(
+            'AttendanceRecord', AttendanceRecordSerializer, AttendanceRecordLeanSerializer,
+            AttendanceRecord.objects.all(), rounds=3,
+        )
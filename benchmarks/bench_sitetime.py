@@ -0,0 +1,34 @@
+"""
+Cost of bucketing timestamps into site dates.
+
+Compares building a pytz zone per value (the old per-row pattern), converting
+each value with the cached zoneinfo zone, and the bulk site_dates() path.
+"""
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from common import measure, report, setup
+
+setup()
+
+import pytz  # noqa: E402
+
+from Attendance_Backend.sitetime import site_dates, site_zone  # noqa: E402
+
+VALUES = 100_000
+
+
+def timestamps(count):
+    start = datetime(2026, 1, 1, tzinfo=dt_timezone.utc)
+    return [start + timedelta(minutes=37 * n) for n in range(count)]
+
+
+if __name__ == '__main__':
+    values = timestamps(VALUES)
+    zone = site_zone()
+    assert site_dates(values) == [value.astimezone(zone).date() for value in values]
+
+    report(f"pytz zone per value ({VALUES})",
+           measure(lambda: [value.astimezone(pytz.timezone('America/Phoenix')).date() for value in values], 3))
+    report(f"cached zoneinfo astimezone ({VALUES})",
+           measure(lambda: [value.astimezone(zone).date() for value in values], 3))
+    report(f"site_dates ({VALUES})", measure(lambda: site_dates(values), 3))
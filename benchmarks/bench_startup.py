@@ -0,0 +1,69 @@
+"""
+Cold start of a fresh process, per service role.
+
+Runs ``python -X importtime`` for each SERVICE_ROLE, setting Django up and
+loading the URLconf the way a worker does before its first request, and
+reports import time (grouped by top-level package, installed apps marked) and
+peak memory. Compare the default profile with the API-only one:
+
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --role api --top 25
+"""
+import argparse
+import os
+import subprocess
+import sys
+from collections import Counter
+
+from common import ROOT
+
+ROLES = ['all', 'api']
+
+CHILD = """
+import resource
+import django
+from django.conf import settings
+django.setup()
+from django.urls import get_resolver
+get_resolver().url_patterns
+print(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+print(','.join(settings.INSTALLED_APPS))
+"""
+
+
+def profile(role):
+    """Return ({top-level package: self import time in µs}, peak RSS in KiB, installed apps)."""
+    env = {**os.environ, 'DJANGO_SETTINGS_MODULE': 'Attendance_Backend.settings', 'SERVICE_ROLE': role}
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', CHILD],
+        cwd=ROOT, env=env, capture_output=True, text=True, check=True,
+    )
+    packages = Counter()
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, _, name = line[len('import time:'):].split('|')
+        packages[name.strip().split('.')[0]] += int(self_us)
+    max_rss, apps = result.stdout.split()[-2:]
+    return packages, int(max_rss), apps.split(',')
+
+
+def app_packages(apps):
+    return {app.split('.')[0] for app in apps}
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--role', action='append', choices=ROLES)
+    parser.add_argument('--top', type=int, default=15)
+    options = parser.parse_args()
+
+    for role in options.role or ROLES:
+        packages, max_rss, apps = profile(role)
+        installed = app_packages(apps)
+        print(f"SERVICE_ROLE={role}: {sum(packages.values()) / 1000:.1f} ms importing "
+              f"{len(packages)} packages, peak RSS {max_rss / 1024:.1f} MiB")
+        for package, self_us in packages.most_common(options.top):
+            marker = 'app' if package in installed else ''
+            print(f"    {package:<36} {self_us / 1000:8.1f} ms  {marker}")
+        print()
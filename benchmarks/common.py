@@ -0,0 +1,51 @@
+"""
+Shared helpers for the benchmark scripts.
+
+Run a benchmark from the project root, e.g. ``python benchmarks/bench_login.py``.
+Benchmarks that need rows create a throwaway test database, so db.sqlite3 is
+never touched.
+"""
+import os
+import sys
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def setup(settings_module='Attendance_Backend.settings'):
+    if str(ROOT) not in sys.path:
+        sys.path.insert(0, str(ROOT))
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', settings_module)
+
+    import django
+    django.setup()
+
+
+@contextmanager
+def test_database():
+    from django.db import connection
+    from django.test.utils import setup_test_environment, teardown_test_environment
+
+    setup_test_environment()
+    old_name = connection.creation.create_test_db(verbosity=0)
+    try:
+        yield
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+        teardown_test_environment()
+
+
+def measure(func, rounds):
+    """Return the mean wall time of ``func()`` in seconds over ``rounds`` calls."""
+    func()  # warm-up
+    start = time.perf_counter()
+    for _ in range(rounds):
+        func()
+    return (time.perf_counter() - start) / rounds
+
+
+def report(label, seconds, unit='call'):
+    per_second = 1 / seconds if seconds else float('inf')
+    print(f"{label:<48} {seconds * 1000:9.2f} ms/{unit} {per_second:10.1f} {unit}s/s")
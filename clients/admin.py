@@ -36,7 +36,7 @@ from .models import AttendanceRecord
 
 class AttendanceRecordAdmin(admin.ModelAdmin):
     list_display = ('client', 'date', 'time_in', 'time_out', 'service', 'location', 'one_on_one')
-    list_filter = ('date', 'service', 'location', 'one_on_one')
+    list_filter = ('date', 'site', 'service', 'location', 'one_on_one')
     search_fields = ('client',)
     date_hierarchy = 'date'
     ordering = ('-date', 'client')
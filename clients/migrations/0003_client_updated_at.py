@@ -0,0 +1,23 @@
+# Generated by Django 5.2 on 2026-10-19 02:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0002_attendancerecord'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='client',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AlterField(
+            model_name='client',
+            name='billType',
+            field=models.CharField(choices=[('DDD only', 'DDD only')], max_length=20),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-19 02:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+LOCATION_SITES = {
+    'GUADALUPE_DTA': 'guadalupe_dta',
+    'GUADALUPE_DTT': 'guadalupe_dtt',
+    'GUADALUPE_SPECIAL': 'guadalupe_special_dta',
+}
+
+
+def link_sites(apps, schema_editor):
+    AttendanceRecord = apps.get_model('clients', 'AttendanceRecord')
+    for location, site in LOCATION_SITES.items():
+        AttendanceRecord.objects.filter(location=location).update(site_id=site)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0003_client_updated_at'),
+        ('locations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='attendancerecord',
+            name='site',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='attendance_records', to='locations.location', to_field='code'),
+        ),
+        migrations.AddIndex(
+            model_name='attendancerecord',
+            index=models.Index(fields=['site', 'date'], name='attendance_site_date_idx'),
+        ),
+        migrations.RunPython(link_sites, migrations.RunPython.noop),
+    ]
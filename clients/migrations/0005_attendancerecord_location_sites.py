@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-19 03:45
+
+import clients.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0004_attendancerecord_site'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='attendancerecord',
+            name='location',
+            field=models.CharField(max_length=50, validators=[clients.models.validate_attendance_location]),
+        ),
+    ]
@@ -23,13 +23,21 @@ class Client(models.Model):
     phone = models.CharField(max_length=20)
     guardian = models.CharField(max_length=100)
     status = models.CharField(max_length=10, choices=STATUS_CHOICES, default='active')
+    updated_at = models.DateTimeField(auto_now=True)
 
     def __str__(self):
         return f"{self.firstName} {self.lastName} ({self.clientId})"
     
 from django.db import models
-from django.utils import timezone
-import pytz
+from Attendance_Backend.sitetime import site_today
+from locations.models import Location, validate_location_code
+
+
+def validate_attendance_location(value):
+    """A program from AttendanceRecord.LOCATION_SITES or the code of an active Location."""
+    if value not in AttendanceRecord.LOCATION_SITES:
+        validate_location_code(value)
+
 
 class AttendanceRecord(models.Model):
     SERVICE_CHOICES = [
@@ -39,17 +47,23 @@ class AttendanceRecord(models.Model):
         ('SDTA', 'Special DTA - Special Day Program'),
     ]
     
-    LOCATION_CHOICES = [
-        ('GUADALUPE_DTA', 'GUADALUPE DTA'),
-        ('GUADALUPE_DTT', 'GUADALUPE DTT'),
-        ('GUADALUPE_SPECIAL', 'GUADALUPE SPECIAL DTA'),
-    ]
+    # Programs recorded before sites were Locations, and the site each runs at;
+    # any other location is a Location code
+    LOCATION_SITES = {
+        'GUADALUPE_DTA': 'guadalupe_dta',
+        'GUADALUPE_DTT': 'guadalupe_dtt',
+        'GUADALUPE_SPECIAL': 'guadalupe_special_dta',
+    }
     
     client = models.CharField(max_length=100)
     time_in = models.TimeField()
     time_out = models.TimeField()
     service = models.CharField(max_length=50, choices=SERVICE_CHOICES)
-    location = models.CharField(max_length=50, choices=LOCATION_CHOICES)
+    location = models.CharField(max_length=50, validators=[validate_attendance_location])
+    site = models.ForeignKey(
+        Location, to_field='code', on_delete=models.PROTECT, null=True, blank=True,
+        related_name='attendance_records',
+    )
     date = models.DateField()
     one_on_one = models.BooleanField(default=False)
     documentation = models.BooleanField(default=False)
@@ -59,13 +73,17 @@ class AttendanceRecord(models.Model):
     class Meta:
         ordering = ['-date', 'client']
         unique_together = ['client', 'date']  # Prevent duplicate entries for same client on same day
+        indexes = [
+            models.Index(fields=['site', 'date'], name='attendance_site_date_idx'),
+        ]
     
     def __str__(self):
         return f"{self.client} - {self.date} - {self.service}"
     
     def save(self, *args, **kwargs):
-        # Ensure date is in Arizona time (MST, no DST)
+        # site is the source of truth; location only fills it in
+        if self.site_id is None:
+            self.site_id = self.LOCATION_SITES.get(self.location, self.location or None)
         if not self.date:
-            az_timezone = pytz.timezone('America/Phoenix')
-            self.date = timezone.now().astimezone(az_timezone).date()
+            self.date = site_today(self.site_id)
         super().save(*args, **kwargs)
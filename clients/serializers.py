@@ -1,10 +1,12 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from Attendance_Backend.api.fieldsets import SparseFieldsetMixin
+from Attendance_Backend.api.lean import LeanSerializer
 from .models import Client, AttendanceRecord
 
 User = get_user_model()
 
-class ClientSerializer(serializers.ModelSerializer):
+class ClientSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     user = serializers.PrimaryKeyRelatedField(queryset=User.objects.all())
 
     class Meta:
@@ -12,7 +14,7 @@ class ClientSerializer(serializers.ModelSerializer):
         fields = '__all__'
 
 
-class AttendanceRecordSerializer(serializers.ModelSerializer):
+class AttendanceRecordSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     class Meta:
         model = AttendanceRecord
         fields = '__all__'
@@ -22,3 +24,11 @@ class AttendanceRecordSerializer(serializers.ModelSerializer):
         if data['time_out'] <= data['time_in']:
             raise serializers.ValidationError("Time Out must be after Time In")
         return data
+
+
+class ClientLeanSerializer(LeanSerializer):
+    serializer_class = ClientSerializer
+
+
+class AttendanceRecordLeanSerializer(LeanSerializer):
+    serializer_class = AttendanceRecordSerializer
@@ -2,17 +2,23 @@ from rest_framework import viewsets, filters, status
 from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
+from django.db.models import Q
 from django_filters.rest_framework import DjangoFilterBackend
-from datetime import datetime, date
-import pytz
+from datetime import date
 from .models import Client, AttendanceRecord
-from .serializers import ClientSerializer, AttendanceRecordSerializer
+from Attendance_Backend.api.conditional import ConditionalGetMixin
+from Attendance_Backend.api.lean import LeanListMixin
+from Attendance_Backend.sitetime import known_sites, site_today
+from .serializers import (
+    ClientSerializer, AttendanceRecordSerializer, ClientLeanSerializer, AttendanceRecordLeanSerializer,
+)
 
 
 # --- CLIENT CRUD VIEWSET ---
-class ClientViewSet(viewsets.ModelViewSet):
+class ClientViewSet(ConditionalGetMixin, LeanListMixin, viewsets.ModelViewSet):
     queryset = Client.objects.all()
     serializer_class = ClientSerializer
+    lean_serializer_class = ClientLeanSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ['name', 'email']  # Adjust to your Client model fields
@@ -20,22 +26,24 @@ class ClientViewSet(viewsets.ModelViewSet):
 
 
 # --- ATTENDANCE RECORD CRUD VIEWSET ---
-class AttendanceRecordViewSet(viewsets.ModelViewSet):
+class AttendanceRecordViewSet(ConditionalGetMixin, LeanListMixin, viewsets.ModelViewSet):
     queryset = AttendanceRecord.objects.all()
     serializer_class = AttendanceRecordSerializer
+    lean_serializer_class = AttendanceRecordLeanSerializer
     filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
-    filterset_fields = ['date', 'client', 'service', 'location']
+    filterset_fields = ['date', 'client', 'service', 'location', 'site']
     search_fields = ['client']
     ordering_fields = ['date', 'client', 'time_in']
 
     @action(detail=False, methods=['get'], url_path='today1')
     def today(self, request):
-        """Get today's records in Arizona time"""
-        az_timezone = pytz.timezone('America/Phoenix')
-        today = datetime.now(az_timezone).date()
-        records = self.queryset.filter(date=today)
-        serializer = self.get_serializer(records, many=True)
-        return Response(serializer.data)
+        """Get today's records, each site on its own date (?site= for one)"""
+        site = request.query_params.get('site')
+        today = Q()
+        for code in [site] if site else known_sites():
+            today |= Q(site_id=code, date=site_today(code))
+        records = self.queryset.filter(today)
+        return Response(AttendanceRecordLeanSerializer(records).data)
 
     @action(detail=False, methods=['get'], url_path='date/(?P<date_str>[^/.]+)')
     def by_date(self, request, date_str=None):
@@ -43,7 +51,6 @@ class AttendanceRecordViewSet(viewsets.ModelViewSet):
         try:
             target_date = date.fromisoformat(date_str)
             records = self.queryset.filter(date=target_date)
-            serializer = self.get_serializer(records, many=True)
-            return Response(serializer.data)
+            return Response(AttendanceRecordLeanSerializer(records).data)
         except ValueError:
             return Response({"error": "Invalid date format. Use YYYY-MM-DD"}, status=400)
\ No newline at end of file
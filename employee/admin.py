@@ -1,17 +1,117 @@
 from django.contrib import admin
-from django.db.models import Sum, F, ExpressionWrapper, DurationField, DecimalField
+from django.contrib.admin.views.main import ChangeList
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Count, Sum, F, ExpressionWrapper, DurationField, DecimalField
 from django.contrib.auth import get_user_model
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.html import format_html
 from datetime import timedelta
+from Attendance_Backend.sitetime import site_today, to_site_time
 from import_export import resources
 from import_export.admin import ExportMixin
 from import_export.formats import base_formats
-from .models import TimeRecord, PauseRecord, UserWorkProfile
+from . import audit
+from .models import (
+    ArchivedPauseRecord, ArchivedTimeRecord, ClockAuditEntry, OfflineSigningKey, TimeRecord, PauseRecord, UserWorkProfile,
+)
 from decimal import Decimal
 
 User = get_user_model()
 
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that skips COUNT(*) on large unfiltered tables.
+
+    On PostgreSQL the planner's row estimate is used once the table is big
+    enough for an exact count to hurt; filtered querysets and other backends
+    still get an exact count.
+    """
+    exact_count_threshold = 100_000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == 'postgresql' and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] > self.exact_count_threshold:
+                return row[0]
+        return super().count
+
+
+class UserAutocompleteFilter(admin.ListFilter):
+    """
+    User filter backed by the admin autocomplete endpoint instead of a
+    dropdown listing every user. Requires 'user' in autocomplete_fields.
+    """
+    title = 'user'
+    parameter_name = 'user'
+    template = 'admin/employee/user_autocomplete_filter.html'
+
+    def __init__(self, request, params, model, model_admin):
+        super().__init__(request, params, model, model_admin)
+        value = params.pop(self.parameter_name, None)
+        if isinstance(value, list):
+            value = value[-1]
+        self.value = value if value and value.isdigit() else None
+        self.opts = model._meta
+
+    def has_output(self):
+        return True
+
+    def expected_parameters(self):
+        return [self.parameter_name]
+
+    def queryset(self, request, queryset):
+        if self.value:
+            return queryset.filter(user_id=self.value)
+        return queryset
+
+    @cached_property
+    def selected(self):
+        return User.objects.filter(pk=self.value).first() if self.value else None
+
+    def choices(self, changelist):
+        return []
+
+
+def user_summaries(user_ids):
+    """
+    Total hours and distinct days worked per user, archived shifts included,
+    in one grouped query per table. A day is only ever in one of the tables.
+    """
+    summaries = {}
+    for model in (TimeRecord, ArchivedTimeRecord):
+        rows = (
+            model.objects.filter(user_id__in=user_ids)
+            .order_by()
+            .values('user_id')
+            .annotate(total_hours=Sum('hours_worked'), days_worked=Count('date', distinct=True))
+        )
+        for row in rows:
+            summary = summaries.setdefault(row['user_id'], {'user_id': row['user_id'], 'total_hours': None, 'days_worked': 0})
+            if row['total_hours'] is not None:
+                summary['total_hours'] = (summary['total_hours'] or 0) + row['total_hours']
+            summary['days_worked'] += row['days_worked']
+    return summaries
+
+
+class TimeRecordChangeList(ChangeList):
+    def get_results(self, request):
+        super().get_results(request)
+        # Feed the user_summary column for the whole page from one query
+        summaries = user_summaries({record.user_id for record in self.result_list})
+        for record in self.result_list:
+            record._user_summary = summaries.get(record.user_id, {})
+
+
 class TimeRecordResource(resources.ModelResource):
     class Meta:
         model = TimeRecord
@@ -35,7 +135,26 @@ class TimeRecordResource(resources.ModelResource):
             return Decimal(record.hours_worked) * record.user.work_profile.rate_per_hour
         return None
 
-class TimeRecordAdmin(ExportMixin, admin.ModelAdmin):
+class ClockAuditMixin:
+    """Records admin creates, edits and deletes in the clock audit log (employee.audit)."""
+
+    def save_model(self, request, obj, form, change):
+        before = audit.stored_values(obj) if change else {}
+        super().save_model(request, obj, form, change)
+        action = ClockAuditEntry.ADMIN_EDIT if change else ClockAuditEntry.ADMIN_CREATE
+        audit.log_change(obj, action, before, audit.tracked_values(obj), actor=request.user)
+
+    def delete_model(self, request, obj):
+        audit.log_change(obj, ClockAuditEntry.ADMIN_DELETE, audit.tracked_values(obj), {}, actor=request.user)
+        super().delete_model(request, obj)
+
+    def delete_queryset(self, request, queryset):
+        for obj in queryset:
+            audit.log_change(obj, ClockAuditEntry.ADMIN_DELETE, audit.tracked_values(obj), {}, actor=request.user)
+        super().delete_queryset(request, queryset)
+
+
+class TimeRecordAdmin(ClockAuditMixin, ExportMixin, admin.ModelAdmin):
     resource_class = TimeRecordResource
     list_display = (
         'user', 'date', 'check_in', 'check_out',
@@ -43,8 +162,11 @@ class TimeRecordAdmin(ExportMixin, admin.ModelAdmin):
         'rate_per_hour_display',
         'status', 'user_summary'
     )
-    list_filter = ('date', 'user', 'check_out')
-    search_fields = ('user__username', 'user__email', 'user__first_name', 'user__last_name')
+    list_filter = ('date', UserAutocompleteFilter, 'check_out')
+    search_fields = ('user__email', 'user__name')
+    autocomplete_fields = ('user',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     readonly_fields = ('hours_worked', 'total_paused_time', 'user_summary', 'status', 'rate_per_hour_info', 'payment_amount_info')
     date_hierarchy = 'date'
     ordering = ('-date', '-check_in')
@@ -122,9 +244,11 @@ class TimeRecordAdmin(ExportMixin, admin.ModelAdmin):
     status.short_description = 'Status'
 
     def user_summary(self, obj):
-        user_records = TimeRecord.objects.filter(user=obj.user)
-        total_hours = sum([Decimal(record.hours_worked or 0) for record in user_records], Decimal(0))
-        days_worked = user_records.values('date').distinct().count()
+        summary = getattr(obj, '_user_summary', None)
+        if summary is None:
+            summary = user_summaries([obj.user_id]).get(obj.user_id, {})
+        total_hours = Decimal(summary.get('total_hours') or 0)
+        days_worked = summary.get('days_worked') or 0
         avg_hours = total_hours / Decimal(days_worked) if days_worked else Decimal(0)
         
         current_payment = self.get_payment_amount(obj)
@@ -142,6 +266,9 @@ class TimeRecordAdmin(ExportMixin, admin.ModelAdmin):
     user_summary.short_description = 'User Summary'
     user_summary.allow_tags = True
 
+    def get_changelist(self, request, **kwargs):
+        return TimeRecordChangeList
+
     def get_queryset(self, request):
         qs = super().get_queryset(request).select_related('user__work_profile')
         if not request.user.is_superuser:
@@ -172,13 +299,16 @@ class TimeRecordAdmin(ExportMixin, admin.ModelAdmin):
         
         super().save_model(request, obj, form, change)
 
-class PauseRecordAdmin(admin.ModelAdmin):
+class PauseRecordAdmin(ClockAuditMixin, admin.ModelAdmin):
     list_display = (
         'user', 'reason', 'pause_datetime_display',
         'resume_datetime_display', 'duration_display', 'pause_status'
     )
-    list_filter = ('user', 'pause_time', 'resume_time')
-    search_fields = ('user__username', 'reason')
+    list_filter = (UserAutocompleteFilter, 'pause_time', 'resume_time')
+    search_fields = ('user__email', 'user__name', 'reason')
+    autocomplete_fields = ('user',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     readonly_fields = ('pause_time', 'resume_time', 'duration', 'pause_status', 
                       'pause_datetime_info', 'resume_datetime_info')
     date_hierarchy = 'pause_time'
@@ -192,18 +322,9 @@ class PauseRecordAdmin(admin.ModelAdmin):
         }),
     )
 
-    def _convert_to_arizona_time(self, dt):
-        """Convert datetime to Arizona timezone (MST, no DST)"""
-        if not dt:
-            return None
-        arizona_tz = timezone.get_fixed_timezone(-420)  # UTC-7 (MST)
-        if timezone.is_naive(dt):
-            dt = timezone.make_aware(dt, timezone.utc)
-        return dt.astimezone(arizona_tz)
-
     def pause_datetime_display(self, obj):
         if obj.pause_time:
-            az_time = self._convert_to_arizona_time(obj.pause_time)
+            az_time = to_site_time(obj.pause_time)
             return az_time.strftime("%Y-%m-%d %I:%M:%S %p")
         return "-"
     pause_datetime_display.short_description = "Pause Date & Time (Arizona)"
@@ -211,7 +332,7 @@ class PauseRecordAdmin(admin.ModelAdmin):
 
     def resume_datetime_display(self, obj):
         if obj.resume_time:
-            az_time = self._convert_to_arizona_time(obj.resume_time)
+            az_time = to_site_time(obj.resume_time)
             return az_time.strftime("%Y-%m-%d %I:%M:%S %p")
         return "-"
     resume_datetime_display.short_description = "Resume Date & Time (Arizona)"
@@ -238,8 +359,7 @@ class PauseRecordAdmin(admin.ModelAdmin):
         if obj.resume_time:
             return format_html('<span style="color: green;">✓ Completed</span>')
         elif obj.pause_time:
-            az_time = self._convert_to_arizona_time(obj.pause_time)
-            if az_time.date() == self._convert_to_arizona_time(timezone.now()).date():
+            if to_site_time(obj.pause_time).date() == site_today():
                 return format_html('<span style="color: orange;">⏸ Active (Today)</span>')
         return format_html('<span style="color: red;">⏸ Active (Older)</span>')
     pause_status.short_description = "Status"
@@ -295,13 +415,113 @@ class UserWorkProfileAdmin(admin.ModelAdmin):
     def recent_hours_worked(self, obj):
         records = TimeRecord.objects.filter(
             user=obj.user,
-            date__gte=timezone.now().date() - timedelta(days=14)
+            date__gte=site_today() - timedelta(days=14)
         )
         total_hours = sum([Decimal(record.hours_worked or 0) for record in records], Decimal(0))
         return f"{total_hours:.2f}h"
     recent_hours_worked.short_description = 'Recent Hours (14d)'
 
 
+class ArchivedRecordAdmin(admin.ModelAdmin):
+    """Read-only view of rows moved out by archive_clock_records."""
+    list_filter = (UserAutocompleteFilter,)
+    search_fields = ('user__email', 'user__name')
+    autocomplete_fields = ('user',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_readonly_fields(self, request, obj=None):
+        return [field.name for field in self.model._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
+class ArchivedTimeRecordAdmin(ArchivedRecordAdmin):
+    list_display = ('user', 'date', 'check_in', 'check_out', 'hours_worked', 'archived_at')
+    date_hierarchy = 'date'
+
+
+class ArchivedPauseRecordAdmin(ArchivedRecordAdmin):
+    list_display = ('user', 'reason', 'pause_time', 'resume_time', 'duration', 'archived_at')
+    date_hierarchy = 'pause_time'
+
+
+class OfflineSigningKeyAdmin(admin.ModelAdmin):
+    """Keys devices sign offline clock events with; revoking one refuses every event it signed."""
+    list_display = ('key_id', 'user', 'device', 'issued_at', 'expires_at', 'revoked_at')
+    list_filter = (UserAutocompleteFilter, 'revoked_at')
+    search_fields = ('user__email', 'user__name', 'device')
+    autocomplete_fields = ('user',)
+    list_select_related = ('user',)
+    readonly_fields = ('key_id', 'user', 'device', 'issued_at', 'expires_at', 'revoked_at')
+    exclude = ('secret',)
+    actions = ['revoke_keys']
+
+    @admin.action(description="Revoke selected keys")
+    def revoke_keys(self, request, queryset):
+        revoked = queryset.filter(revoked_at__isnull=True).update(revoked_at=timezone.now())
+        self.message_user(request, f"Revoked {revoked} key(s).")
+
+    def has_add_permission(self, request):
+        return False
+
+
+class ClockAuditEntryAdmin(admin.ModelAdmin):
+    """The audit log is append-only, so entries can be browsed but not changed."""
+    list_display = ('created_at', 'user_display', 'date', 'record_type', 'record_id', 'action', 'actor_display')
+    list_filter = ('action', 'record_type', UserAutocompleteFilter)
+    search_fields = ('user__email', 'user__name')
+    autocomplete_fields = ('user',)
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    date_hierarchy = 'date'
+
+    def get_queryset(self, request):
+        # Prefetched rather than joined: entries keep the ids of deleted users
+        return super().get_queryset(request).prefetch_related('user', 'actor')
+
+    def person(self, obj, field):
+        person_id = getattr(obj, f'{field}_id')
+        try:
+            person = getattr(obj, field)
+        except User.DoesNotExist:
+            person = None
+        if person is None and person_id is not None:
+            return f"Deleted user #{person_id}"
+        return person
+
+    @admin.display(description='user', ordering='user')
+    def user_display(self, obj):
+        return self.person(obj, 'user')
+
+    @admin.display(description='actor', ordering='actor')
+    def actor_display(self, obj):
+        return self.person(obj, 'actor')
+
+    def get_readonly_fields(self, request, obj=None):
+        return [field.name for field in self.model._meta.fields]
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
+
+
 admin.site.register(TimeRecord, TimeRecordAdmin)
 admin.site.register(PauseRecord, PauseRecordAdmin)
-admin.site.register(UserWorkProfile, UserWorkProfileAdmin)
\ No newline at end of file
+admin.site.register(UserWorkProfile, UserWorkProfileAdmin)
+admin.site.register(ArchivedTimeRecord, ArchivedTimeRecordAdmin)
+admin.site.register(ArchivedPauseRecord, ArchivedPauseRecordAdmin)
+admin.site.register(ClockAuditEntry, ClockAuditEntryAdmin)
+admin.site.register(OfflineSigningKey, OfflineSigningKeyAdmin)
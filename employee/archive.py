@@ -0,0 +1,130 @@
+"""
+Data retention for clock records.
+
+Closed time records dated more than CLOCK_ARCHIVE['HORIZON_DAYS'] site days
+back, and resumed pauses from before that day at the user's site, are moved in batches to
+ArchivedTimeRecord / ArchivedPauseRecord under their original ids. The live
+tables that the clock endpoints and admin filters scan stay small. Open rows
+are never moved; reconciliation closes them first.
+
+Totals read both tables (``CombinedRecords``), and archived rows keep their
+updated_at, so moving rows changes neither a total nor a fingerprint.
+History includes archived rows on request (``?include_archived=1``).
+"""
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from Attendance_Backend.api.conditional import queryset_fingerprint
+from Attendance_Backend.sitetime import known_sites, site_today, site_zone
+from settings.models import UserSettings
+from .models import ArchivedPauseRecord, ArchivedTimeRecord, PauseRecord, TimeRecord
+
+DEFAULT_POLICY = {
+    'HORIZON_DAYS': 400,  # covers the current and previous payroll year
+    'BATCH_SIZE': 1000,
+}
+
+TIME_RECORD_FIELDS = [
+    'id', 'user_id', 'date', 'check_in', 'check_in_time', 'check_out',
+    'hours_worked', 'total_paused_time', 'is_paused', 'updated_at',
+]
+PAUSE_RECORD_FIELDS = ['id', 'user_id', 'reason', 'pause_time', 'resume_time', 'duration']
+
+
+def get_policy():
+    return {**DEFAULT_POLICY, **getattr(settings, 'CLOCK_ARCHIVE', {})}
+
+
+def archive_cutoff(policy=None):
+    """First site day that stays in the live tables, at the site furthest behind."""
+    policy = policy or get_policy()
+    return min(site_today(site) for site in known_sites()) - timedelta(days=policy['HORIZON_DAYS'])
+
+
+def archivable_records(cutoff):
+    """(time records, pauses) that ``archive_records(cutoff)`` would move."""
+    def before_cutoff(site):
+        return Q(pause_time__lt=timezone.make_aware(datetime.combine(cutoff, time.min), site_zone(site)))
+
+    # Pauses are cut at the start of the cutoff day in their user's zone;
+    # subqueries rather than joins, so the rows can still be locked
+    sited = UserSettings.objects.filter(site__isnull=False)
+    pauses_before = before_cutoff(None) & ~Q(user_id__in=sited.values('user_id'))
+    for site in known_sites()[1:]:
+        pauses_before |= before_cutoff(site) & Q(user_id__in=sited.filter(site_id=site).values('user_id'))
+    return (
+        TimeRecord.objects.filter(date__lt=cutoff, check_out__isnull=False),
+        PauseRecord.objects.filter(pauses_before, resume_time__isnull=False),
+    )
+
+
+def _move(queryset, archive_model, fields, batch_size):
+    moved = 0
+    while True:
+        with transaction.atomic():
+            # Locked so an edit cannot land between the copy and the delete
+            rows = list(queryset.select_for_update().order_by('pk').values(*fields)[:batch_size])
+            if not rows:
+                return moved
+            archive_model.objects.bulk_create([archive_model(**row) for row in rows])
+            queryset.model.objects.filter(pk__in=[row['id'] for row in rows]).delete()
+        moved += len(rows)
+
+
+def archive_records(cutoff=None, batch_size=None, dry_run=False):
+    """
+    Move closed rows from before ``cutoff`` (default: the policy horizon) to
+    the archive tables, ``batch_size`` rows per transaction. Returns the
+    number of (time records, pauses) moved, or that would be with ``dry_run``.
+    """
+    policy = get_policy()
+    cutoff = cutoff or archive_cutoff(policy)
+    batch_size = batch_size or policy['BATCH_SIZE']
+    records, pauses = archivable_records(cutoff)
+    if dry_run:
+        return records.count(), pauses.count()
+    return (
+        _move(records, ArchivedTimeRecord, TIME_RECORD_FIELDS, batch_size),
+        _move(pauses, ArchivedPauseRecord, PAUSE_RECORD_FIELDS, batch_size),
+    )
+
+
+def wants_archived(request):
+    return request.query_params.get('include_archived', '').lower() in ('1', 'true', 'yes')
+
+
+class CombinedRecords:
+    """
+    Live and archived rows read as one set, for LeanSerializer and reports.
+
+    Only ``values_list()`` is offered: the two querysets are unioned and
+    ordered by ``ordering``, which may name fields that are not selected.
+    """
+
+    def __init__(self, live, archived, ordering):
+        self.live = live
+        self.archived = archived
+        self.ordering = ordering
+
+    def values_list(self, *fields):
+        # Ordering columns ride along at the end; LeanSerializer zips them away
+        columns = [*fields, *(field.lstrip('-') for field in self.ordering if field.lstrip('-') not in fields)]
+        return (
+            self.live.order_by().values_list(*columns)
+            .union(self.archived.order_by().values_list(*columns), all=True)
+            .order_by(*self.ordering)
+        )
+
+    def fingerprint(self, field='updated_at', extra=()):
+        """``queryset_fingerprint`` over both tables, in two queries."""
+        parts = [queryset_fingerprint(queryset, field, extra) for queryset in (self.live, self.archived)]
+        latest = [part[1] for part in parts if part[1] is not None]
+        extras = tuple(
+            max((value for value in values if value is not None), default=None)
+            for values in zip(*(part[2] for part in parts))
+        )
+        return sum(part[0] for part in parts), max(latest, default=None), extras
@@ -0,0 +1,206 @@
+"""
+Audit trail of clock records edited through the admin.
+
+Saving or deleting a time or pause record in the admin diffs the tracked
+fields against the stored row and, once the transaction commits, queues a
+ClockAuditEntry. A background thread inserts queued entries with one
+bulk_create every CLOCK_AUDIT['FLUSH_SECONDS'], or as soon as FLUSH_SIZE are
+waiting, so the save path pays for one snapshot query and a list append.
+Entries still queued are written at interpreter exit; a worker that is killed
+outright loses at most one interval. With ASYNC off, entries are written as
+the edit commits.
+
+A batch the database refuses is retried one entry at a time, and an entry
+that still cannot be stored is logged and dropped, so it cannot hold up the
+rest. While the database is unreachable entries stay queued, up to
+MAX_BUFFER; beyond that the oldest are logged and dropped.
+
+Reconciliation and offline sync write their entries in their own bulk_create.
+"""
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import DatabaseError, DataError, IntegrityError, close_old_connections, transaction
+
+from Attendance_Backend.sitetime import site_date, user_site
+from .models import ClockAuditEntry, PauseRecord, TimeRecord
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFIG = {
+    'ASYNC': True,
+    'FLUSH_SECONDS': 2,
+    'FLUSH_SIZE': 100,
+    'MAX_BUFFER': 10000,
+}
+
+RECORD_TYPES = {
+    TimeRecord: ClockAuditEntry.TIME_RECORD,
+    PauseRecord: ClockAuditEntry.PAUSE_RECORD,
+}
+TRACKED_FIELDS = {
+    TimeRecord: ('date', 'check_in', 'check_out', 'hours_worked', 'total_paused_time'),
+    PauseRecord: ('reason', 'pause_time', 'resume_time', 'duration'),
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'CLOCK_AUDIT', {})}
+
+
+class AuditWriter:
+    """Queues ClockAuditEntry rows and inserts them in batches from a daemon thread."""
+
+    def __init__(self):
+        self._entries = []
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def add(self, entry):
+        config = get_config()
+        with self._lock:
+            self._entries.append(entry)
+            self._trim(config)
+            pending = len(self._entries)
+        if not config['ASYNC']:
+            try:
+                self.flush()
+            except DatabaseError:
+                logger.exception("Writing clock audit entries failed; they stay queued.")
+            return
+        self._start()
+        if pending >= config['FLUSH_SIZE']:
+            self._wake.set()
+
+    def pending(self):
+        with self._lock:
+            return len(self._entries)
+
+    def flush(self):
+        """
+        Insert every queued entry; return how many were written. Raises
+        DatabaseError, with the unwritten entries queued again, when the
+        database cannot be reached.
+        """
+        with self._lock:
+            entries, self._entries = self._entries, []
+        if not entries:
+            return 0
+        try:
+            # Savepoints, so a refused insert leaves any enclosing transaction usable
+            with transaction.atomic():
+                ClockAuditEntry.objects.bulk_create(entries)
+            return len(entries)
+        except (IntegrityError, DataError):
+            pass  # one bad entry refuses the whole batch: find it below
+        except DatabaseError:
+            self._requeue(entries)
+            raise
+
+        written = 0
+        for index, entry in enumerate(entries):
+            try:
+                with transaction.atomic():
+                    ClockAuditEntry.objects.bulk_create([entry])
+            except (IntegrityError, DataError):
+                logger.exception("Dropping a clock audit entry that cannot be stored: %s", describe(entry))
+            except DatabaseError:
+                self._requeue(entries[index:])
+                raise
+            else:
+                written += 1
+        return written
+
+    def _requeue(self, entries):
+        with self._lock:
+            self._entries[:0] = entries
+            self._trim(get_config())
+
+    def _trim(self, config):
+        # Called with the lock held
+        overflow = len(self._entries) - config['MAX_BUFFER']
+        if overflow > 0:
+            for entry in self._entries[:overflow]:
+                logger.error("Clock audit buffer is full; dropping %s", describe(entry))
+            del self._entries[:overflow]
+
+    def _start(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name='clock-audit-writer', daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            self._wake.wait(get_config()['FLUSH_SECONDS'])
+            self._wake.clear()
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("Writing clock audit entries failed; retrying on the next flush.")
+
+
+writer = AuditWriter()
+
+
+@atexit.register
+def _flush_at_exit():
+    try:
+        writer.flush()
+    except Exception:
+        logger.exception("Clock audit entries could not be written at exit.")
+
+
+def describe(entry):
+    return (
+        f"{entry.action} of {entry.get_record_type_display().lower()} #{entry.record_id} "
+        f"(user {entry.user_id}, {entry.date}) by {entry.actor_id}: {entry.changes!r}"
+    )
+
+
+def normalized(model, values):
+    # save() leaves floats where the column holds Decimals (hours_worked);
+    # compare and store what the field itself would make of each value
+    return {field: model._meta.get_field(field).to_python(value) for field, value in values.items()}
+
+
+def tracked_values(record):
+    return normalized(type(record), {field: getattr(record, field) for field in TRACKED_FIELDS[type(record)]})
+
+
+def stored_values(record):
+    """Tracked fields of ``record`` as currently stored, or {} for a new row."""
+    if record.pk is None:
+        return {}
+    fields = TRACKED_FIELDS[type(record)]
+    stored = type(record).objects.filter(pk=record.pk).values(*fields).first()
+    return normalized(type(record), stored) if stored else {}
+
+
+def record_date(record):
+    return record.date if isinstance(record, TimeRecord) else site_date(record.pause_time, user_site(record.user_id))
+
+
+def log_change(record, action, before, after, actor=None):
+    """Queue an entry for the tracked fields that differ between ``before`` and ``after``."""
+    changes = {
+        field: [before.get(field), after.get(field)]
+        for field in TRACKED_FIELDS[type(record)]
+        if before.get(field) != after.get(field)
+    }
+    if not changes:
+        return
+    entry = ClockAuditEntry(
+        user_id=record.user_id,
+        date=record_date(record),
+        record_type=RECORD_TYPES[type(record)],
+        record_id=record.pk,
+        action=action,
+        changes=changes,
+        actor=actor,
+    )
+    transaction.on_commit(lambda: writer.add(entry))
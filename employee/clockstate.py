@@ -0,0 +1,158 @@
+"""
+Current clock state per user and the supervisor live board built from it.
+
+Every clock transition goes through ``set_clock_state`` (or
+``refresh_clock_state`` when the new state has to be derived from records), so
+the board is one small query over ClockState. The rendered board is cached
+and dropped on every transition, so reads between clock events cost no query.
+Transitions are also published on the user's ``clock_channel`` once the
+transaction commits, for the clock-state stream (employee.streams).
+"""
+import uuid
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from Attendance_Backend.pubsub import get_broker
+from Attendance_Backend.sitetime import site_date, site_today, user_sites
+from .models import ClockState, PauseRecord, TimeRecord
+
+BOARD_CACHE_KEY = 'clock-board'
+# Boards are cached per site under the current version; a transition replaces
+# the version, which retires every cached board at once
+BOARD_VERSION_KEY = 'clock-board-version'
+# Transitions drop the cached board and a board from another day is rebuilt,
+# so the timeout is only a safety net
+BOARD_CACHE_TIMEOUT = 60
+
+BOARD_SECTIONS = {
+    ClockState.CHECKED_IN: 'checked_in',
+    ClockState.PAUSED: 'paused',
+    ClockState.CHECKED_OUT: 'checked_out',
+}
+UNASSIGNED = 'unassigned'
+
+
+def clock_channel(user_id):
+    return f'clock-state:{user_id}'
+
+
+def clock_message(user_id, status, since, reason=''):
+    return {'user': user_id, 'status': status, 'since': since, 'reason': reason}
+
+
+def publish_clock_state(user_id, status, since, reason=''):
+    message = clock_message(user_id, status, since, reason)
+    transaction.on_commit(lambda: get_broker().publish(clock_channel(user_id), message))
+
+
+def invalidate_clock_boards():
+    version = uuid.uuid4().hex
+    cache.set(BOARD_VERSION_KEY, version, None)
+    return version
+
+
+def set_clock_state(user_id, status, since, reason='', site=None):
+    ClockState.objects.update_or_create(
+        user_id=user_id,
+        defaults={'status': status, 'since': since, 'date': site_date(since, site), 'reason': reason},
+    )
+    invalidate_clock_boards()
+    publish_clock_state(user_id, status, since, reason)
+
+
+def refresh_clock_state(user_id):
+    """Derive the state from the user's latest time and pause records."""
+    record = TimeRecord.objects.filter(user_id=user_id).order_by('-date', '-check_in').first()
+    if record is None:
+        return
+    if record.check_out:
+        set_clock_state(user_id, ClockState.CHECKED_OUT, record.check_out)
+        return
+    pause = (
+        PauseRecord.objects.filter(user_id=user_id, resume_time__isnull=True, pause_time__gte=record.check_in)
+        .order_by('-pause_time').first()
+    )
+    if pause:
+        set_clock_state(user_id, ClockState.PAUSED, pause.pause_time, pause.reason)
+    else:
+        set_clock_state(user_id, ClockState.CHECKED_IN, record.check_in)
+
+
+def mark_checked_out(check_outs, sites=None):
+    """
+    Record ``{user_id: check_out}`` closures made in bulk by reconciliation;
+    ``sites`` maps users to their Location codes (looked up when omitted).
+
+    Only states still showing the closed shift change; a user who has clocked
+    in again since keeps their newer state.
+    """
+    states = list(
+        ClockState.objects.filter(user_id__in=check_outs)
+        .exclude(status=ClockState.CHECKED_OUT)
+    )
+    if sites is None:
+        sites = user_sites([state.user_id for state in states])
+    changed = []
+    for state in states:
+        check_out = check_outs[state.user_id]
+        if state.since <= check_out:
+            state.status, state.since, state.reason = ClockState.CHECKED_OUT, check_out, ''
+            state.date = site_date(check_out, sites.get(state.user_id))
+            state.updated_at = timezone.now()
+            changed.append(state)
+    ClockState.objects.bulk_update(changed, ['status', 'since', 'date', 'reason', 'updated_at'])
+    if changed:
+        invalidate_clock_boards()
+    for state in changed:
+        publish_clock_state(state.user_id, state.status, state.since)
+    return len(changed)
+
+
+def build_clock_board(site=None, today=None):
+    """
+    People on the clock (or done for ``today``) grouped by Location, for all
+    sites or only ``site`` (a Location code). People without settings are
+    listed last under "unassigned".
+    """
+    today = today or site_today(site)
+    states = ClockState.objects.filter(Q(status__in=[ClockState.CHECKED_IN, ClockState.PAUSED]) | Q(date=today))
+    if site is not None:
+        states = states.filter(user__settings__site_id=site)
+    rows = states.order_by('user__settings__site__name', 'user__name').values_list(
+        'user_id', 'user__name', 'user__settings__site_id', 'user__settings__site__name', 'status', 'since', 'reason',
+    )
+
+    locations = {}
+    for user_id, name, code, label, status, since, reason in rows:
+        code = code or UNASSIGNED
+        if code not in locations:
+            locations[code] = {
+                'location': code, 'label': label or 'Unassigned',
+                **{section: [] for section in BOARD_SECTIONS.values()},
+            }
+        entry = {'user': user_id, 'name': name, 'since': since}
+        if status == ClockState.PAUSED:
+            entry['reason'] = reason
+        locations[code][BOARD_SECTIONS[status]].append(entry)
+
+    if UNASSIGNED in locations:
+        locations[UNASSIGNED] = locations.pop(UNASSIGNED)
+    board = list(locations.values())
+    for location in board:
+        location['counts'] = {section: len(location[section]) for section in BOARD_SECTIONS.values()}
+    return {'date': today, 'generated_at': timezone.now(), 'locations': board}
+
+
+def get_clock_board(site=None):
+    version = cache.get(BOARD_VERSION_KEY)
+    if version is None:
+        version = invalidate_clock_boards()
+    key = f'{BOARD_CACHE_KEY}:{version}:{site or "all"}'
+    board = cache.get(key)
+    if board is None or board['date'] != site_today(site):
+        board = build_clock_board(site)
+        cache.set(key, board, BOARD_CACHE_TIMEOUT)
+    return board
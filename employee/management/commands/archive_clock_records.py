@@ -0,0 +1,30 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from employee.archive import archive_cutoff, archive_records
+
+
+class Command(BaseCommand):
+    help = (
+        "Move closed time and pause records older than the CLOCK_ARCHIVE "
+        "horizon to the archive tables, in batches. Meant to run nightly "
+        "from cron, after close_stale_clock_records."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--before', help="Archive days before this date (YYYY-MM-DD) instead of the horizon.")
+        parser.add_argument('--batch-size', type=int, help="Rows moved per transaction.")
+        parser.add_argument('--dry-run', action='store_true', help="Report what would be moved without moving it.")
+
+    def handle(self, *args, **options):
+        try:
+            cutoff = date.fromisoformat(options['before']) if options['before'] else archive_cutoff()
+        except ValueError:
+            raise CommandError("--before must be YYYY-MM-DD.")
+
+        records, pauses = archive_records(cutoff, batch_size=options['batch_size'], dry_run=options['dry_run'])
+        prefix = "Would archive" if options['dry_run'] else "Archived"
+        self.stdout.write(self.style.SUCCESS(
+            f"{prefix} {records} time record(s) and {pauses} pause(s) from before {cutoff:%Y-%m-%d}."
+        ))
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from employee.reconciliation import close_stale_records
+
+
+class Command(BaseCommand):
+    help = (
+        "Close shifts and pauses left open on previous days using the "
+        "CLOCK_RECONCILIATION policy. Meant to run nightly from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help="Report what would be closed without saving.")
+
+    def handle(self, *args, **options):
+        shifts, pauses = close_stale_records(dry_run=options['dry_run'])
+        prefix = "Would close" if options['dry_run'] else "Closed"
+        self.stdout.write(self.style.SUCCESS(f"{prefix} {shifts} open shift(s) and {pauses} open pause(s)."))
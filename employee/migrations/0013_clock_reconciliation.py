@@ -0,0 +1,54 @@
+# Generated by Django 5.2 on 2026-10-19 02:21
+
+import django.core.serializers.json
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee', '0012_timerecord_check_in_time'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClockAuditEntry',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('record_type', models.PositiveSmallIntegerField(choices=[(1, 'Time record'), (2, 'Pause record')])),
+                ('record_id', models.BigIntegerField()),
+                ('action', models.CharField(choices=[('auto_close', 'Closed by reconciliation')], max_length=16)),
+                ('changes', models.JSONField(encoder=django.core.serializers.json.DjangoJSONEncoder)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='pauserecord',
+            index=models.Index(condition=models.Q(('resume_time__isnull', True)), fields=['pause_time'], name='pauserecord_open_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='timerecord',
+            index=models.Index(condition=models.Q(('check_out__isnull', True)), fields=['date'], name='timerecord_open_idx'),
+        ),
+        migrations.AddField(
+            model_name='clockauditentry',
+            name='actor',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='clockauditentry',
+            name='user',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='clock_audit_entries', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddIndex(
+            model_name='clockauditentry',
+            index=models.Index(fields=['user', 'date'], name='clockaudit_user_date_idx'),
+        ),
+    ]
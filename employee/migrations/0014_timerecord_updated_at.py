@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-19 02:31
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee', '0013_clock_reconciliation'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='timerecord',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
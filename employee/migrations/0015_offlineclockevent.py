@@ -0,0 +1,36 @@
+# Generated by Django 5.2 on 2026-10-19 02:40
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee', '0014_timerecord_updated_at'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='clockauditentry',
+            name='action',
+            field=models.CharField(choices=[('auto_close', 'Closed by reconciliation'), ('offline_sync', 'Synced from offline device')], max_length=16),
+        ),
+        migrations.CreateModel(
+            name='OfflineClockEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_id', models.UUIDField(unique=True)),
+                ('event_type', models.CharField(choices=[('check_in', 'Check-in'), ('pause', 'Pause'), ('resume', 'Resume'), ('check_out', 'Check-out')], max_length=16)),
+                ('occurred_at', models.DateTimeField()),
+                ('status', models.CharField(choices=[('applied', 'Applied'), ('superseded', 'Superseded'), ('rejected', 'Rejected')], max_length=16)),
+                ('received_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='offline_clock_events', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['occurred_at'],
+            },
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 5.2 on 2026-10-19 02:42
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_open_shifts(apps, schema_editor):
+    """Seed states for users on the clock right now; everyone else starts without one."""
+    TimeRecord = apps.get_model('employee', 'TimeRecord')
+    PauseRecord = apps.get_model('employee', 'PauseRecord')
+    ClockState = apps.get_model('employee', 'ClockState')
+
+    open_pauses = {}
+    for user_id, pause_time, reason in (
+        PauseRecord.objects.filter(resume_time__isnull=True).order_by('pause_time')
+        .values_list('user_id', 'pause_time', 'reason')
+    ):
+        open_pauses[user_id] = (pause_time, reason)
+
+    states = {}
+    for user_id, check_in in (
+        TimeRecord.objects.filter(check_out__isnull=True).order_by('check_in').values_list('user_id', 'check_in')
+    ):
+        pause_time, reason = open_pauses.get(user_id, (None, ''))
+        if pause_time and pause_time >= check_in:
+            states[user_id] = ClockState(user_id=user_id, status='paused', since=pause_time, reason=reason,
+                                         date=timezone.localdate(pause_time))
+        else:
+            states[user_id] = ClockState(user_id=user_id, status='in', since=check_in,
+                                         date=timezone.localdate(check_in))
+    ClockState.objects.bulk_create(states.values(), batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_alter_userprofile_user'),
+        ('employee', '0015_offlineclockevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ClockState',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='clock_state', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('status', models.CharField(choices=[('in', 'Checked in'), ('paused', 'Paused'), ('out', 'Checked out')], max_length=8)),
+                ('since', models.DateTimeField()),
+                ('date', models.DateField()),
+                ('reason', models.CharField(blank=True, max_length=255)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_open_shifts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,51 @@
+# Generated by Django 5.2 on 2026-10-19 03:11
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee', '0016_clockstate'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ArchivedPauseRecord',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('reason', models.CharField(max_length=255)),
+                ('pause_time', models.DateTimeField()),
+                ('resume_time', models.DateTimeField()),
+                ('duration', models.DurationField(blank=True, null=True)),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_pause_records', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'pause_time'], name='archived_pause_user_time_idx')],
+            },
+        ),
+        migrations.CreateModel(
+            name='ArchivedTimeRecord',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('date', models.DateField()),
+                ('check_in', models.DateTimeField()),
+                ('check_in_time', models.TimeField(blank=True, null=True)),
+                ('check_out', models.DateTimeField()),
+                ('hours_worked', models.DecimalField(blank=True, decimal_places=2, max_digits=5, null=True)),
+                ('total_paused_time', models.FloatField(default=0)),
+                ('is_paused', models.BooleanField(default=False)),
+                ('updated_at', models.DateTimeField()),
+                ('archived_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='archived_time_records', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'ordering': ['-date', '-check_in'],
+                'indexes': [models.Index(fields=['user', 'date'], name='archived_time_user_date_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-19 03:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employee', '0017_archived_records'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='clockauditentry',
+            name='action',
+            field=models.CharField(choices=[('auto_close', 'Closed by reconciliation'), ('offline_sync', 'Synced from offline device'), ('admin_create', 'Created in the admin'), ('admin_edit', 'Edited in the admin'), ('admin_delete', 'Deleted in the admin')], max_length=16),
+        ),
+    ]
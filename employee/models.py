@@ -1,6 +1,9 @@
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth import get_user_model
+from django.core.serializers.json import DjangoJSONEncoder
 from django.core.exceptions import ValidationError
+import uuid
 from datetime import timedelta
 
 User = get_user_model()
@@ -24,11 +27,16 @@ class TimeRecord(models.Model):
     hours_worked = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True)
     total_paused_time = models.FloatField(default=0)  # in hours
     is_paused = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
 
 
     class Meta:
         unique_together = ('user', 'date')
         ordering = ['-date', '-check_in']
+        indexes = [
+            # Small partial index used to find shifts nobody checked out of
+            models.Index(fields=['date'], condition=Q(check_out__isnull=True), name='timerecord_open_idx'),
+        ]
 
     def clean(self):
         if self.check_out and self.check_out <= self.check_in:
@@ -74,6 +82,11 @@ class PauseRecord(models.Model):
     resume_time = models.DateTimeField(null=True, blank=True)
     duration = models.DurationField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=['pause_time'], condition=Q(resume_time__isnull=True), name='pauserecord_open_idx'),
+        ]
+
     def save(self, *args, **kwargs):
         if self.resume_time:
             self.duration = self.resume_time - self.pause_time
@@ -84,6 +97,195 @@ class PauseRecord(models.Model):
     def __str__(self):
         return f"{self.user.username} paused: {self.reason}"
 
+class ClockAuditEntry(models.Model):
+    """Append-only trail of changes made to time and pause records."""
+    TIME_RECORD = 1
+    PAUSE_RECORD = 2
+    RECORD_TYPE_CHOICES = [
+        (TIME_RECORD, 'Time record'),
+        (PAUSE_RECORD, 'Pause record'),
+    ]
+
+    AUTO_CLOSE = 'auto_close'
+    OFFLINE_SYNC = 'offline_sync'
+    ADMIN_CREATE = 'admin_create'
+    ADMIN_EDIT = 'admin_edit'
+    ADMIN_DELETE = 'admin_delete'
+    ACTION_CHOICES = [
+        (AUTO_CLOSE, 'Closed by reconciliation'),
+        (OFFLINE_SYNC, 'Synced from offline device'),
+        (ADMIN_CREATE, 'Created in the admin'),
+        (ADMIN_EDIT, 'Edited in the admin'),
+        (ADMIN_DELETE, 'Deleted in the admin'),
+    ]
+
+    # No database constraint and nothing done on delete: entries outlive the
+    # users they name, keeping the id, since deletes bypass save()/delete()
+    user = models.ForeignKey(
+        User, on_delete=models.DO_NOTHING, db_constraint=False, related_name='clock_audit_entries',
+    )
+    date = models.DateField()
+    record_type = models.PositiveSmallIntegerField(choices=RECORD_TYPE_CHOICES)
+    record_id = models.BigIntegerField()
+    action = models.CharField(max_length=16, choices=ACTION_CHOICES)
+    changes = models.JSONField(encoder=DjangoJSONEncoder)  # {"field": [old, new]}
+    actor = models.ForeignKey(
+        User, on_delete=models.DO_NOTHING, db_constraint=False, null=True, blank=True, related_name='+',
+    )
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['user', 'date'], name='clockaudit_user_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_action_display()} {self.get_record_type_display().lower()} #{self.record_id}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError("Clock audit entries are append-only.")
+        super().save(*args, **kwargs)
+
+    def delete(self, *args, **kwargs):
+        raise ValueError("Clock audit entries are append-only.")
+
+
+class ClockState(models.Model):
+    """
+    Current clock status per user, written by the clock views, offline sync and
+    reconciliation so the live board never has to scan time and pause records.
+    """
+    CHECKED_IN = 'in'
+    PAUSED = 'paused'
+    CHECKED_OUT = 'out'
+    STATUS_CHOICES = [
+        (CHECKED_IN, 'Checked in'),
+        (PAUSED, 'Paused'),
+        (CHECKED_OUT, 'Checked out'),
+    ]
+
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='clock_state')
+    status = models.CharField(max_length=8, choices=STATUS_CHOICES)
+    since = models.DateTimeField()
+    date = models.DateField()  # site date of ``since``
+    reason = models.CharField(max_length=255, blank=True)  # pause reason while paused
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.user_id}: {self.get_status_display()} since {self.since}"
+
+
+class OfflineSigningKey(models.Model):
+    """
+    A key issued to one device, on an authorized network, for signing the
+    clock events it records offline (see employee.offline).
+    """
+    key_id = models.UUIDField(default=uuid.uuid4, unique=True, editable=False)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='offline_signing_keys')
+    device = models.CharField(max_length=100, blank=True)
+    secret = models.CharField(max_length=64, editable=False)
+    issued_at = models.DateTimeField()
+    expires_at = models.DateTimeField()
+    revoked_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-issued_at']
+
+    def __str__(self):
+        return f"Offline key {self.key_id} for {self.user_id}"
+
+
+class OfflineClockEvent(models.Model):
+    """A clock event recorded by a device while offline, kept so resubmissions are skipped."""
+    CHECK_IN = 'check_in'
+    PAUSE = 'pause'
+    RESUME = 'resume'
+    CHECK_OUT = 'check_out'
+    TYPE_CHOICES = [
+        (CHECK_IN, 'Check-in'),
+        (PAUSE, 'Pause'),
+        (RESUME, 'Resume'),
+        (CHECK_OUT, 'Check-out'),
+    ]
+
+    APPLIED = 'applied'
+    SUPERSEDED = 'superseded'  # an existing row already had an earlier/later value
+    REJECTED = 'rejected'      # out of order for the user's records
+    STATUS_CHOICES = [
+        (APPLIED, 'Applied'),
+        (SUPERSEDED, 'Superseded'),
+        (REJECTED, 'Rejected'),
+    ]
+
+    event_id = models.UUIDField(unique=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='offline_clock_events')
+    event_type = models.CharField(max_length=16, choices=TYPE_CHOICES)
+    occurred_at = models.DateTimeField()
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES)
+    signing_key = models.ForeignKey(
+        OfflineSigningKey, on_delete=models.SET_NULL, null=True, blank=True, related_name='events',
+    )
+    received_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['occurred_at']
+
+    def __str__(self):
+        return f"{self.get_event_type_display()} by {self.user_id} at {self.occurred_at} ({self.status})"
+
+
+
+class ArchivedTimeRecord(models.Model):
+    """
+    A closed TimeRecord moved out of the live table (see employee.archive).
+
+    Keeps the original id, so audit entries still point at it, and the
+    original updated_at, so fingerprints over live and archived rows do not
+    change when rows move.
+    """
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_time_records')
+    date = models.DateField()
+    check_in = models.DateTimeField()
+    check_in_time = models.TimeField(null=True, blank=True)
+    check_out = models.DateTimeField()
+    hours_worked = models.DecimalField(max_digits=5, decimal_places=2, null=True, blank=True)
+    total_paused_time = models.FloatField(default=0)  # in hours
+    is_paused = models.BooleanField(default=False)
+    updated_at = models.DateTimeField()
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-date', '-check_in']
+        indexes = [
+            models.Index(fields=['user', 'date'], name='archived_time_user_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} - {self.date}: {self.hours_worked} hours (archived)"
+
+
+class ArchivedPauseRecord(models.Model):
+    """A resumed PauseRecord moved out of the live table, under its original id."""
+    id = models.BigIntegerField(primary_key=True)
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='archived_pause_records')
+    reason = models.CharField(max_length=255)
+    pause_time = models.DateTimeField()
+    resume_time = models.DateTimeField()
+    duration = models.DurationField(null=True, blank=True)
+    archived_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['user', 'pause_time'], name='archived_pause_user_time_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user.username} paused: {self.reason} (archived)"
+
+
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
@@ -0,0 +1,254 @@
+"""
+Ingestion of clock events buffered by a device while it was offline.
+
+While on an authorized network, a device is issued an OfflineSigningKey: a
+random secret stored on the server that expires after
+OFFLINE_SYNC['KEY_LIFETIME_HOURS'] and can be revoked in the admin. The device
+signs every event it records with HMAC-SHA256 over
+``"<id>|<type>|<epoch milliseconds>|<reason>"`` and sends the key's id with
+it. The signature stands in for the IP check the live clock views make, so
+only events timestamped between the key's issue and its expiry are accepted.
+
+Events are applied in time order in one transaction. When a row already
+exists, the earliest check-in and the latest check-out win, and a pause or
+resume that is already recorded is left alone. Every event is answered with
+its own status, and applied changes get a ClockAuditEntry. A batch that
+collides with a concurrent sync or live check-in is applied again against the
+rows now stored, up to SYNC_ATTEMPTS times.
+"""
+import hmac
+import secrets
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from Attendance_Backend.sitetime import site_date, site_dates, user_site
+from .models import ClockAuditEntry, OfflineClockEvent, OfflineSigningKey, PauseRecord, TimeRecord
+
+DEFAULT_CONFIG = {
+    'MAX_EVENTS': 500,          # per request
+    'MAX_AGE_DAYS': 7,          # older events are refused
+    'CLOCK_SKEW_SECONDS': 300,  # tolerated device clock drift into the future
+    'KEY_LIFETIME_HOURS': 24,
+    'SYNC_ATTEMPTS': 3,         # applies of a batch that keeps colliding with concurrent writes
+}
+
+DUPLICATE = 'duplicate'
+INVALID = 'invalid'
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'OFFLINE_SYNC', {})}
+
+
+def issue_signing_key(user, device='', now=None):
+    """Issue a new OfflineSigningKey to one of ``user``'s devices."""
+    now = now or timezone.now()
+    return OfflineSigningKey.objects.create(
+        user=user, device=device, secret=secrets.token_hex(32), issued_at=now,
+        expires_at=now + timedelta(hours=get_config()['KEY_LIFETIME_HOURS']),
+    )
+
+
+def event_message(event):
+    milliseconds = int(event['timestamp'].timestamp() * 1000)
+    return f"{event['id']}|{event['type']}|{milliseconds}|{event.get('reason', '')}"
+
+
+def sign_event(key, event):
+    return hmac.new(key.encode(), event_message(event).encode(), 'sha256').hexdigest()
+
+
+def check_event(key, event, now, config):
+    """Return why a validated event signed with ``key`` cannot be accepted, or None."""
+    if key is None:
+        return 'Unknown signing key.'
+    if key.revoked_at is not None:
+        return 'The signing key has been revoked.'
+    if not hmac.compare_digest(sign_event(key.secret, event), event['signature']):
+        return 'Invalid signature.'
+    if event['timestamp'] > now + timedelta(seconds=config['CLOCK_SKEW_SECONDS']):
+        return 'Timestamp is in the future.'
+    if not key.issued_at <= event['timestamp'] <= key.expires_at:
+        return 'Timestamp is outside the lifetime of its signing key.'
+    if event['timestamp'] < now - timedelta(days=config['MAX_AGE_DAYS']):
+        return f"Events older than {config['MAX_AGE_DAYS']} days are not accepted."
+    return None
+
+
+class OfflineSync:
+    """Applies one user's batch of validated, chronologically ordered events."""
+
+    def __init__(self, user):
+        self.user = user
+        self.site = user_site(user.pk)  # days are the user's site days
+        self.records = {}
+        self.dirty = {}
+        self.audit_entries = []
+
+    def audit(self, record_type, record, changes):
+        day = record.date if record_type == ClockAuditEntry.TIME_RECORD else site_date(record.pause_time, self.site)
+        self.audit_entries.append(ClockAuditEntry(
+            user=self.user, date=day, record_type=record_type, record_id=record.pk,
+            action=ClockAuditEntry.OFFLINE_SYNC, changes=changes, actor=self.user,
+        ))
+
+    def shift_for(self, moment):
+        return self.records.get(site_date(moment, self.site))
+
+    def mark_dirty(self, record):
+        self.dirty[record.pk] = record
+
+    def check_in(self, event):
+        moment = event['timestamp']
+        record = self.shift_for(moment)
+        if record is None:
+            record = TimeRecord.objects.create(user=self.user, date=site_date(moment, self.site), check_in=moment)
+            self.records[record.date] = record
+            self.audit(ClockAuditEntry.TIME_RECORD, record, {'check_in': [None, moment]})
+            return OfflineClockEvent.APPLIED, None
+        if moment >= record.check_in:
+            return OfflineClockEvent.SUPERSEDED, 'An earlier check-in is already recorded.'
+        if record.check_out and moment >= record.check_out:
+            return OfflineClockEvent.REJECTED, 'Check-in is after the recorded check-out.'
+        self.audit(ClockAuditEntry.TIME_RECORD, record, {'check_in': [record.check_in, moment]})
+        record.check_in = moment
+        self.mark_dirty(record)
+        return OfflineClockEvent.APPLIED, None
+
+    def check_out(self, event):
+        moment = event['timestamp']
+        record = self.shift_for(moment)
+        if record is None or moment <= record.check_in:
+            return OfflineClockEvent.REJECTED, 'No check-in before this check-out.'
+        if record.check_out and moment <= record.check_out:
+            return OfflineClockEvent.SUPERSEDED, 'A later check-out is already recorded.'
+        self.audit(ClockAuditEntry.TIME_RECORD, record, {'check_out': [record.check_out, moment]})
+        record.check_out = moment
+        self.mark_dirty(record)
+        return OfflineClockEvent.APPLIED, None
+
+    def pause(self, event):
+        moment = event['timestamp']
+        record = self.shift_for(moment)
+        if record is None or moment < record.check_in or (record.check_out and moment >= record.check_out):
+            return OfflineClockEvent.REJECTED, 'Pause is outside a recorded shift.'
+        # Only this shift's pauses: one left open on an earlier shift covers nothing here
+        paused = PauseRecord.objects.filter(
+            user=self.user, pause_time__gte=record.check_in, pause_time__lte=moment,
+        ).filter(Q(resume_time__isnull=True) | Q(resume_time__gt=moment))
+        if paused.exists():
+            return OfflineClockEvent.SUPERSEDED, 'A pause covering this time is already recorded.'
+
+        pause = PauseRecord.objects.create(user=self.user, reason=event.get('reason') or 'Offline pause')
+        # pause_time is auto_now_add, so the recorded time is written afterwards
+        PauseRecord.objects.filter(pk=pause.pk).update(pause_time=moment)
+        pause.pause_time = moment
+        self.audit(ClockAuditEntry.PAUSE_RECORD, pause, {'pause_time': [None, moment], 'reason': [None, pause.reason]})
+        self.mark_dirty(record)
+        return OfflineClockEvent.APPLIED, None
+
+    def resume(self, event):
+        moment = event['timestamp']
+        pause = PauseRecord.objects.filter(user=self.user, pause_time__lte=moment).order_by('-pause_time').first()
+        if pause is None:
+            return OfflineClockEvent.REJECTED, 'No pause before this resume.'
+        if pause.resume_time is not None:
+            return OfflineClockEvent.SUPERSEDED, 'This pause was already resumed.'
+        pause.resume_time = moment
+        pause.save()
+        self.audit(ClockAuditEntry.PAUSE_RECORD, pause, {'resume_time': [None, moment]})
+        record = self.shift_for(pause.pause_time)
+        if record is not None:
+            self.mark_dirty(record)
+        return OfflineClockEvent.APPLIED, None
+
+    def apply(self, events, keys):
+        """Apply ``events`` (signed with ``keys``, by key id) and return {event id: (status, detail)}."""
+        handlers = {
+            OfflineClockEvent.CHECK_IN: self.check_in,
+            OfflineClockEvent.PAUSE: self.pause,
+            OfflineClockEvent.RESUME: self.resume,
+            OfflineClockEvent.CHECK_OUT: self.check_out,
+        }
+        results = {}
+        with transaction.atomic():
+            days = set(site_dates([event['timestamp'] for event in events], self.site))
+            self.records = {
+                record.date: record
+                for record in TimeRecord.objects.select_for_update().filter(user=self.user, date__in=days)
+            }
+            stored = []
+            for event in events:
+                status, detail = handlers[event['type']](event)
+                results[event['id']] = (status, detail)
+                stored.append(OfflineClockEvent(
+                    event_id=event['id'], user=self.user, event_type=event['type'],
+                    occurred_at=event['timestamp'], status=status, signing_key=keys[event['key_id']],
+                ))
+
+            # save() recomputes hours from the final check-out and pauses
+            for record in self.dirty.values():
+                record.save()
+            OfflineClockEvent.objects.bulk_create(stored)
+            ClockAuditEntry.objects.bulk_create(self.audit_entries)
+        return results
+
+
+def synced_event_ids(events):
+    return set(
+        OfflineClockEvent.objects.filter(event_id__in=[event['id'] for event in events])
+        .values_list('event_id', flat=True)
+    )
+
+
+def sync_offline_events(user, events, now=None):
+    """
+    Apply a user's validated events; return one result dict per event, in order.
+
+    Events already synced are reported as duplicates, events failing
+    ``check_event`` as invalid; neither is applied or stored.
+    """
+    config = get_config()
+    now = now or timezone.now()
+    already_synced = synced_event_ids(events)
+    keys = {
+        key.key_id: key
+        for key in OfflineSigningKey.objects.filter(user=user, key_id__in={event['key_id'] for event in events})
+    }
+
+    outcomes = {}
+    accepted = []
+    for event in events:
+        if event['id'] in already_synced:
+            outcomes[event['id']] = (DUPLICATE, None)
+            continue
+        problem = check_event(keys.get(event['key_id']), event, now, config)
+        if problem:
+            outcomes[event['id']] = (INVALID, problem)
+        else:
+            outcomes[event['id']] = None
+            accepted.append(event)
+
+    remaining, attempts = accepted, config['SYNC_ATTEMPTS']
+    while remaining and attempts:
+        attempts -= 1
+        try:
+            outcomes.update(OfflineSync(user).apply(remaining, keys))
+            remaining = []
+        except IntegrityError:
+            # A concurrent resubmission stored some of these events first, or
+            # a live check-in created one of their days; the whole batch was
+            # rolled back, so apply the rest again against the stored rows
+            already_synced = synced_event_ids(remaining)
+            outcomes.update({event_id: (DUPLICATE, None) for event_id in already_synced})
+            remaining = [event for event in remaining if event['id'] not in already_synced]
+    for event in remaining:
+        outcomes[event['id']] = (OfflineClockEvent.REJECTED, 'Conflicted with concurrent clock changes; sync again.')
+    return [
+        {'id': str(event['id']), 'status': outcomes[event['id']][0], 'detail': outcomes[event['id']][1]}
+        for event in events
+    ]
@@ -0,0 +1,158 @@
+"""
+Closing of forgotten check-outs and resumes.
+
+Open shifts from earlier days are closed at the scheduled shift end (capped at
+MAX_SHIFT_HOURS), open pauses at the end of their shift. Days and shift ends
+are taken in the time zone of each user's site. Hours are recomputed
+from one grouped pause query and written with bulk_update, and every closed
+row gets a ClockAuditEntry.
+"""
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+from Attendance_Backend.sitetime import known_sites, site_date, site_zone, user_sites
+from .clockstate import mark_checked_out
+from .models import ClockAuditEntry, PauseRecord, TimeRecord
+
+DEFAULT_POLICY = {
+    'SHIFT_END': '17:00',
+    'MAX_SHIFT_HOURS': 12,
+    'BATCH_SIZE': 500,
+}
+
+
+def get_policy():
+    return {**DEFAULT_POLICY, **getattr(settings, 'CLOCK_RECONCILIATION', {})}
+
+
+def scheduled_close(day, policy, site=None):
+    return timezone.make_aware(datetime.combine(day, time.fromisoformat(policy['SHIFT_END'])), site_zone(site))
+
+
+def shift_close_time(record, policy, site=None):
+    close_at = max(scheduled_close(record.date, policy, site), record.check_in)
+    return min(close_at, record.check_in + timedelta(hours=policy['MAX_SHIFT_HOURS']))
+
+
+def _audit(record_type, record, day, field, new_value):
+    return ClockAuditEntry(
+        user_id=record.user_id,
+        date=day,
+        record_type=record_type,
+        record_id=record.pk,
+        action=ClockAuditEntry.AUTO_CLOSE,
+        changes={field: [None, new_value]},
+    )
+
+
+def _close_pauses(pauses, shift_ends, policy, sites):
+    entries = []
+    for pause in pauses:
+        site = sites[pause.user_id]
+        day = site_date(pause.pause_time, site)
+        resume_at = scheduled_close(day, policy, site)
+        check_out = shift_ends.get((pause.user_id, day))
+        if check_out and check_out > pause.pause_time:
+            resume_at = min(resume_at, check_out)
+        pause.resume_time = max(resume_at, pause.pause_time)
+        pause.duration = pause.resume_time - pause.pause_time
+        entries.append(_audit(ClockAuditEntry.PAUSE_RECORD, pause, day, 'resume_time', pause.resume_time))
+    return entries
+
+
+def _close_records(records, policy, sites):
+    if not records:
+        return []
+    for record in records:
+        record.check_out = shift_close_time(record, policy, sites[record.user_id])
+
+    # Same rule as TimeRecord.save(): completed pauses inside the shift count
+    pauses_by_user = defaultdict(list)
+    completed = PauseRecord.objects.filter(
+        user_id__in={record.user_id for record in records},
+        pause_time__gte=min(record.check_in for record in records),
+        resume_time__lte=max(record.check_out for record in records),
+        duration__isnull=False,
+    ).values_list('user_id', 'pause_time', 'resume_time', 'duration')
+    for user_id, pause_time, resume_time, duration in completed:
+        pauses_by_user[user_id].append((pause_time, resume_time, duration))
+
+    entries = []
+    modified = timezone.now()  # bulk_update does not apply auto_now
+    for record in records:
+        record.updated_at = modified
+        paused = sum(
+            (duration for pause_time, resume_time, duration in pauses_by_user[record.user_id]
+             if pause_time >= record.check_in and resume_time <= record.check_out),
+            timedelta(),
+        )
+        worked = (record.check_out - record.check_in - paused).total_seconds()
+        record.total_paused_time = round(paused.total_seconds() / 3600, 2)
+        record.hours_worked = round(max(worked / 3600, 0), 2)
+        record.is_paused = False
+        entries.append(_audit(ClockAuditEntry.TIME_RECORD, record, record.date, 'check_out', record.check_out))
+    return entries
+
+
+def close_stale_records(now=None, dry_run=False):
+    """
+    Close shifts and pauses left open before today (site time).
+
+    Returns (closed shifts, closed pauses). With ``dry_run`` the changes are
+    computed and counted but rolled back.
+    """
+    policy = get_policy()
+    now = now or timezone.now()
+    today = {site: site_date(now, site) for site in known_sites()}
+    start_of_today = {
+        site: timezone.make_aware(datetime.combine(day, time.min), site_zone(site)) for site, day in today.items()
+    }
+
+    with transaction.atomic():
+        # Rows open before the latest site's day began, then each against its own site's day
+        records = list(
+            TimeRecord.objects.select_for_update(skip_locked=True)
+            .filter(check_out__isnull=True, date__lt=max(today.values()))
+            .order_by()
+        )
+        pauses = list(
+            PauseRecord.objects.select_for_update(skip_locked=True)
+            .filter(resume_time__isnull=True, pause_time__lt=max(start_of_today.values()))
+            .order_by()
+        )
+        sites = user_sites({row.user_id for row in records + pauses})
+        records = [record for record in records if record.date < today[sites[record.user_id]]]
+        pauses = [pause for pause in pauses if pause.pause_time < start_of_today[sites[pause.user_id]]]
+
+        # Pauses end no later than the shift they belong to
+        shift_ends = {
+            (record.user_id, record.date): shift_close_time(record, policy, sites[record.user_id])
+            for record in records
+        }
+        if pauses:
+            closed_shifts = TimeRecord.objects.filter(
+                user_id__in={pause.user_id for pause in pauses},
+                date__in={site_date(pause.pause_time, sites[pause.user_id]) for pause in pauses},
+                check_out__isnull=False,
+            ).values_list('user_id', 'date', 'check_out')
+            for user_id, day, check_out in closed_shifts:
+                shift_ends[(user_id, day)] = check_out
+
+        entries = _close_pauses(pauses, shift_ends, policy, sites)
+        PauseRecord.objects.bulk_update(pauses, ['resume_time', 'duration'], batch_size=policy['BATCH_SIZE'])
+
+        entries += _close_records(records, policy, sites)
+        TimeRecord.objects.bulk_update(
+            records,
+            ['check_out', 'hours_worked', 'total_paused_time', 'is_paused', 'updated_at'],
+            batch_size=policy['BATCH_SIZE'],
+        )
+        ClockAuditEntry.objects.bulk_create(entries, batch_size=policy['BATCH_SIZE'])
+        mark_checked_out({record.user_id: record.check_out for record in records}, sites)
+
+        if dry_run:
+            transaction.set_rollback(True)
+
+    return len(records), len(pauses)
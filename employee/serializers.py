@@ -1,5 +1,7 @@
 from rest_framework import serializers
-from .models import TimeRecord, PauseRecord
+from Attendance_Backend.api.fieldsets import SparseFieldsetMixin
+from Attendance_Backend.api.lean import LeanSerializer
+from .models import ClockAuditEntry, OfflineClockEvent, TimeRecord, PauseRecord
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -12,7 +14,7 @@ class PauseRecordSerializer(serializers.ModelSerializer):
         fields = ['user', 'reason', 'pause_time']
         read_only_fields = ['pause_time']
 
-class TimeRecordSerializer(serializers.ModelSerializer):
+class TimeRecordSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     date = serializers.DateField(format='%m/%d/%Y', input_formats=['%m/%d/%Y', 'iso-8601'])
     check_in = serializers.DateTimeField(format='%I:%M %p', input_formats=['%I:%M %p', 'iso-8601'])
     check_out = serializers.DateTimeField(format='%I:%M %p', input_formats=['%I:%M %p', 'iso-8601'], required=False, allow_null=True)
@@ -59,3 +61,41 @@ class ResumeRecordSerializer(serializers.ModelSerializer):
         model = PauseRecord
         fields = ['id', 'user', 'resume_time']
         read_only_fields = ['user', 'resume_time']
+
+class TimeRecordLeanSerializer(LeanSerializer):
+    """Renders TimeRecordSerializer output straight from values() rows."""
+    serializer_class = TimeRecordSerializer
+    sources = {
+        'rate_per_hour': 'user__work_profile__rate_per_hour',
+        'biweekly_total_hours': 'user__work_profile__biweekly_total_hours',
+    }
+
+
+class ClockAuditEntrySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = ClockAuditEntry
+        fields = ['id', 'user', 'date', 'record_type', 'record_id', 'action', 'changes', 'actor', 'created_at']
+        read_only_fields = fields
+
+
+class OfflineClockEventSerializer(serializers.Serializer):
+    id = serializers.UUIDField()
+    type = serializers.ChoiceField(choices=OfflineClockEvent.TYPE_CHOICES)
+    timestamp = serializers.DateTimeField(input_formats=['iso-8601'])
+    reason = serializers.CharField(max_length=255, required=False, allow_blank=True, default='')
+    key_id = serializers.UUIDField()
+    signature = serializers.CharField(max_length=64)
+
+
+class OfflineSyncSerializer(serializers.Serializer):
+    events = OfflineClockEventSerializer(many=True, allow_empty=False)
+
+    def validate_events(self, events):
+        max_events = self.context['max_events']
+        if len(events) > max_events:
+            raise serializers.ValidationError(f"At most {max_events} events can be synced at once.")
+        if len({event['id'] for event in events}) != len(events):
+            raise serializers.ValidationError("Event ids must be unique.")
+        if any(later['timestamp'] < earlier['timestamp'] for earlier, later in zip(events, events[1:])):
+            raise serializers.ValidationError("Events must be in chronological order.")
+        return events
@@ -0,0 +1,105 @@
+"""
+Server-sent events stream of the authenticated user's clock state.
+
+GET /api/attendance/stream/ sends the current state as a ``state`` event, then
+one event per transition as it is published (see employee.clockstate), with a
+comment line every HEARTBEAT_SECONDS to keep proxies from closing the idle
+connection. EventSource cannot set headers, so the JWT access token may be
+passed as ``?token=``.
+
+An open stream costs a coroutine and a queue, not a thread or a query, when
+served by the ASGI app (Attendance_Backend.asgi). Under WSGI the stream
+degrades to a long-poll: the current state is sent and the response ends, and
+the client reconnects after the ``retry`` interval.
+"""
+import asyncio
+import json
+import time
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
+from rest_framework.exceptions import AuthenticationFailed
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import InvalidToken, TokenError
+
+from Attendance_Backend.pubsub import get_broker
+from .clockstate import clock_channel, clock_message
+from .models import ClockState
+
+DEFAULT_CONFIG = {
+    'HEARTBEAT_SECONDS': 15,
+    'MAX_SECONDS': 60 * 60,  # streams are closed after this; the client reconnects
+    'RETRY_MS': 3000,        # reconnect delay suggested to EventSource
+}
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'CLOCK_STREAM', {})}
+
+
+def format_event(data, event=None):
+    lines = [f'event: {event}'] if event else []
+    lines.append(f'data: {json.dumps(data, cls=DjangoJSONEncoder)}')
+    return '\n'.join(lines) + '\n\n'
+
+
+def authenticate(request):
+    """The user of the JWT in ``?token=`` or the Authorization header, or None."""
+    backend = JWTAuthentication()
+    try:
+        raw_token = request.GET.get('token')
+        if raw_token:
+            return backend.get_user(backend.get_validated_token(raw_token.encode()))
+        result = backend.authenticate(request)
+    except (AuthenticationFailed, InvalidToken, TokenError):
+        return None
+    return result[0] if result else None
+
+
+async def current_state(user):
+    state = await ClockState.objects.filter(user=user).afirst()
+    if state is None:
+        return clock_message(user.pk, None, None)
+    return clock_message(user.pk, state.status, state.since, state.reason)
+
+
+def retry_hint(config):
+    return f"retry: {config['RETRY_MS']}\n\n"
+
+
+async def clock_events(user, config):
+    yield retry_hint(config)
+    deadline = time.monotonic() + config['MAX_SECONDS']
+    async with get_broker().subscribe(clock_channel(user.pk)) as queue:
+        # Subscribed before reading the state, so no transition falls in between
+        yield format_event(await current_state(user), 'state')
+        while (remaining := deadline - time.monotonic()) > 0:
+            try:
+                message = await asyncio.wait_for(queue.get(), min(config['HEARTBEAT_SECONDS'], remaining))
+            except asyncio.TimeoutError:
+                message = None
+            yield ': keepalive\n\n' if message is None else format_event(message, 'transition')
+
+
+@require_GET
+async def clock_state_stream(request):
+    user = await sync_to_async(authenticate)(request)
+    if user is None and hasattr(request, 'auser'):  # session login; absent in the API-only profile
+        user = await request.auser()
+    if user is None or not user.is_authenticated:
+        return JsonResponse({'detail': 'Authentication credentials were not provided.'}, status=401)
+
+    config = get_config()
+    if isinstance(request, ASGIRequest):
+        events = clock_events(user, config)
+    else:
+        # A WSGI worker would be held for the whole stream
+        events = [retry_hint(config), format_event(await current_state(user), 'state')]
+    response = StreamingHttpResponse(events, content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # nginx would otherwise hold events back
+    return response
@@ -1,3 +1,699 @@
-from django.test import TestCase
+import uuid
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest import mock
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test import RequestFactory, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+from rest_framework_simplejwt.tokens import AccessToken
+from Attendance_Backend.api.idempotency import idempotency_cache_key
+from Attendance_Backend.pubsub import get_broker
+from settings.models import UserSettings
+from django.contrib.admin.sites import site as admin_site
+from . import audit
+from .admin import user_summaries
+from .archive import archive_records
+from .clockstate import clock_channel, set_clock_state
+from .models import (
+    ArchivedPauseRecord, ArchivedTimeRecord, ClockAuditEntry, ClockState, OfflineClockEvent, OfflineSigningKey,
+    PauseRecord, TimeRecord,
+)
+from . import offline
+from .offline import issue_signing_key, sign_event
+from .reconciliation import close_stale_records
+from .views import CheckInView
 
-# Create your tests here.
+User = get_user_model()
+
+
+class TimeRecordAdminTest(TestCase):
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(name="Admin", email="admin@example.com", password="pa$$w0rd!")
+        self.client.force_login(self.admin)
+
+    def add_records(self, users, days):
+        for index in range(users):
+            user = User.objects.create_user(name=f"User {index}", email=f"user{index}@example.com", password=None)
+            for day in range(days):
+                check_in = timezone.make_aware(datetime(2026, 3, 2 + day, 8, 0))
+                TimeRecord.objects.create(
+                    user=user, date=check_in.date(), check_in=check_in,
+                    check_out=check_in + timedelta(hours=8),
+                )
+
+    def changelist_queries(self, **params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get("/admin/employee/timerecord/", params)
+        self.assertEqual(response.status_code, 200)
+        return len(queries), response
+
+    def test_changelist_queries_do_not_grow_with_rows(self):
+        self.add_records(users=2, days=2)
+        few, _ = self.changelist_queries()
+
+        for index in range(2, 8):
+            user = User.objects.create_user(name=f"User {index}", email=f"user{index}@example.com", password=None)
+            check_in = timezone.make_aware(datetime(2026, 3, 10, 8, 0))
+            TimeRecord.objects.create(user=user, date=date(2026, 3, 10), check_in=check_in, check_out=check_in + timedelta(hours=4))
+        many, response = self.changelist_queries()
+
+        self.assertEqual(few, many)
+        self.assertContains(response, "<b>Hours:</b> 16.00h")
+
+    def test_user_filter(self):
+        self.add_records(users=2, days=1)
+        user = User.objects.get(email="user1@example.com")
+
+        _, response = self.changelist_queries(user=user.pk)
+
+        self.assertEqual(list(response.context["cl"].result_list), list(TimeRecord.objects.filter(user=user)))
+
+
+class CloseStaleRecordsTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        self.now = timezone.make_aware(datetime(2026, 3, 5, 9, 0))
+
+    def at(self, day, hour, minute=0):
+        return timezone.make_aware(datetime(2026, 3, day, hour, minute))
+
+    def add_pause(self, start, end=None):
+        pause = PauseRecord.objects.create(user=self.user, reason="Lunch")
+        PauseRecord.objects.filter(pk=pause.pk).update(
+            pause_time=start, resume_time=end, duration=(end - start) if end else None,
+        )
+        return pause
+
+    def test_closes_open_shift_at_shift_end_minus_pauses(self):
+        record = TimeRecord.objects.create(user=self.user, date=date(2026, 3, 3), check_in=self.at(3, 8))
+        self.add_pause(self.at(3, 12), self.at(3, 12, 30))
+
+        self.assertEqual(close_stale_records(now=self.now), (1, 0))
+
+        record.refresh_from_db()
+        self.assertEqual(record.check_out, self.at(3, 17))
+        self.assertEqual(float(record.hours_worked), 8.5)
+        self.assertEqual(record.total_paused_time, 0.5)
+        entry = ClockAuditEntry.objects.get(record_type=ClockAuditEntry.TIME_RECORD)
+        self.assertEqual((entry.record_id, entry.action), (record.pk, ClockAuditEntry.AUTO_CLOSE))
+
+    def test_open_pause_ends_at_check_out(self):
+        record = TimeRecord.objects.create(
+            user=self.user, date=date(2026, 3, 3), check_in=self.at(3, 8), check_out=self.at(3, 15),
+        )
+        pause = self.add_pause(self.at(3, 14))
+
+        self.assertEqual(close_stale_records(now=self.now), (0, 1))
+
+        pause.refresh_from_db()
+        self.assertEqual(pause.resume_time, record.check_out)
+        self.assertEqual(pause.duration, timedelta(hours=1))
+
+    def test_todays_records_and_dry_run_are_left_alone(self):
+        TimeRecord.objects.create(user=self.user, date=date(2026, 3, 5), check_in=self.at(5, 8))
+        TimeRecord.objects.create(user=self.user, date=date(2026, 3, 4), check_in=self.at(4, 8))
+
+        self.assertEqual(close_stale_records(now=self.now, dry_run=True), (1, 0))
+        self.assertEqual(TimeRecord.objects.filter(check_out__isnull=True).count(), 2)
+        self.assertFalse(ClockAuditEntry.objects.exists())
+
+
+
+class ArchiveTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        self.old = [
+            TimeRecord.objects.create(
+                user=self.user, date=date(2025, 1, day), check_in=self.at(2025, 1, day, 8),
+                check_out=self.at(2025, 1, day, 16),
+            )
+            for day in (6, 7, 8)
+        ]
+        self.forgotten = TimeRecord.objects.create(user=self.user, date=date(2025, 1, 9), check_in=self.at(2025, 1, 9, 8))
+        self.recent = TimeRecord.objects.create(
+            user=self.user, date=date(2026, 3, 2), check_in=self.at(2026, 3, 2, 8), check_out=self.at(2026, 3, 2, 16),
+        )
+        self.old_pause = PauseRecord.objects.create(user=self.user, reason="Lunch")
+        PauseRecord.objects.filter(pk=self.old_pause.pk).update(
+            pause_time=self.at(2025, 1, 6, 12), resume_time=self.at(2025, 1, 6, 12, 30), duration=timedelta(minutes=30),
+        )
+
+    def at(self, year, month, day, hour, minute=0):
+        return timezone.make_aware(datetime(year, month, day, hour, minute))
+
+    def test_moves_closed_old_rows_in_batches(self):
+        out = StringIO()
+        call_command("archive_clock_records", "--before", "2026-01-01", "--dry-run", stdout=out)
+        self.assertIn("Would archive 3 time record(s) and 1 pause(s) from before 2026-01-01.", out.getvalue())
+        self.assertEqual(TimeRecord.objects.count(), 5)
+
+        self.assertEqual(archive_records(date(2026, 1, 1), batch_size=2), (3, 1))
+
+        self.assertEqual(set(TimeRecord.objects.values_list("pk", flat=True)), {self.forgotten.pk, self.recent.pk})
+        self.assertEqual(
+            set(ArchivedTimeRecord.objects.values_list("pk", flat=True)), {record.pk for record in self.old},
+        )
+        archived = ArchivedTimeRecord.objects.get(pk=self.old[0].pk)
+        self.assertEqual((archived.check_out, archived.updated_at), (self.old[0].check_out, self.old[0].updated_at))
+        self.assertEqual(ArchivedPauseRecord.objects.get(pk=self.old_pause.pk).duration, timedelta(minutes=30))
+        self.assertFalse(PauseRecord.objects.exists())
+
+    def test_totals_are_unchanged(self):
+        before = user_summaries([self.user.pk])
+
+        archive_records(date(2026, 1, 1))
+
+        self.assertEqual(user_summaries([self.user.pk]), before)
+        self.assertEqual(before[self.user.pk]["days_worked"], 5)
+
+    def test_history_includes_archived_on_request(self):
+        self.client.force_authenticate(user=self.user)
+        url = reverse("time-history")
+        combined = self.client.get(url, {"include_archived": "1"})
+
+        archive_records(date(2026, 1, 1))
+        live = self.client.get(url)
+        archived = self.client.get(url, {"include_archived": "1", "fields": "id"})
+        not_modified = self.client.get(url, {"include_archived": "1"}, HTTP_IF_NONE_MATCH=combined["ETag"])
+
+        self.assertEqual([row["id"] for row in live.json()], [self.recent.pk, self.forgotten.pk])
+        self.assertEqual(
+            archived.json(),
+            [{"id": pk} for pk in (self.recent.pk, self.forgotten.pk, *(record.pk for record in reversed(self.old)))],
+        )
+        # Moving rows changes neither the combined rows nor their ETag
+        self.assertEqual(not_modified.status_code, 304)
+
+    def test_archive_admin_is_read_only(self):
+        archive_records(date(2026, 1, 1))
+        admin = User.objects.create_superuser(name="Admin", email="admin@example.com", password=None)
+        self.client.force_login(admin)
+        url = f"/admin/employee/archivedtimerecord/{self.old[0].pk}/delete/"
+
+        self.assertEqual(self.client.post(url, {"post": "yes"}).status_code, 403)
+        self.assertTrue(ArchivedTimeRecord.objects.filter(pk=self.old[0].pk).exists())
+
+@override_settings(CLOCK_AUDIT={"ASYNC": False})
+class ClockAuditTest(APITestCase):
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(name="Admin", email="admin@example.com", password=None)
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        self.check_in = timezone.make_aware(datetime(2026, 3, 2, 8, 0))
+        self.record = TimeRecord.objects.create(
+            user=self.user, date=date(2026, 3, 2), check_in=self.check_in, check_out=self.check_in + timedelta(hours=8),
+        )
+        self.request = RequestFactory().post("/admin/")
+        self.request.user = self.admin
+
+    def test_admin_edit_records_changed_fields(self):
+        model_admin = admin_site._registry[TimeRecord]
+        record = TimeRecord.objects.get(pk=self.record.pk)
+        record.check_out = self.check_in + timedelta(hours=6)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            model_admin.save_model(self.request, record, form=None, change=True)
+
+        entry = ClockAuditEntry.objects.get()
+        self.assertEqual(
+            (entry.user, entry.date, entry.record_type, entry.record_id, entry.action, entry.actor),
+            (self.user, date(2026, 3, 2), ClockAuditEntry.TIME_RECORD, record.pk, ClockAuditEntry.ADMIN_EDIT, self.admin),
+        )
+        self.assertEqual(set(entry.changes), {"check_out", "hours_worked"})
+        self.assertEqual(entry.changes["check_out"][1], (self.check_in + timedelta(hours=6)).isoformat())
+
+    def test_unchanged_save_with_paused_time_is_not_recorded(self):
+        PauseRecord.objects.create(user=self.user, reason="Lunch")
+        PauseRecord.objects.filter(user=self.user).update(
+            pause_time=self.check_in + timedelta(hours=3), resume_time=self.check_in + timedelta(hours=3, minutes=40),
+            duration=timedelta(minutes=40),
+        )
+        self.record.save()  # hours_worked 7.33, which a float cannot hold exactly
+        model_admin = admin_site._registry[TimeRecord]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            model_admin.save_model(self.request, TimeRecord.objects.get(pk=self.record.pk), form=None, change=True)
+
+        self.assertEqual(TimeRecord.objects.get(pk=self.record.pk).hours_worked, Decimal("7.33"))
+        self.assertFalse(ClockAuditEntry.objects.exists())
+
+    def test_unchanged_save_and_rolled_back_edit_are_not_recorded(self):
+        model_admin = admin_site._registry[TimeRecord]
+        with self.captureOnCommitCallbacks(execute=True):
+            model_admin.save_model(self.request, TimeRecord.objects.get(pk=self.record.pk), form=None, change=True)
+        with self.captureOnCommitCallbacks(execute=False) as callbacks:
+            record = TimeRecord.objects.get(pk=self.record.pk)
+            record.check_out = None
+            model_admin.save_model(self.request, record, form=None, change=True)
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertFalse(ClockAuditEntry.objects.exists())
+
+    def test_admin_delete_keeps_the_old_values(self):
+        pause = PauseRecord.objects.create(user=self.user, reason="Lunch")
+        model_admin = admin_site._registry[PauseRecord]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            model_admin.delete_queryset(self.request, PauseRecord.objects.filter(pk=pause.pk))
+            model_admin.delete_model(self.request, TimeRecord.objects.get(pk=self.record.pk))
+
+        entries = {entry.record_type: entry for entry in ClockAuditEntry.objects.all()}
+        self.assertEqual(entries[ClockAuditEntry.PAUSE_RECORD].record_id, pause.pk)
+        self.assertEqual(entries[ClockAuditEntry.PAUSE_RECORD].changes["reason"], ["Lunch", None])
+        self.assertEqual(entries[ClockAuditEntry.TIME_RECORD].action, ClockAuditEntry.ADMIN_DELETE)
+        self.assertFalse(TimeRecord.objects.exists())
+
+    def test_entries_are_append_only(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            audit.log_change(self.record, ClockAuditEntry.ADMIN_EDIT, {"check_out": None}, audit.tracked_values(self.record))
+        entry = ClockAuditEntry.objects.get()
+
+        with self.assertRaises(ValueError):
+            entry.save()
+        with self.assertRaises(ValueError):
+            entry.delete()
+
+    def entry(self, **fields):
+        return ClockAuditEntry(**{
+            "user": self.user, "date": self.record.date, "record_type": ClockAuditEntry.TIME_RECORD,
+            "record_id": self.record.pk, "action": ClockAuditEntry.ADMIN_EDIT, "changes": {}, **fields,
+        })
+
+    @override_settings(CLOCK_AUDIT={"ASYNC": True, "FLUSH_SIZE": 2})
+    def test_async_writer_buffers_until_flushed(self):
+        writer = audit.AuditWriter()
+        with mock.patch.object(writer, "_start"):
+            writer.add(self.entry())
+            self.assertEqual((writer.pending(), ClockAuditEntry.objects.count()), (1, 0))
+            self.assertFalse(writer._wake.is_set())
+            writer.add(self.entry())
+        self.assertTrue(writer._wake.is_set())
+
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(writer.flush(), 2)
+        self.assertEqual(sum(query["sql"].startswith("INSERT") for query in queries), 1)
+        self.assertEqual((writer.pending(), ClockAuditEntry.objects.count()), (0, 2))
+
+    @override_settings(CLOCK_AUDIT={"ASYNC": True})
+    def test_entry_that_cannot_be_stored_does_not_block_the_rest(self):
+        writer = audit.AuditWriter()
+        with mock.patch.object(writer, "_start"):
+            for record_id in (1, 2, 3):
+                writer.add(self.entry(record_id=record_id, date=None if record_id == 2 else self.record.date))
+
+        with self.assertLogs("employee.audit", "ERROR"):
+            self.assertEqual(writer.flush(), 2)
+
+        self.assertEqual(writer.pending(), 0)
+        self.assertEqual(sorted(ClockAuditEntry.objects.values_list("record_id", flat=True)), [1, 3])
+
+    @override_settings(CLOCK_AUDIT={"ASYNC": True, "MAX_BUFFER": 2})
+    def test_buffer_drops_the_oldest_entries_when_full(self):
+        writer = audit.AuditWriter()
+        with mock.patch.object(writer, "_start"), self.assertLogs("employee.audit", "ERROR"):
+            for record_id in (1, 2, 3):
+                writer.add(self.entry(record_id=record_id))
+
+        self.assertEqual(writer.flush(), 2)
+        self.assertEqual(sorted(ClockAuditEntry.objects.values_list("record_id", flat=True)), [2, 3])
+
+    def test_trail_survives_deleting_the_user(self):
+        ClockAuditEntry.objects.bulk_create([self.entry(actor=self.admin)])
+        user_id = self.user.pk
+
+        self.user.delete()
+
+        entry = ClockAuditEntry.objects.get()
+        self.assertEqual((entry.user_id, entry.actor_id), (user_id, self.admin.pk))
+        self.client.force_login(self.admin)
+        self.assertContains(self.client.get("/admin/employee/clockauditentry/"), f"Deleted user #{user_id}")
+
+    def test_log_api_filters_by_user_and_date(self):
+        other = User.objects.create_user(name="Jane Roe", email="jroe@gmail.com", password=None)
+        for user, day in ((self.user, date(2026, 3, 2)), (self.user, date(2026, 3, 9)), (other, date(2026, 3, 2))):
+            ClockAuditEntry.objects.create(
+                user=user, date=day, record_type=ClockAuditEntry.TIME_RECORD, record_id=1,
+                action=ClockAuditEntry.ADMIN_EDIT, changes={"check_out": [None, "2026-03-02T16:00:00Z"]},
+                actor=self.admin,
+            )
+        url = reverse("clock-audit")
+
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.client.force_authenticate(user=self.admin)
+        response = self.client.get(url, {"user": self.user.pk, "start": "2026-03-01", "end": "2026-03-05"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([(row["user"], row["date"]) for row in response.json()], [(self.user.pk, "03/02/2026")])
+        self.assertEqual(self.client.get(url, {"start": "March 1"}).status_code, 400)
+
+
+class IdempotencyKeyTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        self.client.force_authenticate(user=self.user)
+
+    def post(self, name, key, data=None):
+        return self.client.post(reverse(name), data or {}, format="json", HTTP_IDEMPOTENCY_KEY=key)
+
+    def test_retried_check_in_replays_first_response(self):
+        first = self.post("checkin", "key-1")
+
+        with self.assertNumQueries(0):
+            retry = self.post("checkin", "key-1")
+
+        self.assertEqual(first.status_code, 201)
+        self.assertEqual((retry.status_code, retry.json()), (201, first.json()))
+        self.assertEqual(retry["Idempotent-Replayed"], "true")
+        self.assertEqual(TimeRecord.objects.filter(user=self.user).count(), 1)
+
+    def test_new_key_runs_the_view_again(self):
+        self.post("checkin", "key-1")
+
+        response = self.post("checkin", "key-2")
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_key_reused_with_different_body(self):
+        pause = {"user": self.user.pk, "reason": "Lunch", "pause_time": "12:00 PM"}
+        self.assertEqual(self.post("pause", "key-1", pause).status_code, 201)
+
+        response = self.post("pause", "key-1", {**pause, "reason": "Break"})
+
+        self.assertEqual(response.status_code, 422)
+        self.assertEqual(PauseRecord.objects.filter(user=self.user).count(), 1)
+
+    def test_errors_are_not_replayed(self):
+        self.assertEqual(self.post("resume", "key-1").status_code, 400)
+        PauseRecord.objects.create(user=self.user, reason="Lunch")
+
+        self.assertEqual(self.post("resume", "key-1").status_code, 200)
+
+    def test_retry_while_first_request_is_running(self):
+        request = RequestFactory().post("/")
+        request.user = self.user
+        cache.add(idempotency_cache_key(request, CheckInView(), "key-1") + ":lock", True)
+
+        response = self.post("checkin", "key-1")
+
+        self.assertEqual(response.status_code, 409)
+        self.assertFalse(TimeRecord.objects.exists())
+
+
+class OfflineSyncTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        self.client.force_authenticate(user=self.user)
+        self.day = timezone.localdate() - timedelta(days=1)
+        self.url = reverse("offline-sync")
+        self.key = issue_signing_key(self.user, device="tablet", now=self.at(0))
+
+    def at(self, hour, minute=0):
+        return timezone.make_aware(datetime.combine(self.day, time(hour, minute)))
+
+    def event(self, event_type, moment, reason="", key=None, secret=None):
+        key = key or self.key
+        event = {"id": uuid.uuid4(), "type": event_type, "timestamp": moment, "reason": reason}
+        signature = sign_event(secret or key.secret, event)
+        return {
+            **event, "id": str(event["id"]), "timestamp": moment.isoformat(), "key_id": str(key.key_id),
+            "signature": signature,
+        }
+
+    def sync(self, *events):
+        return self.client.post(self.url, {"events": list(events)}, format="json")
+
+    def statuses(self, response):
+        return [result["status"] for result in response.json()["results"]]
+
+    def test_day_recorded_offline(self):
+        response = self.sync(
+            self.event("check_in", self.at(8)),
+            self.event("pause", self.at(12), reason="Lunch"),
+            self.event("resume", self.at(12, 30)),
+            self.event("check_out", self.at(16, 30)),
+        )
+
+        self.assertEqual(self.statuses(response), ["applied"] * 4)
+        record = TimeRecord.objects.get(user=self.user, date=self.day)
+        self.assertEqual((record.check_in, record.check_out), (self.at(8), self.at(16, 30)))
+        self.assertEqual((record.hours_worked, record.total_paused_time), (Decimal("8.00"), 0.5))
+        pause = PauseRecord.objects.get(user=self.user)
+        self.assertEqual((pause.pause_time, pause.reason, pause.duration), (self.at(12), "Lunch", timedelta(minutes=30)))
+        self.assertEqual(ClockAuditEntry.objects.filter(action=ClockAuditEntry.OFFLINE_SYNC).count(), 4)
+
+    def test_resubmitted_events_are_duplicates(self):
+        events = [self.event("check_in", self.at(8)), self.event("check_out", self.at(16))]
+        self.sync(*events)
+
+        response = self.sync(*events)
+
+        self.assertEqual(self.statuses(response), ["duplicate", "duplicate"])
+        self.assertEqual(TimeRecord.objects.count(), 1)
+        self.assertEqual(OfflineClockEvent.objects.count(), 2)
+
+    def test_earliest_check_in_and_latest_check_out_win(self):
+        TimeRecord.objects.create(user=self.user, date=self.day, check_in=self.at(8, 10), check_out=self.at(16))
+
+        response = self.sync(self.event("check_in", self.at(8)), self.event("check_out", self.at(15)))
+
+        self.assertEqual(self.statuses(response), ["applied", "superseded"])
+        record = TimeRecord.objects.get(user=self.user, date=self.day)
+        self.assertEqual((record.check_in, record.check_out, record.hours_worked), (self.at(8), self.at(16), Decimal("8.00")))
+
+    def test_out_of_order_events_are_rejected_individually(self):
+        response = self.sync(self.event("resume", self.at(9)), self.event("check_out", self.at(10)))
+
+        self.assertEqual(self.statuses(response), ["rejected", "rejected"])
+        self.assertFalse(TimeRecord.objects.exists())
+
+    def test_invalid_events(self):
+        response = self.sync(
+            self.event("check_in", self.at(8), secret="not-the-key"),
+            self.event("check_in", timezone.now() + timedelta(hours=1)),
+        )
+
+        self.assertEqual(self.statuses(response), ["invalid", "invalid"])
+        self.assertFalse(OfflineClockEvent.objects.exists())
+
+    def test_batch_must_be_chronological(self):
+        response = self.sync(self.event("check_out", self.at(16)), self.event("check_in", self.at(8)))
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_signing_key_needs_authorized_ip(self):
+        issued = self.client.get(self.url, {"device": "phone"}).json()
+
+        key = OfflineSigningKey.objects.get(key_id=issued["key_id"])
+        self.assertEqual((key.user, key.device, key.secret), (self.user, "phone", issued["signing_key"]))
+        self.assertNotEqual(key.secret, self.key.secret)
+        self.assertEqual(self.client.get(self.url, REMOTE_ADDR="10.1.2.3").status_code, 403)
+
+    def test_keys_only_sign_within_their_lifetime(self):
+        late_key = issue_signing_key(self.user, now=self.at(9))
+        revoked = issue_signing_key(self.user, now=self.at(0))
+        OfflineSigningKey.objects.filter(pk=revoked.pk).update(revoked_at=timezone.now())
+        other = User.objects.create_user(name="Jane Roe", email="jroe@gmail.com", password=None)
+
+        response = self.sync(
+            self.event("check_in", self.at(8), key=late_key),
+            self.event("check_in", self.at(8), key=revoked),
+            self.event("check_in", self.at(8), key=issue_signing_key(other, now=self.at(0))),
+            self.event("check_in", timezone.now() + timedelta(hours=1)),
+        )
+
+        self.assertEqual(self.statuses(response), ["invalid"] * 4)
+        self.assertEqual(
+            [result["detail"] for result in response.json()["results"]],
+            [
+                "Timestamp is outside the lifetime of its signing key.", "The signing key has been revoked.",
+                "Unknown signing key.", "Timestamp is in the future.",
+            ],
+        )
+        self.assertFalse(TimeRecord.objects.exists())
+
+    def test_pause_left_open_on_an_earlier_shift_does_not_cover_this_one(self):
+        PauseRecord.objects.create(user=self.user, reason="Forgotten")
+        PauseRecord.objects.filter(user=self.user).update(pause_time=self.at(12) - timedelta(days=2))
+
+        response = self.sync(
+            self.event("check_in", self.at(8)),
+            self.event("pause", self.at(12), reason="Lunch"),
+            self.event("resume", self.at(12, 30)),
+        )
+
+        self.assertEqual(self.statuses(response), ["applied"] * 3)
+
+    def test_concurrent_resubmission_is_reported_as_duplicate(self):
+        events = [self.event("check_in", self.at(8)), self.event("check_out", self.at(16))]
+        self.sync(*events)
+
+        # The second request checked for synced events before the first stored them
+        stale = mock.patch.object(
+            offline, "synced_event_ids", side_effect=[set(), {uuid.UUID(event["id"]) for event in events}],
+        )
+        with stale:
+            response = self.sync(*events)
+
+        self.assertEqual(self.statuses(response), ["duplicate", "duplicate"])
+        self.assertEqual(OfflineClockEvent.objects.count(), 2)
+
+    def test_live_check_in_during_sync_supersedes(self):
+        live = TimeRecord.objects.create(user=self.user, date=self.day, check_in=self.at(7))
+        real_shift_for = offline.OfflineSync.shift_for
+        calls = []
+
+        # The first attempt read the day before the live check-in was stored
+        def stale_once(sync, moment):
+            calls.append(moment)
+            return None if len(calls) == 1 else real_shift_for(sync, moment)
+
+        with mock.patch.object(offline.OfflineSync, "shift_for", autospec=True, side_effect=stale_once):
+            response = self.sync(self.event("check_in", self.at(8)), self.event("check_out", self.at(16)))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.statuses(response), ["superseded", "applied"])
+        live.refresh_from_db()
+        self.assertEqual((live.check_in, live.check_out), (self.at(7), self.at(16)))
+
+    @override_settings(OFFLINE_SYNC={"SYNC_ATTEMPTS": 2})
+    def test_persistent_conflict_is_rejected(self):
+        with mock.patch.object(offline.OfflineSync, "apply", side_effect=IntegrityError("user, date")) as apply:
+            response = self.sync(self.event("check_in", self.at(8)))
+
+        self.assertEqual(apply.call_count, 2)
+        self.assertEqual(self.statuses(response), ["rejected"])
+        self.assertFalse(OfflineClockEvent.objects.exists())
+
+
+class ClockBoardTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        UserSettings.objects.create(
+            user=self.user, street_address="1 Main St", city="Tempe", state="AZ", zip_code="85281",
+            manager_name="Maria", location="guadalupe_dtt",
+        )
+        self.supervisor = User.objects.create_superuser(name="Boss", email="boss@gmail.com", password=None)
+
+    def clock(self, name, data=None):
+        self.client.force_authenticate(user=self.user)
+        return self.client.post(reverse(name), data or {}, format="json")
+
+    def board(self):
+        self.client.force_authenticate(user=self.supervisor)
+        return self.client.get(reverse("clock-board")).json()["locations"]
+
+    def test_transitions_move_people_between_sections(self):
+        self.clock("checkin")
+        self.assertEqual(self.board()[0]["location"], "guadalupe_dtt")
+        self.assertEqual([entry["name"] for entry in self.board()[0]["checked_in"]], ["John Doe"])
+
+        self.clock("pause", {"user": self.user.pk, "reason": "Lunch", "pause_time": "12:00 PM"})
+        self.assertEqual(self.board()[0]["paused"][0]["reason"], "Lunch")
+
+        self.clock("resume")
+        self.clock("checkout")
+        self.assertEqual(self.board()[0]["counts"], {"checked_in": 0, "paused": 0, "checked_out": 1})
+
+    def test_board_is_cached_between_transitions(self):
+        self.clock("checkin")
+        self.board()
+
+        self.client.force_authenticate(user=self.supervisor)
+        with self.assertNumQueries(0):
+            self.client.get(reverse("clock-board"))
+
+    def test_people_without_settings_are_unassigned(self):
+        other = User.objects.create_user(name="Jane Roe", email="jroe@gmail.com", password=None)
+        ClockState.objects.create(user=other, status=ClockState.CHECKED_IN, since=timezone.now(), date=timezone.localdate())
+
+        self.assertEqual(self.board()[0]["location"], "unassigned")
+
+    def test_requires_staff(self):
+        self.client.force_authenticate(user=self.user)
+
+        self.assertEqual(self.client.get(reverse("clock-board")).status_code, 403)
+
+    def test_reconciliation_checks_out_forgotten_shift(self):
+        check_in = timezone.make_aware(datetime(2026, 3, 3, 8, 0))
+        TimeRecord.objects.create(user=self.user, date=date(2026, 3, 3), check_in=check_in)
+        ClockState.objects.create(user=self.user, status=ClockState.CHECKED_IN, since=check_in, date=date(2026, 3, 3))
+
+        close_stale_records(now=timezone.make_aware(datetime(2026, 3, 5, 9, 0)))
+
+        state = ClockState.objects.get(user=self.user)
+        self.assertEqual((state.status, state.since), (ClockState.CHECKED_OUT, timezone.make_aware(datetime(2026, 3, 3, 17, 0))))
+
+
+@override_settings(CLOCK_STREAM={"HEARTBEAT_SECONDS": 0.01, "MAX_SECONDS": 0.05})
+class ClockStreamTest(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        self.token = str(AccessToken.for_user(self.user))
+        self.since = timezone.make_aware(datetime(2026, 3, 3, 8, 0))
+
+    async def open_stream(self):
+        response = await self.async_client.get(reverse("clock-stream"), {"token": self.token})
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        events = aiter(response.streaming_content)
+        self.assertEqual(await anext(events), b"retry: 3000\n\n")
+        return events
+
+    async def test_sends_current_state_then_transitions(self):
+        await ClockState.objects.acreate(user=self.user, status=ClockState.CHECKED_IN, since=self.since, date=self.since.date())
+        events = await self.open_stream()
+        self.assertIn(b'"status": "in"', await anext(events))
+
+        get_broker().publish(clock_channel(self.user.pk), {"user": self.user.pk, "status": "paused"})
+        self.assertEqual(await anext(events), b'event: transition\ndata: {"user": %d, "status": "paused"}\n\n' % self.user.pk)
+        self.assertEqual({event async for event in events}, {b": keepalive\n\n"})
+
+    @override_settings(CLOCK_STREAM={"HEARTBEAT_SECONDS": 0.01, "MAX_SECONDS": 0.1})
+    async def test_idle_stream_sends_heartbeats_until_max_seconds(self):
+        events = await self.open_stream()
+        self.assertIn(b'"status": null', await anext(events))
+
+        heartbeats = [event async for event in events]
+        self.assertGreater(len(heartbeats), 1)
+        self.assertEqual(set(heartbeats), {b": keepalive\n\n"})
+        self.assertEqual(get_broker().subscriber_count(clock_channel(self.user.pk)), 0)
+
+    async def test_requires_valid_token(self):
+        response = await self.async_client.get(reverse("clock-stream"), {"token": "not-a-jwt"})
+        self.assertEqual(response.status_code, 401)
+
+    def test_transitions_are_published_on_commit(self):
+        with mock.patch.object(get_broker(), "publish") as publish:
+            with self.captureOnCommitCallbacks() as callbacks:
+                set_clock_state(self.user.pk, ClockState.CHECKED_OUT, self.since)
+            publish.assert_not_called()
+            for callback in callbacks:
+                callback()
+
+        publish.assert_called_once_with(clock_channel(self.user.pk), {
+            "user": self.user.pk, "status": ClockState.CHECKED_OUT, "since": self.since, "reason": "",
+        })
+
+    def test_wsgi_request_gets_current_state_only(self):
+        self.client.force_login(self.user)
+        response = self.client.get(reverse("clock-stream"))
+
+        self.assertEqual(b"".join(response), b'retry: 3000\n\nevent: state\ndata: {"user": %d, "status": null, "since": null, "reason": ""}\n\n' % self.user.pk)
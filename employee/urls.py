@@ -1,5 +1,6 @@
 from django.urls import path
-from .views import CheckInView, CheckOutView, TimeHistoryView, TodayStatusView, PauseView, ResumeView
+from .views import CheckInView, CheckOutView, TimeHistoryView, TodayStatusView, PauseView, ResumeView, OfflineSyncView, ClockBoardView, ClockAuditLogView
+from .streams import clock_state_stream
 
 urlpatterns = [
     path('checkin/', CheckInView.as_view(), name='checkin'),
@@ -8,4 +9,8 @@ urlpatterns = [
     path('resume/', ResumeView.as_view(), name='resume'),
     path('history/', TimeHistoryView.as_view(), name='time-history'),
     path('today/', TodayStatusView.as_view(), name='today-status'),
+    path('sync/', OfflineSyncView.as_view(), name='offline-sync'),
+    path('board/', ClockBoardView.as_view(), name='clock-board'),
+    path('stream/', clock_state_stream, name='clock-stream'),
+    path('audit/', ClockAuditLogView.as_view(), name='clock-audit'),
 ]
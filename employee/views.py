@@ -1,16 +1,23 @@
-from rest_framework import status
+from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
-from rest_framework.permissions import IsAuthenticated
-from django.utils import timezone
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
 from datetime import date
-import pytz
 import ipaddress
-from .models import TimeRecord, PauseRecord
-from .serializers import TimeRecordSerializer, PauseRecordSerializer, ResumeRecordSerializer
-
-# Set timezone
-ARIZONA_TZ = pytz.timezone('US/Arizona')
+from Attendance_Backend.api.conditional import ConditionalGetMixin
+from Attendance_Backend.api.idempotency import idempotent
+from Attendance_Backend.api.lean import LeanListMixin
+from Attendance_Backend.api.throttling import IPTokenBucketThrottle, UnsafeMethodThrottleMixin, UserTokenBucketThrottle
+from Attendance_Backend.sitetime import site_now, site_today
+from locations.models import Location
+from .archive import CombinedRecords, wants_archived
+from .clockstate import get_clock_board, refresh_clock_state, set_clock_state
+from .models import ArchivedTimeRecord, ClockAuditEntry, ClockState, TimeRecord, PauseRecord
+from .offline import get_config as get_offline_config, issue_signing_key, sync_offline_events
+from .serializers import (
+    TimeRecordSerializer, TimeRecordLeanSerializer, PauseRecordSerializer, ResumeRecordSerializer,
+    OfflineSyncSerializer, ClockAuditEntrySerializer,
+)
 
 # Allowed IPs (use IPv4 only)
 ALLOWED_IPS = ['127.0.0.1', '105.161.108.230', '102.0.11.206']
@@ -31,18 +38,27 @@ def get_client_ip(request):
 
     return ip
 
-def is_allowed_ip(request):
+def get_user_site(user):
+    """The Location the user works at, or None without settings."""
+    return Location.objects.filter(user_settings__user=user).first()
+
+def is_allowed_ip(request, site=None):
     ip = get_client_ip(request)
-    return ip in ALLOWED_IPS
+    return ip in ALLOWED_IPS or (site is not None and site.allows_ip(ip))
 
-class CheckInView(APIView):
+class CheckInView(UnsafeMethodThrottleMixin, APIView):
     permission_classes = [IsAuthenticated]
+    throttle_classes = [UserTokenBucketThrottle, IPTokenBucketThrottle]
+    throttle_scope = 'clock'
 
+    @idempotent
     def post(self, request):
-        if not is_allowed_ip(request):
+        site = get_user_site(request.user)
+        site_code = site and site.code
+        if not is_allowed_ip(request, site):
             return Response({'error': 'Check-in is only allowed from authorized IP.'}, status=status.HTTP_403_FORBIDDEN)
 
-        now = timezone.now().astimezone(ARIZONA_TZ)
+        now = site_now(site_code)
         today = now.date()
 
         if TimeRecord.objects.filter(user=request.user, date=today).exists():
@@ -51,33 +67,45 @@ class CheckInView(APIView):
         time_record = TimeRecord(user=request.user, date=today, check_in=now)
         time_record.full_clean()
         time_record.save()
+        set_clock_state(request.user.pk, ClockState.CHECKED_IN, now, site=site_code)
         serializer = TimeRecordSerializer(time_record)
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
-class CheckOutView(APIView):
+class CheckOutView(UnsafeMethodThrottleMixin, APIView):
     permission_classes = [IsAuthenticated]
+    throttle_classes = [UserTokenBucketThrottle, IPTokenBucketThrottle]
+    throttle_scope = 'clock'
 
+    @idempotent
     def post(self, request):
-        if not is_allowed_ip(request):
+        site = get_user_site(request.user)
+        site_code = site and site.code
+        if not is_allowed_ip(request, site):
             return Response({'error': 'Check-out is only allowed from authorized IP.'}, status=status.HTTP_403_FORBIDDEN)
 
-        now = timezone.now().astimezone(ARIZONA_TZ)
+        now = site_now(site_code)
         today = now.date()
 
         try:
             record = TimeRecord.objects.get(user=request.user, date=today, check_out__isnull=True)
             record.check_out = now
             record.save()
+            set_clock_state(request.user.pk, ClockState.CHECKED_OUT, now, site=site_code)
             serializer = TimeRecordSerializer(record)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except TimeRecord.DoesNotExist:
             return Response({'error': 'No active check-in found for today or already checked out'}, status=status.HTTP_400_BAD_REQUEST)
 
-class PauseView(APIView):
+class PauseView(UnsafeMethodThrottleMixin, APIView):
     permission_classes = [IsAuthenticated]
+    throttle_classes = [UserTokenBucketThrottle, IPTokenBucketThrottle]
+    throttle_scope = 'clock'
 
+    @idempotent
     def post(self, request):
-        if not is_allowed_ip(request):
+        site = get_user_site(request.user)
+        site_code = site and site.code
+        if not is_allowed_ip(request, site):
             return Response({'error': 'Pause is only allowed from authorized IP.'}, status=status.HTTP_403_FORBIDDEN)
 
         if PauseRecord.objects.filter(user=request.user, resume_time__isnull=True).exists():
@@ -85,27 +113,34 @@ class PauseView(APIView):
 
         serializer = PauseRecordSerializer(data=request.data)
         if serializer.is_valid():
-            PauseRecord.objects.create(
+            pause = PauseRecord.objects.create(
                 user=request.user,
                 reason=serializer.validated_data['reason'],
-                pause_time=timezone.now().astimezone(ARIZONA_TZ)
+                pause_time=site_now(site_code)
             )
+            set_clock_state(request.user.pk, ClockState.PAUSED, pause.pause_time, pause.reason, site=site_code)
             return Response({'message': 'Pause recorded successfully.'}, status=status.HTTP_201_CREATED)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-class ResumeView(APIView):
+class ResumeView(UnsafeMethodThrottleMixin, APIView):
     permission_classes = [IsAuthenticated]
+    throttle_classes = [UserTokenBucketThrottle, IPTokenBucketThrottle]
+    throttle_scope = 'clock'
 
+    @idempotent
     def post(self, request):
-        if not is_allowed_ip(request):
+        site = get_user_site(request.user)
+        site_code = site and site.code
+        if not is_allowed_ip(request, site):
             return Response({'error': 'Resume is only allowed from authorized IP.'}, status=status.HTTP_403_FORBIDDEN)
 
         pause = PauseRecord.objects.filter(user=request.user, resume_time__isnull=True).last()
         if not pause:
             return Response({'error': 'No pause record found to resume.'}, status=status.HTTP_400_BAD_REQUEST)
 
-        pause.resume_time = timezone.now().astimezone(ARIZONA_TZ)
+        pause.resume_time = site_now(site_code)
         pause.save()
+        set_clock_state(request.user.pk, ClockState.CHECKED_IN, pause.resume_time, site=site_code)
         serializer = ResumeRecordSerializer(pause)
         return Response({'message': 'Resume recorded successfully.', 'data': serializer.data}, status=status.HTTP_200_OK)
 
@@ -116,22 +151,110 @@ class ResumeView(APIView):
             return Response({'paused': True, 'data': serializer.data}, status=status.HTTP_200_OK)
         return Response({'paused': False}, status=status.HTTP_200_OK)
 
-class TimeHistoryView(APIView):
+class TimeHistoryView(ConditionalGetMixin, LeanListMixin, generics.ListAPIView):
     permission_classes = [IsAuthenticated]
+    serializer_class = TimeRecordSerializer
+    lean_serializer_class = TimeRecordLeanSerializer
+    # Rate and hours come from the work profile, which has no timestamp of its own
+    fingerprint_extra = ('user__work_profile__rate_per_hour', 'user__work_profile__biweekly_total_hours')
 
-    def get(self, request):
-        records = TimeRecord.objects.filter(user=request.user).order_by('-date', '-check_in')
-        serializer = TimeRecordSerializer(records, many=True)
-        return Response(serializer.data)
+    def get_queryset(self):
+        records = (
+            TimeRecord.objects.filter(user=self.request.user)
+            .select_related('user__work_profile')
+            .order_by('-date', '-check_in')
+        )
+        if wants_archived(self.request):
+            # ?include_archived=1: rows moved out by archive_clock_records too
+            archived = ArchivedTimeRecord.objects.filter(user=self.request.user)
+            return CombinedRecords(records, archived, ordering=('-date', '-check_in'))
+        return records
+
+    def get_fingerprint(self):
+        records = self.get_queryset()
+        if isinstance(records, CombinedRecords):
+            return records.fingerprint(self.fingerprint_field, self.fingerprint_extra)
+        return super().get_fingerprint()
 
 class TodayStatusView(APIView):
     permission_classes = [IsAuthenticated]
 
     def get(self, request):
-        today = timezone.now().astimezone(ARIZONA_TZ).date()
+        site = get_user_site(request.user)
+        today = site_today(site and site.code)
         try:
-            record = TimeRecord.objects.get(user=request.user, date=today)
+            record = TimeRecord.objects.select_related('user__work_profile').get(user=request.user, date=today)
             serializer = TimeRecordSerializer(record)
             return Response(serializer.data)
         except TimeRecord.DoesNotExist:
             return Response({'status': 'Not checked in today'})
+
+class OfflineSyncView(APIView):
+    """
+    GET (from an authorized IP): issue a new key for a device (?device=<label>)
+    to sign offline events with.
+    POST {"events": [...]}: apply events buffered while offline; see employee.offline.
+    """
+    permission_classes = [IsAuthenticated]
+    throttle_classes = [UserTokenBucketThrottle]
+    throttle_scope = 'clock'
+
+    def get(self, request):
+        if not is_allowed_ip(request, get_user_site(request.user)):
+            return Response({'error': 'The signing key is only issued on an authorized network.'}, status=status.HTTP_403_FORBIDDEN)
+        config = get_offline_config()
+        key = issue_signing_key(request.user, device=request.query_params.get('device', '')[:100])
+        return Response({
+            'key_id': key.key_id,
+            'signing_key': key.secret,
+            'algorithm': 'HMAC-SHA256',
+            'expires_at': key.expires_at,
+            'max_events': config['MAX_EVENTS'],
+            'max_age_days': config['MAX_AGE_DAYS'],
+        })
+
+    def post(self, request):
+        serializer = OfflineSyncSerializer(
+            data=request.data, context={'max_events': get_offline_config()['MAX_EVENTS']},
+        )
+        serializer.is_valid(raise_exception=True)
+        results = sync_offline_events(request.user, serializer.validated_data['events'])
+        refresh_clock_state(request.user.pk)
+        return Response({'results': results}, status=status.HTTP_200_OK)
+
+class ClockBoardView(APIView):
+    """Supervisor board: who is checked in, paused or checked out today, per location (?site= for one)."""
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        return Response(get_clock_board(request.query_params.get('site') or None))
+
+class ClockAuditLogView(generics.ListAPIView):
+    """
+    Clock audit entries, newest first. Narrow with ?user=<id> and ?start= / ?end=
+    (YYYY-MM-DD, the record's site day), which the (user, date) index serves,
+    and ?record_type= / ?record_id= for one record's history.
+    """
+    permission_classes = [IsAdminUser]
+    serializer_class = ClockAuditEntrySerializer
+
+    def list(self, request, *args, **kwargs):
+        try:
+            return super().list(request, *args, **kwargs)
+        except ValueError:
+            return Response({'error': 'Invalid filter. Use a numeric user, record_type and record_id, and YYYY-MM-DD dates.'}, status=status.HTTP_400_BAD_REQUEST)
+
+    def get_queryset(self):
+        params = self.request.query_params
+        entries = ClockAuditEntry.objects.order_by('-created_at', '-pk')
+        if params.get('user'):
+            entries = entries.filter(user_id=int(params['user']))
+        if params.get('start'):
+            entries = entries.filter(date__gte=date.fromisoformat(params['start']))
+        if params.get('end'):
+            entries = entries.filter(date__lte=date.fromisoformat(params['end']))
+        if params.get('record_type'):
+            entries = entries.filter(record_type=int(params['record_type']))
+        if params.get('record_id'):
+            entries = entries.filter(record_id=int(params['record_id']))
+        return entries
@@ -19,7 +19,7 @@ class GoalAdmin(admin.ModelAdmin):
 
 @admin.register(DailyProgress)
 class DailyProgressAdmin(admin.ModelAdmin):
-    list_display = ('client', 'date', 'location')
-    list_filter = ('date', 'client')
+    list_display = ('client', 'date', 'location', 'site')
+    list_filter = ('date', 'site', 'client')
     search_fields = ('client__firstName', 'client__lastName', 'location')
     inlines = [TrialInline]
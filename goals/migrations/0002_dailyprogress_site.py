@@ -0,0 +1,38 @@
+# Generated by Django 5.2 on 2026-10-19 02:52
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def link_sites(apps, schema_editor):
+    DailyProgress = apps.get_model('goals', 'DailyProgress')
+    UserSettings = apps.get_model('settings', 'UserSettings')
+    DailyProgress.objects.filter(created_by__isnull=False).update(
+        site_id=Subquery(UserSettings.objects.filter(user_id=OuterRef('created_by_id')).values('site_id')[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('clients', '0004_attendancerecord_site'),
+        ('goals', '0001_initial'),
+        ('locations', '0001_initial'),
+        ('settings', '0008_usersettings_site'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dailyprogress',
+            name='site',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='daily_progress', to='locations.location', to_field='code'),
+        ),
+        migrations.AddIndex(
+            model_name='dailyprogress',
+            index=models.Index(fields=['site', 'date'], name='dailyprogress_site_date_idx'),
+        ),
+        migrations.RunPython(link_sites, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2 on 2026-10-19 02:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('goals', '0002_dailyprogress_site'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dailyprogress',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -1,6 +1,7 @@
 from django.db import models
 from django.conf import settings
 from clients.models import Client  
+from locations.models import Location
 
 class Goal(models.Model):
     client = models.ForeignKey(
@@ -76,6 +77,10 @@ class DailyProgress(models.Model):
     )
     date = models.DateField()
     location = models.CharField(max_length=255)
+    site = models.ForeignKey(
+        Location, to_field='code', on_delete=models.PROTECT, null=True, blank=True,
+        related_name='daily_progress',
+    )
     general_notes = models.TextField(blank=True)
     provider_initials = models.CharField(max_length=10, blank=True)
     created_by = models.ForeignKey(
@@ -84,10 +89,26 @@ class DailyProgress(models.Model):
         null=True
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)  # also touched when a trial changes
 
     class Meta:
         verbose_name_plural = "Daily Progress"
         unique_together = ['client', 'date']
+        indexes = [
+            models.Index(fields=['site', 'date'], name='dailyprogress_site_date_idx'),
+        ]
 
     def __str__(self):
-        return f"Progress for {self.client} on {self.date}"
\ No newline at end of file
+        return f"Progress for {self.client} on {self.date}"
+
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+
+@receiver([post_save, post_delete], sender=Trial)
+def touch_daily_progress(sender, instance, **kwargs):
+    # Trials are part of a progress sheet, so they count as a change to it
+    if instance.daily_progress_id is not None:
+        DailyProgress.objects.filter(pk=instance.daily_progress_id).update(updated_at=timezone.now())
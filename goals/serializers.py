@@ -1,4 +1,5 @@
 from rest_framework import serializers
+from Attendance_Backend.api.fieldsets import SparseFieldsetMixin
 from .models import Goal, Trial, DailyProgress
 
 class TrialSerializer(serializers.ModelSerializer):
@@ -7,18 +8,22 @@ class TrialSerializer(serializers.ModelSerializer):
         fields = '__all__'
         read_only_fields = ['created_at']
 
-class GoalSerializer(serializers.ModelSerializer):
+class GoalSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     trials = TrialSerializer(many=True, read_only=True)
     
     class Meta:
         model = Goal
         fields = '__all__'
         read_only_fields = ['created_at', 'updated_at']
+        expandable_fields = ['trials']
+        default_expand = ['trials']
 
-class DailyProgressSerializer(serializers.ModelSerializer):
+class DailyProgressSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     trials = TrialSerializer(many=True, read_only=True)
 
     class Meta:
         model = DailyProgress
         fields = '__all__'
         read_only_fields = ['created_at', 'created_by']
+        expandable_fields = ['trials']
+        default_expand = ['trials']
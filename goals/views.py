@@ -4,8 +4,10 @@ from rest_framework.decorators import action
 from .models import Goal, Trial, DailyProgress
 from .serializers import GoalSerializer, TrialSerializer, DailyProgressSerializer
 from clients.models import Client
+from Attendance_Backend.api.conditional import ConditionalGetMixin
+from locations.models import Location
 
-class GoalViewSet(viewsets.ModelViewSet):
+class GoalViewSet(ConditionalGetMixin, viewsets.ModelViewSet):
     queryset = Goal.objects.all()
     serializer_class = GoalSerializer
 
@@ -26,21 +28,27 @@ class GoalViewSet(viewsets.ModelViewSet):
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
 class DailyProgressViewSet(viewsets.ModelViewSet):
-    queryset = DailyProgress.objects.all()
+    queryset = DailyProgress.objects.prefetch_related('trials')
     serializer_class = DailyProgressSerializer
 
     def perform_create(self, serializer):
-        serializer.save(created_by=self.request.user)
+        site = serializer.validated_data.get('site')
+        if site is None and self.request.user.is_authenticated:
+            site = Location.objects.filter(user_settings__user=self.request.user).first()
+        serializer.save(created_by=self.request.user, site=site)
 
     def get_queryset(self):
         queryset = super().get_queryset()
         client_id = self.request.query_params.get('client_id')
         date = self.request.query_params.get('date')
+        site = self.request.query_params.get('site')
         
         if client_id:
             queryset = queryset.filter(client_id=client_id)
         if date:
             queryset = queryset.filter(date=date)
+        if site:
+            queryset = queryset.filter(site_id=site)
             
         return queryset
 
@@ -0,0 +1,10 @@
+from django.contrib import admin
+from .models import Location
+
+
+@admin.register(Location)
+class LocationAdmin(admin.ModelAdmin):
+    list_display = ('name', 'code', 'time_zone', 'is_active')
+    list_filter = ('is_active', 'time_zone')
+    search_fields = ('name', 'code')
+    prepopulated_fields = {'code': ('name',)}
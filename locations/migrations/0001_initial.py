@@ -0,0 +1,46 @@
+# Generated by Django 5.2 on 2026-10-19 02:52
+
+import locations.models
+from django.db import migrations, models
+
+# The sites that were hardcoded as UserSettings.LOCATION_CHOICES
+INITIAL_SITES = [
+    ('guadalupe_dta', 'Guadalupe DTA'),
+    ('guadalupe_dtt', 'Guadalupe DTT'),
+    ('guadalupe_special_dta', 'Guadalupe Special DTA'),
+    ('hcbs', 'HCBS'),
+]
+
+
+def seed_sites(apps, schema_editor):
+    Location = apps.get_model('locations', 'Location')
+    Location.objects.bulk_create([
+        Location(code=code, name=name, time_zone='America/Phoenix') for code, name in INITIAL_SITES
+    ])
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='Location',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('code', models.SlugField(unique=True)),
+                ('name', models.CharField(max_length=100)),
+                ('time_zone', models.CharField(default=locations.models.default_time_zone, max_length=64, validators=[locations.models.validate_time_zone])),
+                ('allowed_networks', models.JSONField(blank=True, default=list, help_text='IP addresses or CIDR ranges clock events are accepted from, besides the global list', validators=[locations.models.validate_networks])),
+                ('is_active', models.BooleanField(default=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'ordering': ['name'],
+            },
+        ),
+        migrations.RunPython(seed_sites, migrations.RunPython.noop),
+    ]
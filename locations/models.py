@@ -0,0 +1,74 @@
+import ipaddress
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import models
+
+
+def default_time_zone():
+    return settings.TIME_ZONE
+
+
+def validate_time_zone(value):
+    try:
+        ZoneInfo(value)
+    except (ZoneInfoNotFoundError, ValueError):
+        raise ValidationError(f"{value!r} is not a known time zone.")
+
+
+def validate_networks(value):
+    if not isinstance(value, list):
+        raise ValidationError("Allowed networks must be a list of IP addresses or CIDR ranges.")
+    for network in value:
+        try:
+            ipaddress.ip_network(network, strict=False)
+        except (TypeError, ValueError):
+            raise ValidationError(f"{network!r} is not an IP address or CIDR range.")
+
+
+def validate_location_code(value):
+    """For fields that hold a Location code: it must name an active site."""
+    if not Location.objects.filter(code=value, is_active=True).exists():
+        raise ValidationError(f"Unknown location {value!r}.")
+
+
+class Location(models.Model):
+    """
+    A site employees work at and attendance is recorded for.
+
+    Other apps reference a location by ``code`` (ForeignKey with to_field), so
+    filtering by site reads the indexed FK column without a join.
+    """
+    code = models.SlugField(max_length=50, unique=True)
+    name = models.CharField(max_length=100)
+    time_zone = models.CharField(max_length=64, default=default_time_zone, validators=[validate_time_zone])
+    allowed_networks = models.JSONField(
+        default=list, blank=True, validators=[validate_networks],
+        help_text="IP addresses or CIDR ranges clock events are accepted from, besides the global list",
+    )
+    is_active = models.BooleanField(default=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ['name']
+
+    def __str__(self):
+        return self.name
+
+    def allows_ip(self, ip):
+        try:
+            address = ipaddress.ip_address(ip)
+        except ValueError:
+            return False
+        return any(address in ipaddress.ip_network(network, strict=False) for network in self.allowed_networks)
+
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from Attendance_Backend.sitetime import clear_site_zones
+
+
+@receiver([post_save, post_delete], sender=Location)
+def location_changed(sender, **kwargs):
+    clear_site_zones()
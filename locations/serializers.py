@@ -0,0 +1,8 @@
+from rest_framework import serializers
+from .models import Location
+
+
+class LocationSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Location
+        fields = ['code', 'name', 'time_zone']
@@ -0,0 +1,225 @@
+import time as time_module
+import uuid
+from datetime import date, datetime, time, timedelta
+from unittest import mock
+from zoneinfo import ZoneInfo
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from Attendance_Backend import sitetime
+from Attendance_Backend.sitetime import site_date, site_today, site_zone
+from clients.models import AttendanceRecord
+from employee.archive import archivable_records
+from employee.clockstate import set_clock_state
+from employee.models import ClockState, PauseRecord, TimeRecord
+from employee.offline import issue_signing_key, sign_event
+from employee.reconciliation import close_stale_records
+from settings.models import UserSettings
+from .models import Location
+
+User = get_user_model()
+
+
+def settings_for(user, location):
+    return UserSettings.objects.create(
+        user=user, street_address="1 Main St", city="Tucson", state="AZ", zip_code="85701",
+        manager_name="Maria", location=location,
+    )
+
+
+class LocationTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.site = Location.objects.create(
+            code="tucson", name="Tucson", time_zone="America/Denver", allowed_networks=["10.20.0.0/16"],
+        )
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        self.user_settings = settings_for(self.user, "tucson")
+
+    def test_validation(self):
+        with self.assertRaises(ValidationError) as error:
+            Location(code="x", name="X", time_zone="Mars/Olympus", allowed_networks=["10.0.0.0/33"]).full_clean()
+        self.assertEqual(set(error.exception.message_dict), {"time_zone", "allowed_networks"})
+
+    def test_allows_ip(self):
+        self.assertTrue(self.site.allows_ip("10.20.3.4"))
+        self.assertFalse(self.site.allows_ip("10.21.3.4"))
+        self.assertFalse(self.site.allows_ip("not-an-ip"))
+
+    def test_site_zone_follows_location(self):
+        self.assertEqual(site_zone("tucson").key, "America/Denver")
+        self.assertEqual(site_zone("unknown").key, "America/Phoenix")
+
+        self.site.time_zone = "America/Chicago"
+        self.site.save()
+        self.assertEqual(site_zone("tucson").key, "America/Chicago")
+
+    def test_site_zone_expires_in_other_workers(self):
+        self.assertEqual(site_zone("tucson").key, "America/Denver")
+        # Saved by another worker: no signal reaches this process
+        Location.objects.filter(code="tucson").update(time_zone="America/Chicago")
+        self.assertEqual(site_zone("tucson").key, "America/Denver")
+
+        later = time_module.monotonic() + sitetime.ZONE_TTL + 1
+        with mock.patch.object(sitetime.time, "monotonic", return_value=later):
+            self.assertEqual(site_zone("tucson").key, "America/Chicago")
+
+    def test_settings_mirror_location_as_site(self):
+        self.assertEqual(self.user_settings.site, self.site)
+
+        self.client.force_authenticate(user=self.user)
+        response = self.client.patch(reverse("user-settings"), {"location": "atlantis"}, format="json")
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("location", response.json())
+
+    def test_clock_in_from_site_network(self):
+        self.client.force_authenticate(user=self.user)
+
+        denied = self.client.post(reverse("checkin"), REMOTE_ADDR="10.99.0.1")
+        allowed = self.client.post(reverse("checkin"), REMOTE_ADDR="10.20.0.1")
+
+        self.assertEqual(denied.status_code, 403)
+        self.assertEqual(allowed.status_code, 201)
+        record = TimeRecord.objects.get(user=self.user)
+        self.assertEqual(record.date, record.check_in.astimezone(site_zone("tucson")).date())
+
+    def test_attendance_records_are_partitioned_by_site(self):
+        for client, location in [("Ann", "GUADALUPE_DTA"), ("Bob", "GUADALUPE_DTT")]:
+            AttendanceRecord.objects.create(
+                client=client, time_in=time(9), time_out=time(15), service="DTT",
+                location=location, date=date(2026, 3, 2),
+            )
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.get(reverse("attendance-list"), {"site": "guadalupe_dtt"})
+
+        self.assertEqual([row["client"] for row in response.json()], ["Bob"])
+        self.assertEqual(response.json()[0]["site"], "guadalupe_dtt")
+
+    def test_attendance_site_is_kept_and_location_is_a_site(self):
+        self.client.force_authenticate(user=self.user)
+        record = {"time_in": "09:00", "time_out": "15:00", "service": "DTT", "date": "03/02/2026"}
+
+        at_tucson = self.client.post(reverse("attendance-list"), {**record, "client": "Ann", "location": "tucson"})
+        moved = self.client.post(
+            reverse("attendance-list"), {**record, "client": "Bob", "location": "GUADALUPE_DTA", "site": "tucson"},
+        )
+        unknown = self.client.post(reverse("attendance-list"), {**record, "client": "Cid", "location": "atlantis"})
+
+        self.assertEqual((at_tucson.status_code, at_tucson.json()["site"]), (201, "tucson"))
+        self.assertEqual((moved.status_code, moved.json()["site"]), (201, "tucson"))
+        self.assertEqual(unknown.status_code, 400)
+        self.assertIn("location", unknown.json())
+        bob = AttendanceRecord.objects.get(client="Bob")
+        bob.save()
+        self.assertEqual(bob.site_id, "tucson")
+
+    def test_clock_board_for_one_site(self):
+        other = User.objects.create_user(name="Jane Roe", email="jroe@gmail.com", password=None)
+        settings_for(other, "hcbs")
+        for user in (self.user, other):
+            ClockState.objects.create(user=user, status=ClockState.CHECKED_IN, since=self.site.updated_at, date=date(2026, 3, 2))
+        self.client.force_authenticate(user=User.objects.create_superuser(name="Boss", email="boss@gmail.com", password=None))
+
+        board = self.client.get(reverse("clock-board")).json()["locations"]
+        site_board = self.client.get(reverse("clock-board"), {"site": "tucson"}).json()["locations"]
+
+        self.assertEqual([location["label"] for location in board], ["HCBS", "Tucson"])
+        self.assertEqual([(location["location"], location["counts"]["checked_in"]) for location in site_board], [("tucson", 1)])
+
+    def test_lists_active_locations(self):
+        Location.objects.filter(code="hcbs").update(is_active=False)
+        self.client.force_authenticate(user=self.user)
+
+        codes = [location["code"] for location in self.client.get(reverse("location-list")).json()]
+
+        self.assertIn("tucson", codes)
+        self.assertNotIn("hcbs", codes)
+
+
+class SiteDayTest(APITestCase):
+    """Days follow the zone of each user's site, not settings.TIME_ZONE."""
+
+    def setUp(self):
+        cache.clear()
+        Location.objects.create(code="auckland", name="Auckland", time_zone="Pacific/Auckland")
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        settings_for(self.user, "auckland")
+        self.local = User.objects.create_user(name="Jane Roe", email="jroe@gmail.com", password=None)
+
+    def at(self, day, hour, zone="Pacific/Auckland"):
+        return datetime.combine(day, time(hour), tzinfo=ZoneInfo(zone))
+
+    def add_pause(self, user, start, end):
+        pause = PauseRecord.objects.create(user=user, reason="Lunch")
+        PauseRecord.objects.filter(pk=pause.pk).update(pause_time=start, resume_time=end, duration=end - start)
+        return pause
+
+    def test_reconciliation_closes_at_the_sites_shift_end(self):
+        # 16:00 on March 4 in Phoenix is already noon on March 5 in Auckland
+        now = self.at(date(2026, 3, 4), 16, "America/Phoenix")
+        record = TimeRecord.objects.create(user=self.user, date=date(2026, 3, 4), check_in=self.at(date(2026, 3, 4), 8))
+        set_clock_state(self.user.pk, ClockState.CHECKED_IN, record.check_in, site="auckland")
+        TimeRecord.objects.create(
+            user=self.local, date=date(2026, 3, 4), check_in=self.at(date(2026, 3, 4), 8, "America/Phoenix"),
+        )
+
+        self.assertEqual(close_stale_records(now=now), (1, 0))
+
+        record.refresh_from_db()
+        self.assertEqual(record.check_out, self.at(date(2026, 3, 4), 17))
+        self.assertEqual(ClockState.objects.get(user=self.user).date, date(2026, 3, 4))
+        self.assertTrue(TimeRecord.objects.get(user=self.local).check_out is None)
+
+    def test_archive_cuts_pauses_at_the_sites_midnight(self):
+        # Both start at 10:00 on December 31 in Phoenix, 06:00 on January 1 in Auckland
+        start = self.at(date(2026, 1, 1), 6)
+        site_pause = self.add_pause(self.user, start, start + timedelta(minutes=30))
+        local_pause = self.add_pause(self.local, start, start + timedelta(minutes=30))
+
+        _, pauses = archivable_records(date(2026, 1, 1))
+
+        self.assertEqual(list(pauses), [local_pause])
+        self.assertTrue(PauseRecord.objects.filter(pk=site_pause.pk).exists())
+
+    def test_offline_check_in_lands_on_the_sites_day(self):
+        day = site_today("auckland") - timedelta(days=1)
+        moment = self.at(day, 12)
+        key = issue_signing_key(self.user, device="tablet", now=moment - timedelta(hours=1))
+        event = {"id": uuid.uuid4(), "type": "check_in", "timestamp": moment, "reason": ""}
+        payload = {
+            **event, "id": str(event["id"]), "timestamp": moment.isoformat(), "key_id": str(key.key_id),
+            "signature": sign_event(key.secret, event),
+        }
+        self.client.force_authenticate(user=self.user)
+
+        response = self.client.post(reverse("offline-sync"), {"events": [payload]}, format="json")
+
+        self.assertEqual(response.json()["results"][0]["status"], "applied")
+        self.assertEqual(TimeRecord.objects.get(user=self.user).date, day)
+        self.assertNotEqual(site_date(moment), day)
+
+    def test_todays_attendance_per_site(self):
+        Location.objects.filter(code="guadalupe_dtt").update(time_zone="Pacific/Auckland")
+        for client, location, day in [
+            ("Ann", "GUADALUPE_DTA", date(2026, 3, 4)),
+            ("Bob", "GUADALUPE_DTT", date(2026, 3, 5)),
+            ("Cid", "GUADALUPE_DTT", date(2026, 3, 4)),
+        ]:
+            AttendanceRecord.objects.create(
+                client=client, time_in=time(9), time_out=time(15), service="DTT", location=location, date=day,
+            )
+        self.client.force_authenticate(user=self.user)
+
+        with mock.patch.object(timezone, "now", return_value=self.at(date(2026, 3, 4), 16, "America/Phoenix")):
+            everywhere = self.client.get(reverse("attendance-today")).json()
+            one_site = self.client.get(reverse("attendance-today"), {"site": "guadalupe_dtt"}).json()
+
+        self.assertEqual(sorted(row["client"] for row in everywhere), ["Ann", "Bob"])
+        self.assertEqual([row["client"] for row in one_site], ["Bob"])
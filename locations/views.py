@@ -0,0 +1,12 @@
+from rest_framework import viewsets
+from rest_framework.permissions import IsAuthenticated
+from .models import Location
+from .serializers import LocationSerializer
+
+
+class LocationViewSet(viewsets.ReadOnlyModelViewSet):
+    """Active sites, for location pickers and ?site= filters."""
+    queryset = Location.objects.filter(is_active=True)
+    serializer_class = LocationSerializer
+    permission_classes = [IsAuthenticated]
+    lookup_field = 'code'
@@ -0,0 +1,17 @@
+from django.contrib import admin
+from .models import ReportFile
+
+
+@admin.register(ReportFile)
+class ReportFileAdmin(admin.ModelAdmin):
+    list_display = ('kind', 'site', 'period_start', 'period_end', 'file_format', 'row_count', 'generated_at')
+    list_filter = ('kind', 'site', 'file_format')
+    date_hierarchy = 'period_start'
+    readonly_fields = [field.name for field in ReportFile._meta.fields]
+
+    # Rows are written by generate_reports only
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,143 @@
+"""
+Goal-progress and hours charts, rendered once per distinct content.
+
+A chart is identified by the hash of its spec (the data points, labels and
+layout) and format, so an image is rendered only the first time that exact
+chart is asked for and served from the cache afterwards; changed data makes a
+new spec and so a new key, and nothing has to be invalidated. The hash also
+serves as the image's ETag.
+
+Batches of uncached charts (an ISP packet covers dozens of clients) are split
+across a process pool of CHARTS['POOL_SIZE'] workers, since rendering is CPU
+bound and holds the GIL. Smaller batches render in-process.
+"""
+import hashlib
+import json
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
+from multiprocessing import get_context
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Sum
+
+from clients.models import Client
+from employee.models import TimeRecord
+from goals.models import Trial
+from .rendering import render_charts
+
+DEFAULT_CONFIG = {
+    'POOL_SIZE': 2,             # worker processes; 0 renders everything in-process
+    'POOL_MIN_BATCH': 4,        # uncached charts needed before the pool is used
+    'DPI': 100,
+    'CACHE_TIMEOUT': 24 * 60 * 60,
+    'MAX_AGE': 5 * 60,          # seconds clients may reuse an image
+}
+
+# Part of every chart key; bump it when the drawing code changes
+RENDER_VERSION = 1
+CACHE_PREFIX = 'chart'
+
+HAS_MATPLOTLIB = find_spec('matplotlib') is not None
+
+
+class ChartsUnavailable(Exception):
+    pass
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'CHARTS', {})}
+
+
+def chart_key(spec, fmt):
+    content = json.dumps([RENDER_VERSION, fmt, spec], sort_keys=True, default=str)
+    return hashlib.sha256(content.encode()).hexdigest()
+
+
+@lru_cache(maxsize=None)
+def get_pool(size):
+    # Spawned workers import only reports.rendering, not the Django project
+    return ProcessPoolExecutor(size, mp_context=get_context('spawn'))
+
+
+def _render(specs, fmt, config):
+    size = config['POOL_SIZE']
+    if not size or len(specs) < config['POOL_MIN_BATCH']:
+        return render_charts(specs, fmt, config['DPI'])
+    chunks = [specs[index::size] for index in range(size)]
+    rendered = [get_pool(size).submit(render_charts, chunk, fmt, config['DPI']) for chunk in chunks]
+    images = [None] * len(specs)
+    for index, future in enumerate(rendered):
+        images[index::size] = future.result()
+    return images
+
+
+def get_charts(specs, fmt='png'):
+    """[(key, image bytes)] for ``specs``, rendering only the ones not cached."""
+    if not HAS_MATPLOTLIB:
+        raise ChartsUnavailable("matplotlib is not installed")
+    config = get_config()
+    keys = [chart_key(spec, fmt) for spec in specs]
+    cache_keys = {key: f'{CACHE_PREFIX}:{key}' for key in keys}
+    cached = cache.get_many(cache_keys.values())
+    images = {key: cached[cache_keys[key]] for key in keys if cache_keys[key] in cached}
+
+    missing = {key: spec for key, spec in zip(keys, specs) if key not in images}
+    if missing:
+        rendered = dict(zip(missing, _render(list(missing.values()), fmt, config)))
+        cache.set_many({cache_keys[key]: image for key, image in rendered.items()}, config['CACHE_TIMEOUT'])
+        images.update(rendered)
+    return [(key, images[key]) for key in keys]
+
+
+def _percentage(value):
+    return int(value.rstrip('%') or 0)
+
+
+def progress_specs(client_ids, start=None, end=None):
+    """
+    {client id: line chart spec} of the average trial percentage per
+    progress date, for clients that exist. One query for all clients.
+    """
+    trials = Trial.objects.filter(daily_progress__client_id__in=client_ids)
+    if start:
+        trials = trials.filter(daily_progress__date__gte=start)
+    if end:
+        trials = trials.filter(daily_progress__date__lte=end)
+    points = defaultdict(lambda: defaultdict(list))
+    for client_id, day, percentage in trials.values_list(
+        'daily_progress__client_id', 'daily_progress__date', 'percentage',
+    ):
+        points[client_id][day].append(_percentage(percentage))
+
+    specs = {}
+    for client_id, first_name, last_name in Client.objects.filter(pk__in=client_ids).values_list(
+        'pk', 'firstName', 'lastName',
+    ):
+        days = sorted(points[client_id])
+        specs[client_id] = {
+            'type': 'line',
+            'title': f'{first_name} {last_name}: goal progress',
+            'labels': [day.isoformat() for day in days],
+            'values': [round(sum(points[client_id][day]) / len(points[client_id][day]), 1) for day in days],
+            'ylabel': 'Average trial %',
+            'ylim': [0, 100],
+        }
+    return specs
+
+
+def hours_spec(start, end, site=None):
+    """Bar chart spec of hours worked per employee over [start, end]."""
+    records = TimeRecord.objects.filter(date__range=(start, end))
+    if site is not None:
+        records = records.filter(user__settings__site_id=site)
+    rows = records.values_list('user__name').annotate(hours=Sum('hours_worked')).order_by('user__name')
+    return {
+        'type': 'bar',
+        'title': f'Hours worked {start:%m/%d/%Y} - {end:%m/%d/%Y}',
+        'labels': [name for name, _ in rows],
+        'values': [float(hours or 0) for _, hours in rows],
+        'ylabel': 'Hours',
+    }
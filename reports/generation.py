@@ -0,0 +1,199 @@
+"""
+Precomputed timesheet, attendance and goal-progress reports.
+
+A report covers one Location and one period: a biweekly pay period for
+timesheets (counted from REPORTS['TIMESHEET_ANCHOR']) and a calendar month for
+the others. It is rebuilt only when the fingerprint of its source rows (count
+and latest updated_at, as for conditional GETs) no longer matches the stored
+file, so a scheduled run over unchanged periods costs one aggregate query per
+report and downloads are plain file reads.
+"""
+import hashlib
+from datetime import date, timedelta
+
+import tablib
+from django.conf import settings
+from django.core.files.base import ContentFile
+from django.db.models import Count
+from django.utils import timezone
+
+from Attendance_Backend.api.conditional import queryset_fingerprint
+from Attendance_Backend.sitetime import site_today, to_site_time
+from clients.models import AttendanceRecord
+from employee.archive import CombinedRecords
+from employee.models import ArchivedTimeRecord, TimeRecord
+from goals.models import DailyProgress
+from locations.models import Location
+from .models import ReportFile
+
+DEFAULT_CONFIG = {
+    'TIMESHEET_ANCHOR': '2026-01-05',  # first day of a pay period
+    'FORMATS': [ReportFile.XLSX],
+    'PERIODS_BACK': 1,                 # earlier periods refreshed on each run
+    'MAX_AGE': 5 * 60,                 # seconds clients may reuse a download
+}
+
+# Part of every fingerprint; bump it when a report's columns change
+LAYOUT_VERSION = 1
+
+TIME_FORMAT = '%I:%M %p'
+
+
+def get_config():
+    return {**DEFAULT_CONFIG, **getattr(settings, 'REPORTS', {})}
+
+
+def report_period(kind, day):
+    """(first day, last day) of the ``kind`` period containing ``day``."""
+    if kind == ReportFile.TIMESHEET:
+        anchor = date.fromisoformat(get_config()['TIMESHEET_ANCHOR'])
+        start = anchor + timedelta(days=(day - anchor).days // 14 * 14)
+        return start, start + timedelta(days=13)
+    start = day.replace(day=1)
+    return start, (start + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+
+
+def _site_time(value, site):
+    return to_site_time(value, site).strftime(TIME_FORMAT) if value else ''
+
+
+def _clock_time(value):
+    return value.strftime(TIME_FORMAT) if value else ''
+
+
+def timesheet_source(site, start, end):
+    # Shifts moved out by archive_clock_records still belong to their period
+    return CombinedRecords(
+        TimeRecord.objects.filter(user__settings__site_id=site, date__range=(start, end)),
+        ArchivedTimeRecord.objects.filter(user__settings__site_id=site, date__range=(start, end)),
+        ordering=('user__name', 'date'),
+    )
+
+
+def build_timesheet(rows, site):
+    dataset = tablib.Dataset(headers=[
+        'Employee', 'Email', 'Date', 'Check In', 'Check Out', 'Hours Worked', 'Paused Hours',
+    ])
+    for name, email, day, check_in, check_out, hours, paused in rows.values_list(
+        'user__name', 'user__email', 'date', 'check_in', 'check_out', 'hours_worked', 'total_paused_time',
+    ):
+        dataset.append([
+            name, email, day.isoformat(), _site_time(check_in, site), _site_time(check_out, site),
+            float(hours or 0), paused,
+        ])
+    return dataset
+
+
+def attendance_source(site, start, end):
+    return AttendanceRecord.objects.filter(site_id=site, date__range=(start, end))
+
+
+def build_attendance(rows, site):
+    dataset = tablib.Dataset(headers=[
+        'Date', 'Client', 'Service', 'Location', 'Time In', 'Time Out', 'One on One', 'Documentation',
+    ])
+    for record in rows.order_by('date', 'client').values_list(
+        'date', 'client', 'service', 'location', 'time_in', 'time_out', 'one_on_one', 'documentation',
+    ):
+        day, client, service, location, time_in, time_out, one_on_one, documentation = record
+        dataset.append([
+            day.isoformat(), client, service, location, _clock_time(time_in), _clock_time(time_out),
+            'Yes' if one_on_one else 'No', 'Yes' if documentation else 'No',
+        ])
+    return dataset
+
+
+def progress_source(site, start, end):
+    return DailyProgress.objects.filter(site_id=site, date__range=(start, end))
+
+
+def build_progress(rows, site):
+    dataset = tablib.Dataset(headers=['Date', 'Client', 'Location', 'Provider Initials', 'Trials', 'General Notes'])
+    for day, first_name, last_name, location, initials, trials, notes in (
+        rows.annotate(trial_count=Count('trials'))
+        .order_by('date', 'client__lastName', 'client__firstName')
+        .values_list(
+            'date', 'client__firstName', 'client__lastName', 'location', 'provider_initials',
+            'trial_count', 'general_notes',
+        )
+    ):
+        dataset.append([day.isoformat(), f"{first_name} {last_name}", location, initials, trials, notes])
+    return dataset
+
+
+REPORTS = {
+    ReportFile.TIMESHEET: (timesheet_source, build_timesheet),
+    ReportFile.ATTENDANCE: (attendance_source, build_attendance),
+    ReportFile.PROGRESS: (progress_source, build_progress),
+}
+
+
+def source_fingerprint(kind, source):
+    if isinstance(source, CombinedRecords):
+        count, latest, _ = source.fingerprint()
+    else:
+        count, latest, _ = queryset_fingerprint(source)
+    key = f"{LAYOUT_VERSION}|{kind}|{count}|{latest.isoformat() if latest else ''}"
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+def generate_report(kind, site, day, file_format=ReportFile.XLSX, force=False):
+    """
+    Build (or keep) the ``kind`` report for ``site`` covering ``day``.
+
+    Returns (ReportFile, whether the file was rebuilt).
+    """
+    start, end = report_period(kind, day)
+    source_for, build = REPORTS[kind]
+    source = source_for(site, start, end)
+    fingerprint = source_fingerprint(kind, source)
+
+    report = ReportFile.objects.filter(kind=kind, site_id=site, period_start=start, file_format=file_format).first()
+    if (
+        report is not None and not force and report.fingerprint == fingerprint
+        and report.file and report.file.storage.exists(report.file.name)
+    ):
+        return report, False
+
+    dataset = build(source, site)
+    content = dataset.export(file_format)
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+
+    report = report or ReportFile(kind=kind, site_id=site, period_start=start, file_format=file_format)
+    stale_name = report.file.name if report.file else None
+    report.period_end = end
+    report.fingerprint = fingerprint
+    report.row_count = len(dataset)
+    report.size = len(content)
+    report.generated_at = timezone.now()
+    report.file.save(f'{start:%Y-%m-%d}.{file_format}', ContentFile(content), save=False)
+    report.save()
+    if stale_name and stale_name != report.file.name:
+        report.file.storage.delete(stale_name)
+    return report, True
+
+
+def generate_reports(day=None, kinds=None, sites=None, formats=None, periods_back=None, force=False):
+    """
+    Refresh reports for the period containing ``day`` (default: today) and the
+    ``periods_back`` before it, for every kind, active site and format unless
+    narrowed. Returns a list of (ReportFile, rebuilt).
+    """
+    config = get_config()
+    day = day or site_today()
+    kinds = kinds or list(REPORTS)
+    formats = formats or config['FORMATS']
+    periods_back = config['PERIODS_BACK'] if periods_back is None else periods_back
+    if sites is None:
+        sites = list(Location.objects.filter(is_active=True).values_list('code', flat=True))
+
+    results = []
+    for kind in kinds:
+        period_day = day
+        for _ in range(periods_back + 1):
+            for site in sites:
+                for file_format in formats:
+                    results.append(generate_report(kind, site, period_day, file_format, force=force))
+            period_day = report_period(kind, period_day)[0] - timedelta(days=1)
+    return results
@@ -0,0 +1,40 @@
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from reports.generation import REPORTS, generate_reports
+from reports.models import ReportFile
+
+
+class Command(BaseCommand):
+    help = (
+        "Precompute timesheet, attendance and goal-progress reports per location "
+        "for the current and previous periods, rebuilding only those whose rows "
+        "changed. Meant to run from cron."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--kind', action='append', choices=list(REPORTS), help="Report kind; repeatable.")
+        parser.add_argument('--site', action='append', help="Location code; repeatable. Defaults to all active sites.")
+        parser.add_argument(
+            '--format', action='append', dest='formats',
+            choices=[code for code, _ in ReportFile.FORMAT_CHOICES], help="File format; repeatable.",
+        )
+        parser.add_argument('--date', help="A day in the period to build (YYYY-MM-DD). Defaults to today.")
+        parser.add_argument('--periods-back', type=int, help="Earlier periods to refresh as well.")
+        parser.add_argument('--force', action='store_true', help="Rebuild even when no rows changed.")
+
+    def handle(self, *args, **options):
+        try:
+            day = date.fromisoformat(options['date']) if options['date'] else None
+        except ValueError:
+            raise CommandError("--date must be YYYY-MM-DD.")
+
+        results = generate_reports(
+            day=day, kinds=options['kind'], sites=options['site'], formats=options['formats'],
+            periods_back=options['periods_back'], force=options['force'],
+        )
+        rebuilt = sum(1 for _, changed in results if changed)
+        self.stdout.write(self.style.SUCCESS(
+            f"Built {rebuilt} report(s); {len(results) - rebuilt} unchanged."
+        ))
@@ -0,0 +1,37 @@
+# Generated by Django 5.2 on 2026-10-19 02:58
+
+import django.db.models.deletion
+import reports.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('locations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ReportFile',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('timesheet', 'Biweekly timesheet'), ('attendance', 'Monthly attendance'), ('progress', 'Monthly goal progress')], max_length=20)),
+                ('period_start', models.DateField()),
+                ('period_end', models.DateField()),
+                ('file_format', models.CharField(choices=[('xlsx', 'Excel'), ('csv', 'CSV')], default='xlsx', max_length=4)),
+                ('file', models.FileField(upload_to=reports.models.report_upload_to)),
+                ('fingerprint', models.CharField(max_length=64)),
+                ('row_count', models.PositiveIntegerField(default=0)),
+                ('size', models.PositiveIntegerField(default=0)),
+                ('generated_at', models.DateTimeField()),
+                ('site', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='report_files', to='locations.location', to_field='code')),
+            ],
+            options={
+                'ordering': ['-period_start', 'kind', 'site'],
+                'constraints': [models.UniqueConstraint(fields=('kind', 'site', 'period_start', 'file_format'), name='reportfile_unique_period')],
+            },
+        ),
+    ]
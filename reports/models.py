@@ -0,0 +1,59 @@
+from django.db import models
+from locations.models import Location
+
+
+def report_upload_to(instance, filename):
+    return f'reports/{instance.kind}/{instance.site_id}/{filename}'
+
+
+class ReportFile(models.Model):
+    """
+    A precomputed report for one site and period (see reports.generation).
+
+    ``fingerprint`` describes the rows the file was built from; the file is
+    only rebuilt when a fresh fingerprint differs.
+    """
+    TIMESHEET = 'timesheet'
+    ATTENDANCE = 'attendance'
+    PROGRESS = 'progress'
+    KIND_CHOICES = [
+        (TIMESHEET, 'Biweekly timesheet'),
+        (ATTENDANCE, 'Monthly attendance'),
+        (PROGRESS, 'Monthly goal progress'),
+    ]
+
+    XLSX = 'xlsx'
+    CSV = 'csv'
+    FORMAT_CHOICES = [(XLSX, 'Excel'), (CSV, 'CSV')]
+
+    kind = models.CharField(max_length=20, choices=KIND_CHOICES)
+    site = models.ForeignKey(Location, to_field='code', on_delete=models.CASCADE, related_name='report_files')
+    period_start = models.DateField()
+    period_end = models.DateField()
+    file_format = models.CharField(max_length=4, choices=FORMAT_CHOICES, default=XLSX)
+    file = models.FileField(upload_to=report_upload_to)
+    fingerprint = models.CharField(max_length=64)
+    row_count = models.PositiveIntegerField(default=0)
+    size = models.PositiveIntegerField(default=0)
+    generated_at = models.DateTimeField()
+
+    class Meta:
+        ordering = ['-period_start', 'kind', 'site']
+        constraints = [
+            models.UniqueConstraint(
+                fields=['kind', 'site', 'period_start', 'file_format'], name='reportfile_unique_period',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.get_kind_display()} {self.site_id} {self.period_start:%Y-%m-%d}"
+
+
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+
+
+@receiver(post_delete, sender=ReportFile)
+def delete_report_file(sender, instance, **kwargs):
+    if instance.file:
+        instance.file.storage.delete(instance.file.name)
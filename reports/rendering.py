@@ -0,0 +1,49 @@
+"""
+Chart images drawn with matplotlib's Agg renderer.
+
+Charts are described by specs: dicts of plain values (type, title, labels,
+values, ...) built in reports.charts. This module imports nothing from Django
+so a spec can be rendered in a worker process, and matplotlib is imported on
+the first render rather than when the project starts.
+"""
+from functools import lru_cache
+from io import BytesIO
+
+CONTENT_TYPES = {'png': 'image/png', 'svg': 'image/svg+xml'}
+
+
+@lru_cache(maxsize=None)
+def figure_class():
+    # Figure objects draw through Agg without pyplot's global figure registry,
+    # so concurrent renders in one process do not share state
+    from matplotlib.figure import Figure
+    return Figure
+
+
+def render_chart(spec, fmt='png', dpi=100):
+    """Render ``spec`` and return the image bytes in ``fmt`` (png or svg)."""
+    figure = figure_class()(figsize=spec.get('size', (8, 4)), dpi=dpi)
+    axes = figure.subplots()
+    rotate_labels = len(spec['labels']) > 6
+    # Fixed margins: a tight layout draws the whole figure once more to measure it
+    figure.subplots_adjust(left=0.08, right=0.98, top=0.9, bottom=0.28 if rotate_labels else 0.12)
+    labels, values = spec['labels'], spec['values']
+    if spec['type'] == 'line':
+        axes.plot(labels, values, marker='o')
+    else:
+        axes.bar(labels, values)
+    axes.set_title(spec['title'])
+    axes.set_ylabel(spec.get('ylabel', ''))
+    if 'ylim' in spec:
+        axes.set_ylim(*spec['ylim'])
+    if rotate_labels:
+        axes.tick_params(axis='x', labelrotation=45)
+
+    buffer = BytesIO()
+    figure.savefig(buffer, format=fmt)
+    return buffer.getvalue()
+
+
+def render_charts(specs, fmt='png', dpi=100):
+    """Render several specs in this process; the unit of work sent to a pool worker."""
+    return [render_chart(spec, fmt, dpi) for spec in specs]
@@ -0,0 +1,17 @@
+from rest_framework import serializers
+from rest_framework.reverse import reverse
+from .models import ReportFile
+
+
+class ReportFileSerializer(serializers.ModelSerializer):
+    download_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ReportFile
+        fields = [
+            'id', 'kind', 'site', 'period_start', 'period_end', 'file_format',
+            'row_count', 'size', 'generated_at', 'download_url',
+        ]
+
+    def get_download_url(self, obj):
+        return reverse('reportfile-download', args=[obj.pk], request=self.context.get('request'))
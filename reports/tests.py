@@ -0,0 +1,220 @@
+import shutil
+import tempfile
+import zipfile
+from datetime import date, datetime, time, timezone
+from io import BytesIO, StringIO
+from unittest import mock, skipIf, skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from clients.models import AttendanceRecord, Client
+from employee.archive import archive_records
+from employee.models import TimeRecord
+from goals.models import DailyProgress, Trial
+from settings.models import UserSettings
+from . import charts
+from .generation import generate_report, generate_reports, report_period
+from .models import ReportFile
+
+User = get_user_model()
+
+MEDIA_ROOT = tempfile.mkdtemp()
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT, REPORTS={'TIMESHEET_ANCHOR': '2026-01-05', 'FORMATS': ['xlsx', 'csv']})
+class ReportGenerationTest(APITestCase):
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        UserSettings.objects.create(
+            user=self.user, street_address="1 Main St", city="Tucson", state="AZ", zip_code="85701",
+            manager_name="Maria", location="guadalupe_dta",
+        )
+        self.record = TimeRecord.objects.create(
+            user=self.user, date=date(2026, 3, 3), check_in=datetime(2026, 3, 3, 16, tzinfo=timezone.utc),
+            check_out=datetime(2026, 3, 4, 0, tzinfo=timezone.utc), hours_worked=8,
+        )
+        AttendanceRecord.objects.create(
+            client="Ann", time_in=time(9), time_out=time(15), service="DTA1",
+            location="GUADALUPE_DTA", date=date(2026, 3, 3),
+        )
+        client = Client.objects.create(
+            user=self.user, clientId="C1", firstName="Ann", lastName="Lee", dob=date(1990, 1, 1),
+            location="Guadalupe", billType="DTA", phone="555", guardian="Kim",
+        )
+        self.progress = DailyProgress.objects.create(
+            client=client, date=date(2026, 3, 3), location="Guadalupe", site_id="guadalupe_dta",
+        )
+
+    def test_report_periods(self):
+        self.assertEqual(
+            report_period(ReportFile.TIMESHEET, date(2026, 3, 3)), (date(2026, 3, 2), date(2026, 3, 15)),
+        )
+        self.assertEqual(
+            report_period(ReportFile.TIMESHEET, date(2026, 1, 4)), (date(2025, 12, 22), date(2026, 1, 4)),
+        )
+        self.assertEqual(
+            report_period(ReportFile.ATTENDANCE, date(2026, 2, 14)), (date(2026, 2, 1), date(2026, 2, 28)),
+        )
+
+    def test_builds_reports_per_site_and_period(self):
+        generate_reports(day=date(2026, 3, 3), sites=["guadalupe_dta"], periods_back=0)
+
+        reports = ReportFile.objects.filter(site="guadalupe_dta")
+        self.assertEqual(reports.count(), 6)
+        timesheet = reports.get(kind=ReportFile.TIMESHEET, file_format=ReportFile.CSV)
+        self.assertEqual((timesheet.period_start, timesheet.row_count), (date(2026, 3, 2), 1))
+        with timesheet.file.open('rb') as content:
+            lines = content.read().decode().splitlines()
+        # Check-in shown in site time (Arizona, UTC-7)
+        self.assertEqual(lines[1].split(',')[:4], ["John Doe", "jdoe@gmail.com", "2026-03-03", "09:00 AM"])
+        self.assertEqual(reports.get(kind=ReportFile.ATTENDANCE, file_format=ReportFile.CSV).row_count, 1)
+        self.assertEqual(reports.get(kind=ReportFile.PROGRESS, file_format=ReportFile.XLSX).row_count, 1)
+
+    def test_rebuilds_only_when_rows_change(self):
+        report, built = generate_report(ReportFile.PROGRESS, "guadalupe_dta", date(2026, 3, 3))
+        first_name = report.file.name
+
+        with self.assertNumQueries(2):
+            _, rebuilt = generate_report(ReportFile.PROGRESS, "guadalupe_dta", date(2026, 3, 3))
+        self.assertTrue(built)
+        self.assertFalse(rebuilt)
+
+        # A new trial touches its DailyProgress
+        Trial.objects.create(daily_progress=self.progress, percentage='50%')
+        report, rebuilt = generate_report(ReportFile.PROGRESS, "guadalupe_dta", date(2026, 3, 3))
+        self.assertTrue(rebuilt)
+        self.assertNotEqual(report.file.name, first_name)
+        self.assertFalse(report.file.storage.exists(first_name))
+
+    def test_archived_shifts_stay_in_their_timesheet(self):
+        report, _ = generate_report(ReportFile.TIMESHEET, "guadalupe_dta", date(2026, 3, 3))
+
+        archive_records(date(2026, 3, 10))
+        kept, rebuilt = generate_report(ReportFile.TIMESHEET, "guadalupe_dta", date(2026, 3, 3))
+        forced, _ = generate_report(ReportFile.TIMESHEET, "guadalupe_dta", date(2026, 3, 3), force=True)
+
+        self.assertFalse(TimeRecord.objects.exists())
+        self.assertFalse(rebuilt)
+        self.assertEqual((kept.fingerprint, forced.fingerprint, forced.row_count), (report.fingerprint, report.fingerprint, 1))
+
+    def test_command(self):
+        out = StringIO()
+        call_command("generate_reports", "--date", "2026-03-03", "--site", "guadalupe_dta", "--kind", "attendance", stdout=out)
+        call_command("generate_reports", "--date", "2026-03-03", "--site", "guadalupe_dta", "--kind", "attendance", stdout=out)
+
+        self.assertEqual(ReportFile.objects.filter(kind=ReportFile.ATTENDANCE).count(), 4)
+        self.assertIn("Built 4 report(s); 0 unchanged.", out.getvalue())
+        self.assertIn("Built 0 report(s); 4 unchanged.", out.getvalue())
+
+    def test_download_is_cacheable(self):
+        report, _ = generate_report(ReportFile.TIMESHEET, "guadalupe_dta", date(2026, 3, 3), ReportFile.CSV)
+        url = reverse("reportfile-download", args=[report.pk])
+
+        self.client.force_authenticate(user=self.user)
+        self.assertEqual(self.client.get(url).status_code, 403)
+
+        self.client.force_authenticate(user=User.objects.create_superuser(name="Boss", email="boss@gmail.com", password=None))
+        listing = self.client.get(reverse("reportfile-list"), {"kind": "timesheet"})
+        response = self.client.get(url)
+        not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(listing.json()[0]["download_url"], f"http://testserver{url}")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(b"John Doe", b"".join(response.streaming_content))
+        self.assertIn("max-age=300", response["Cache-Control"])
+        self.assertIn("private", response["Cache-Control"])
+        self.assertEqual(not_modified.status_code, 304)
+
+
+class ChartTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password=None)
+        self.ann = Client.objects.create(
+            user=self.user, clientId="C1", firstName="Ann", lastName="Lee", dob=date(1990, 1, 1),
+            location="Guadalupe", billType="DTA", phone="555", guardian="Kim",
+        )
+        for day, percentages in [(date(2026, 3, 3), ["50%", "100%"]), (date(2026, 3, 2), ["25%"])]:
+            progress = DailyProgress.objects.create(client=self.ann, date=day, location="Guadalupe")
+            for number, percentage in enumerate(percentages, 1):
+                Trial.objects.create(daily_progress=progress, trial_number=number, percentage=percentage)
+        TimeRecord.objects.create(
+            user=self.user, date=date(2026, 3, 3), check_in=datetime(2026, 3, 3, 16, tzinfo=timezone.utc),
+            hours_worked=8,
+        )
+        self.client.force_authenticate(user=self.user)
+
+    def test_progress_spec(self):
+        with self.assertNumQueries(2):
+            specs = charts.progress_specs([self.ann.pk, 999])
+
+        self.assertEqual(list(specs), [self.ann.pk])
+        self.assertEqual(specs[self.ann.pk]["labels"], ["2026-03-02", "2026-03-03"])
+        self.assertEqual(specs[self.ann.pk]["values"], [25.0, 75.0])
+        self.assertEqual(charts.progress_specs([self.ann.pk], start=date(2026, 3, 3))[self.ann.pk]["values"], [75.0])
+
+    def test_hours_spec(self):
+        spec = charts.hours_spec(date(2026, 3, 2), date(2026, 3, 15))
+
+        self.assertEqual((spec["labels"], spec["values"]), (["John Doe"], [8.0]))
+        self.assertEqual(charts.hours_spec(date(2026, 3, 2), date(2026, 3, 15), site="hcbs")["labels"], [])
+
+    def test_chart_key_follows_content(self):
+        spec = charts.progress_specs([self.ann.pk])[self.ann.pk]
+
+        self.assertEqual(charts.chart_key(spec, "png"), charts.chart_key(dict(reversed(spec.items())), "png"))
+        self.assertNotEqual(charts.chart_key(spec, "png"), charts.chart_key(spec, "svg"))
+        self.assertNotEqual(charts.chart_key(spec, "png"), charts.chart_key({**spec, "values": [25.0, 80.0]}, "png"))
+
+    @skipIf(charts.HAS_MATPLOTLIB, "matplotlib is installed")
+    def test_unavailable_without_matplotlib(self):
+        response = self.client.get(reverse("client-progress-chart", args=[self.ann.pk, "png"]))
+
+        self.assertEqual(response.status_code, 503)
+
+    @skipUnless(charts.HAS_MATPLOTLIB, "matplotlib is not installed")
+    def test_renders_once_per_content(self):
+        url = reverse("client-progress-chart", args=[self.ann.pk, "svg"])
+        with mock.patch.object(charts, "render_charts", wraps=charts.render_charts) as render:
+            response = self.client.get(url)
+            again = self.client.get(url)
+            not_modified = self.client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "image/svg+xml")
+        self.assertEqual(again.content, response.content)
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(render.call_count, 1)
+        self.assertEqual(self.client.get(reverse("client-progress-chart", args=[999, "png"])).status_code, 404)
+
+    @skipUnless(charts.HAS_MATPLOTLIB, "matplotlib is not installed")
+    @override_settings(CHARTS={"POOL_SIZE": 2, "POOL_MIN_BATCH": 2})
+    def test_batch_renders_in_pool(self):
+        bob = Client.objects.create(
+            user=self.user, clientId="C2", firstName="Bob", lastName="Ray", dob=date(1990, 1, 1),
+            location="Guadalupe", billType="DTA", phone="555", guardian="Kim",
+        )
+
+        response = self.client.get(reverse("client-progress-charts"), {"clients": f"{self.ann.pk},{bob.pk}"})
+
+        self.assertEqual(response.status_code, 200)
+        with zipfile.ZipFile(BytesIO(response.content)) as archive:
+            names = archive.namelist()
+            self.assertTrue(archive.read(names[0]).startswith(b"\x89PNG"))
+        self.assertEqual(sorted(names), [f"client-{self.ann.pk}-progress.png", f"client-{bob.pk}-progress.png"])
+
+    def test_hours_chart_is_admin_only(self):
+        self.assertEqual(self.client.get(reverse("hours-chart", args=["png"])).status_code, 403)
@@ -0,0 +1,13 @@
+from django.urls import path, include, re_path
+from rest_framework.routers import DefaultRouter
+from .views import ClientProgressChart, ClientProgressChartArchive, HoursChart, ReportFileViewSet
+
+router = DefaultRouter()
+router.register(r'reports', ReportFileViewSet)
+
+urlpatterns = [
+    re_path(r'^charts/clients/(?P<client_id>\d+)/progress\.(?P<fmt>png|svg)$', ClientProgressChart.as_view(), name='client-progress-chart'),
+    path('charts/progress.zip', ClientProgressChartArchive.as_view(), name='client-progress-charts'),
+    re_path(r'^charts/hours\.(?P<fmt>png|svg)$', HoursChart.as_view(), name='hours-chart'),
+    path('', include(router.urls)),
+]
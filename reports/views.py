@@ -0,0 +1,149 @@
+import zipfile
+from io import BytesIO
+
+from django.http import FileResponse, Http404, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.http import http_date, quote_etag
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.permissions import IsAdminUser, IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from Attendance_Backend.api.conditional import ConditionalGetMixin
+from Attendance_Backend.sitetime import site_today
+from settings.reports import parse_report_date
+from . import charts
+from .generation import get_config, report_period
+from .models import ReportFile
+from .rendering import CONTENT_TYPES
+from .serializers import ReportFileSerializer
+
+CHARTS_UNAVAILABLE = {'error': 'Charts are unavailable: matplotlib is not installed.'}
+INVALID_RANGE = {'error': 'Invalid range. Use start/end as YYYY-MM-DD or MM/DD/YYYY.'}
+
+
+class ReportFileViewSet(ConditionalGetMixin, viewsets.ReadOnlyModelViewSet):
+    """
+    Precomputed reports (see reports.generation), filterable by kind, site,
+    file_format and period_start. ``download`` serves the stored file.
+    """
+    queryset = ReportFile.objects.all()
+    serializer_class = ReportFileSerializer
+    permission_classes = [IsAdminUser]
+    filterset_fields = ['kind', 'site', 'file_format', 'period_start']
+    fingerprint_field = 'generated_at'
+
+    @action(detail=True, methods=['get'])
+    def download(self, request, pk=None):
+        report = self.get_object()
+        # The fingerprint only changes when the file is rebuilt from other rows
+        etag = quote_etag(report.fingerprint)
+        last_modified = int(report.generated_at.timestamp())
+
+        response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+        if response is None:
+            try:
+                content = report.file.open('rb')
+            except FileNotFoundError:
+                raise Http404("Report file is missing; it is rebuilt on the next generate_reports run.")
+            response = FileResponse(
+                content, as_attachment=True,
+                filename=f'{report.kind}-{report.site_id}-{report.period_start:%Y-%m-%d}.{report.file_format}',
+            )
+            response['ETag'] = etag
+            response['Last-Modified'] = http_date(last_modified)
+        patch_cache_control(response, private=True, max_age=get_config()['MAX_AGE'])
+        return response
+
+
+def date_range(params, default=(None, None)):
+    """(start, end) from ``start``/``end`` query parameters; raises ValueError."""
+    start = parse_report_date(params['start']) if params.get('start') else default[0]
+    end = parse_report_date(params['end']) if params.get('end') else default[1]
+    if start and end and end < start:
+        raise ValueError("end must not be before start")
+    return start, end
+
+
+class ChartView(APIView):
+    permission_classes = [IsAuthenticated]
+
+    def chart_response(self, request, spec, fmt):
+        # The chart key hashes the data, so a current copy is answered before rendering
+        etag = quote_etag(charts.chart_key(spec, fmt))
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            try:
+                [(_, image)] = charts.get_charts([spec], fmt)
+            except charts.ChartsUnavailable:
+                return Response(CHARTS_UNAVAILABLE, status=503)
+            response = HttpResponse(image, content_type=CONTENT_TYPES[fmt])
+            response['ETag'] = etag
+        patch_cache_control(response, private=True, max_age=charts.get_config()['MAX_AGE'])
+        return response
+
+
+class ClientProgressChart(ChartView):
+    """GET charts/clients/<id>/progress.png|svg?start=&end=: average trial % per progress date."""
+
+    def get(self, request, client_id, fmt):
+        client_id = int(client_id)
+        try:
+            start, end = date_range(request.query_params)
+        except ValueError:
+            return Response(INVALID_RANGE, status=400)
+        spec = charts.progress_specs([client_id], start, end).get(client_id)
+        if spec is None:
+            raise Http404
+        return self.chart_response(request, spec, fmt)
+
+
+class ClientProgressChartArchive(APIView):
+    """
+    GET charts/progress.zip?clients=1,2,3&start=&end=&type=png|svg: the
+    progress charts of several clients, rendered as one batch.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        fmt = request.query_params.get('type', 'png')
+        try:
+            client_ids = [int(pk) for pk in request.query_params.get('clients', '').split(',') if pk]
+            start, end = date_range(request.query_params)
+        except ValueError:
+            return Response({'error': 'Pass clients as comma-separated ids and start/end as dates.'}, status=400)
+        if fmt not in CONTENT_TYPES or not client_ids:
+            return Response({'error': 'Pass clients and a type of png or svg.'}, status=400)
+
+        specs = charts.progress_specs(client_ids, start, end)
+        try:
+            images = charts.get_charts(list(specs.values()), fmt)
+        except charts.ChartsUnavailable:
+            return Response(CHARTS_UNAVAILABLE, status=503)
+
+        buffer = BytesIO()
+        with zipfile.ZipFile(buffer, 'w') as archive:
+            for client_id, (_, image) in zip(specs, images):
+                archive.writestr(f'client-{client_id}-progress.{fmt}', image)
+        response = HttpResponse(buffer.getvalue(), content_type='application/zip')
+        response['Content-Disposition'] = 'attachment; filename="progress-charts.zip"'
+        return response
+
+
+class HoursChart(ChartView):
+    """
+    GET charts/hours.png|svg?start=&end=&site=: hours per employee, for the
+    current pay period unless a range is given.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request, fmt):
+        site = request.query_params.get('site') or None
+        try:
+            start, end = date_range(
+                request.query_params, report_period(ReportFile.TIMESHEET, site_today(site)),
+            )
+        except ValueError:
+            return Response(INVALID_RANGE, status=400)
+        return self.chart_response(request, charts.hours_spec(start, end, site), fmt)
@@ -1,5 +1,11 @@
+from datetime import timedelta
 from django.contrib import admin
+from django.contrib.admin.options import IncorrectLookupParameters
+from django.template.response import TemplateResponse
+from django.urls import path
+from Attendance_Backend.sitetime import site_today
 from .models import UserSettings, Document
+from .reports import expiring_documents_report, expiry_window
 
 
 class DocumentInline(admin.TabularInline):
@@ -16,10 +22,10 @@ class UserSettingsAdmin(admin.ModelAdmin):
         'gender', 'race', 'marital_status'
     )
     list_filter = (
-        'location', 'gender', 'marital_status', 'race'
+        'site', 'gender', 'marital_status', 'race'
     )
     search_fields = (
-        'user__username', 'provider_id', 'payroll_id',
+        'user__email', 'user__name', 'provider_id', 'payroll_id',
         'race', 'manager_name'
     )
     inlines = [DocumentInline]
@@ -43,8 +49,72 @@ class UserSettingsAdmin(admin.ModelAdmin):
     )
 
 
+class ExpiringWithinFilter(admin.SimpleListFilter):
+    title = 'expiry'
+    parameter_name = 'expiring'
+
+    def lookups(self, request, model_admin):
+        return (
+            ('expired', 'Already expired'),
+            ('30', 'Within 30 days'),
+            ('60', 'Within 60 days'),
+            ('90', 'Within 90 days'),
+        )
+
+    def queryset(self, request, queryset):
+        today = site_today()
+        if self.value() == 'expired':
+            return queryset.filter(effective_end__lt=today)
+        if self.value():
+            try:
+                end = today + timedelta(days=int(self.value()))
+            except (ValueError, OverflowError):
+                raise IncorrectLookupParameters(f"Unknown expiry filter {self.value()!r}.")
+            return queryset.expiring_between(today, end)
+        return queryset
+
+
 @admin.register(Document)
 class DocumentAdmin(admin.ModelAdmin):
-    list_display = ('name', 'user_settings', 'effective_start', 'effective_end')
-    list_filter = ('effective_start', 'effective_end')
-    search_fields = ('name', 'user_settings__user__username')
+    list_display = ('name', 'user_settings', 'location', 'manager', 'effective_start', 'effective_end')
+    list_filter = (ExpiringWithinFilter, 'user_settings__site', 'effective_start', 'effective_end')
+    list_select_related = ('user_settings__user', 'user_settings__site')
+    search_fields = ('name', 'user_settings__user__email', 'user_settings__user__name')
+    ordering = ('effective_end',)
+    change_list_template = 'admin/settings/document/change_list.html'
+
+    def location(self, obj):
+        return obj.user_settings.site or obj.user_settings.location
+    location.admin_order_field = 'user_settings__site__name'
+
+    def manager(self, obj):
+        return obj.user_settings.manager_name
+    manager.admin_order_field = 'user_settings__manager_name'
+
+    def get_urls(self):
+        urls = [
+            path(
+                'expiring/',
+                self.admin_site.admin_view(self.expiring_report_view),
+                name='settings_document_expiring',
+            ),
+        ]
+        return urls + super().get_urls()
+
+    def expiring_report_view(self, request):
+        """Expiring credentials grouped by location and manager (?days=, ?start=, ?end=, ?site=)."""
+        try:
+            start, end = expiry_window(request.GET)
+            error = None
+        except ValueError:
+            start, end = expiry_window({})
+            error = 'Invalid window, showing the next 30 days instead.'
+
+        context = {
+            **self.admin_site.each_context(request),
+            'opts': self.model._meta,
+            'title': 'Expiring documents',
+            'report': expiring_documents_report(start, end, site=request.GET.get('site') or None),
+            'error': error,
+        }
+        return TemplateResponse(request, 'admin/settings/document/expiring_report.html', context)
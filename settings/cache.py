@@ -0,0 +1,21 @@
+from django.core.cache import cache
+
+# Serialized settings are invalidated by the signals in settings.models, so
+# the timeout only bounds how long an entry for an idle user stays around.
+USER_SETTINGS_CACHE_TIMEOUT = 60 * 60
+
+
+def user_settings_cache_key(user_id):
+    return f"user-settings:{user_id}"
+
+
+def get_cached_user_settings(user_id):
+    return cache.get(user_settings_cache_key(user_id))
+
+
+def cache_user_settings(user_id, data):
+    cache.set(user_settings_cache_key(user_id), data, USER_SETTINGS_CACHE_TIMEOUT)
+
+
+def invalidate_user_settings(user_id):
+    cache.delete(user_settings_cache_key(user_id))
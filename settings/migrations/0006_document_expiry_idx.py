@@ -0,0 +1,22 @@
+# Generated by Django 5.2 on 2026-10-19 02:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('settings', '0005_alter_usersettings_race'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='usersettings',
+            name='race',
+            field=models.CharField(choices=[('american_indian', 'American Indian or Alaska Native'), ('asian', 'Asian'), ('African American', 'Black or African American'), ('native_hawaiian', 'Native Hawaiian or Other Pacific Islander'), ('white', 'White'), ('two_or_more', 'Two or More Races'), ('not_disclosed', 'Prefer Not to Disclose')], default='not_disclosed', max_length=50),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['effective_end', 'user_settings'], name='document_expiry_idx'),
+        ),
+    ]
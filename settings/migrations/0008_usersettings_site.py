@@ -0,0 +1,39 @@
+# Generated by Django 5.2 on 2026-10-19 02:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import F
+
+
+def link_sites(apps, schema_editor):
+    Location = apps.get_model('locations', 'Location')
+    UserSettings = apps.get_model('settings', 'UserSettings')
+    known = set(Location.objects.values_list('code', flat=True))
+    codes = set(UserSettings.objects.exclude(location='').values_list('location', flat=True).distinct())
+    Location.objects.bulk_create([
+        Location(code=code, name=code.replace('_', ' ').title(), time_zone='America/Phoenix')
+        for code in codes - known
+    ])
+    UserSettings.objects.exclude(location='').update(site_id=F('location'))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('locations', '0001_initial'),
+        ('settings', '0007_usersettings_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='usersettings',
+            name='site',
+            field=models.ForeignKey(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.PROTECT, related_name='user_settings', to='locations.location', to_field='code'),
+        ),
+        migrations.AlterField(
+            model_name='usersettings',
+            name='location',
+            field=models.CharField(default='guadalupe_dta', max_length=50),
+        ),
+        migrations.RunPython(link_sites, migrations.RunPython.noop),
+    ]
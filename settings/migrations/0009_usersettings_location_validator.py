@@ -0,0 +1,19 @@
+# Generated by Django 5.2 on 2026-10-19 03:26
+
+import locations.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('settings', '0008_usersettings_site'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='usersettings',
+            name='location',
+            field=models.CharField(default='guadalupe_dta', max_length=50, validators=[locations.models.validate_location_code]),
+        ),
+    ]
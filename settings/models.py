@@ -1,14 +1,8 @@
 from django.conf import settings
 from django.db import models
+from locations.models import Location, validate_location_code
 
 class UserSettings(models.Model):
-    LOCATION_CHOICES = [
-        ('guadalupe_dta', 'Guadalupe DTA'),
-        ('guadalupe_dtt', 'Guadalupe DTT'),
-        ('guadalupe_special_dta', 'Guadalupe Special DTA'),
-        ('hcbs', 'HCBS'),
-    ]
-
     GENDER_CHOICES = [
         ('male', 'Male'),
         ('female', 'Female'),
@@ -47,10 +41,16 @@ class UserSettings(models.Model):
     # New fields with default values for backward compatibility
     provider_id = models.CharField(max_length=100, default='N/A')
     payroll_id = models.CharField(max_length=100, default='N/A')
-    location = models.CharField(
-        max_length=50,
-        choices=LOCATION_CHOICES,
-        default='guadalupe_dta'
+    location = models.CharField(max_length=50, default='guadalupe_dta', validators=[validate_location_code])
+    # Mirrors ``location`` as a foreign key for site-partitioned queries
+    site = models.ForeignKey(
+        Location,
+        to_field='code',
+        on_delete=models.PROTECT,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name='user_settings',
     )
     gender = models.CharField(
         max_length=10,
@@ -68,10 +68,21 @@ class UserSettings(models.Model):
         default='None'
     )
     additional_info = models.TextField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)  # also touched when a document changes
 
     def __str__(self):
         return f"{self.user.username}'s settings"
 
+    def save(self, *args, **kwargs):
+        self.site_id = self.location or None
+        super().save(*args, **kwargs)
+
+
+class DocumentQuerySet(models.QuerySet):
+    def expiring_between(self, start, end):
+        """Documents whose effective_end falls in [start, end]; served by document_expiry_idx."""
+        return self.filter(effective_end__range=(start, end))
+
 
 class Document(models.Model):
     user_settings = models.ForeignKey(
@@ -83,5 +94,31 @@ class Document(models.Model):
     effective_start = models.DateField()
     effective_end = models.DateField()
 
+    objects = DocumentQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['effective_end', 'user_settings'], name='document_expiry_idx'),
+        ]
+
     def __str__(self):
         return f"{self.name} for {self.user_settings.user.username}"
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+from settings.cache import invalidate_user_settings
+
+
+@receiver([post_save, post_delete], sender=UserSettings)
+def invalidate_settings_cache(sender, instance, **kwargs):
+    invalidate_user_settings(instance.user_id)
+
+
+@receiver([post_save, post_delete], sender=Document)
+def invalidate_settings_cache_for_document(sender, instance, **kwargs):
+    # Documents are part of the settings response, so they bump its updated_at (and ETag)
+    UserSettings.objects.filter(pk=instance.user_settings_id).update(updated_at=timezone.now())
+    user_id = UserSettings.objects.filter(pk=instance.user_settings_id).values_list('user_id', flat=True).first()
+    if user_id is not None:
+        invalidate_user_settings(user_id)
@@ -0,0 +1,93 @@
+from datetime import date, datetime, timedelta
+from Attendance_Backend.sitetime import site_today
+from rest_framework import serializers
+from .models import Document
+
+DEFAULT_EXPIRY_WINDOW_DAYS = 30
+
+_format_date = serializers.DateField().to_representation
+
+
+def parse_report_date(value):
+    """Accept both ISO dates and the API's MM/DD/YYYY format."""
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        return datetime.strptime(value, '%m/%d/%Y').date()
+
+
+def expiry_window(params):
+    """Resolve (start, end) from ``start``/``end`` or ``days`` query parameters."""
+    start = parse_report_date(params['start']) if params.get('start') else site_today()
+    if params.get('end'):
+        end = parse_report_date(params['end'])
+    else:
+        try:
+            end = start + timedelta(days=int(params.get('days') or DEFAULT_EXPIRY_WINDOW_DAYS))
+        except OverflowError:
+            raise ValueError("days is out of range")
+    if end < start:
+        raise ValueError("end must not be before start")
+    return start, end
+
+
+def expiring_documents_report(start, end, site=None):
+    """
+    Employees whose documents lapse in [start, end], grouped by location and manager.
+
+    Runs a single range query over the effective_end index joined through
+    UserSettings, limited to one Location code when ``site`` is given; the
+    grouping is done on the already ordered rows.
+    """
+    documents = Document.objects.expiring_between(start, end)
+    if site is not None:
+        documents = documents.filter(user_settings__site_id=site)
+    rows = (
+        documents
+        .order_by('user_settings__location', 'user_settings__manager_name',
+                  'user_settings__user__name', 'effective_end')
+        .values(
+            'id', 'name', 'effective_start', 'effective_end',
+            'user_settings__location', 'user_settings__site__name', 'user_settings__manager_name',
+            'user_settings__user_id', 'user_settings__user__name', 'user_settings__user__email',
+        )
+    )
+
+    locations = []
+    location = manager = employee = None
+    count = 0
+    for row in rows:
+        count += 1
+        if location is None or location['location'] != row['user_settings__location']:
+            location = {
+                'location': row['user_settings__location'],
+                'location_name': row['user_settings__site__name'] or row['user_settings__location'],
+                'managers': [],
+            }
+            locations.append(location)
+            manager = None
+        if manager is None or manager['manager'] != row['user_settings__manager_name']:
+            manager = {'manager': row['user_settings__manager_name'], 'employees': []}
+            location['managers'].append(manager)
+            employee = None
+        if employee is None or employee['user_id'] != row['user_settings__user_id']:
+            employee = {
+                'user_id': row['user_settings__user_id'],
+                'name': row['user_settings__user__name'],
+                'email': row['user_settings__user__email'],
+                'documents': [],
+            }
+            manager['employees'].append(employee)
+        employee['documents'].append({
+            'id': row['id'],
+            'name': row['name'],
+            'effective_start': _format_date(row['effective_start']),
+            'effective_end': _format_date(row['effective_end']),
+        })
+
+    return {
+        'start': _format_date(start),
+        'end': _format_date(end),
+        'count': count,
+        'locations': locations,
+    }
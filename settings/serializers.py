@@ -1,8 +1,20 @@
 from rest_framework import serializers
-from .models import UserSettings
+from Attendance_Backend.api.fieldsets import SparseFieldsetMixin
+from .models import UserSettings, Document
+
+
+class DocumentSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Document
+        fields = ['id', 'name', 'effective_start', 'effective_end']
+
+
+class UserSettingsSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    documents = DocumentSerializer(many=True, read_only=True)
 
-class UserSettingsSerializer(serializers.ModelSerializer):
     class Meta:
         model = UserSettings
         fields = '__all__'
         read_only_fields = ['user']
+        expandable_fields = ['documents']
+        default_expand = ['documents']
@@ -1,3 +1,127 @@
-from django.test import TestCase
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.urls import reverse
+from rest_framework import status
+from rest_framework.test import APITestCase
 
-# Create your tests here.
+from locations.models import Location
+from .models import UserSettings, Document
+
+User = get_user_model()
+
+
+class UserSettingsDetailTest(APITestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(name="John Doe", email="jdoe@gmail.com", password="pa$$w0rd!")
+        self.client.force_authenticate(user=self.user)
+        self.url = reverse("user-settings")
+
+    def create_settings(self):
+        return UserSettings.objects.create(
+            user=self.user, street_address="1 Main St", city="Tempe",
+            state="AZ", zip_code="85281", manager_name="Maria",
+        )
+
+    def test_get_without_settings_does_not_create(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertFalse(UserSettings.objects.filter(user=self.user).exists())
+
+    def test_get_is_served_from_cache(self):
+        self.create_settings()
+        self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["city"], "Tempe")
+
+    def test_update_invalidates_cache(self):
+        settings = self.create_settings()
+        self.client.get(self.url)
+
+        self.client.patch(self.url, {"city": "Mesa"}, format="json")
+        Document.objects.create(
+            user_settings=settings, name="CPR", effective_start="2025-01-01", effective_end="2026-01-01",
+        )
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.data["city"], "Mesa")
+        self.assertEqual([doc["name"] for doc in response.data["documents"]], ["CPR"])
+
+    def test_create_rejects_second_settings(self):
+        self.create_settings()
+        data = {"street_address": "2 Main St", "city": "Tempe", "state": "AZ", "zip_code": "85281", "manager_name": "Maria"}
+
+        response = self.client.post(reverse("create-settings"), data, format="json")
+
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_location_must_be_an_active_site(self):
+        Location.objects.filter(code="hcbs").update(is_active=False)
+        settings = self.create_settings()
+
+        for code in ("nowhere", "hcbs"):
+            settings.location = code
+            with self.assertRaisesMessage(ValidationError, f"Unknown location {code!r}."):
+                settings.full_clean()
+            response = self.client.patch(self.url, {"location": code}, format="json")
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+
+class ExpiringDocumentsReportTest(APITestCase):
+
+    def setUp(self):
+        self.admin = User.objects.create_superuser(name="Admin", email="admin@example.com", password="pa$$w0rd!")
+        self.client.force_authenticate(user=self.admin)
+        self.url = reverse("expiring-documents")
+
+    def add_employee(self, email, location, manager, *document_ends):
+        user = User.objects.create_user(name=email.split("@")[0], email=email, password="pa$$w0rd!")
+        settings = UserSettings.objects.create(
+            user=user, street_address="1 Main St", city="Tempe", state="AZ",
+            zip_code="85281", manager_name=manager, location=location,
+        )
+        for index, end in enumerate(document_ends):
+            Document.objects.create(user_settings=settings, name=f"Doc {index}", effective_start="2025-01-01", effective_end=end)
+
+    def test_report_groups_by_location_and_manager(self):
+        self.add_employee("ann@example.com", "guadalupe_dta", "Maria", "2026-03-10", "2026-12-31")
+        self.add_employee("bob@example.com", "guadalupe_dta", "Maria", "2026-03-20")
+        self.add_employee("cyd@example.com", "hcbs", "Jose", "2026-03-05")
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url, {"start": "2026-03-01", "end": "2026-03-31"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data["count"], 3)
+        self.assertEqual([loc["location"] for loc in response.data["locations"]], ["guadalupe_dta", "hcbs"])
+        maria = response.data["locations"][0]["managers"][0]
+        self.assertEqual(maria["manager"], "Maria")
+        self.assertEqual([emp["email"] for emp in maria["employees"]], ["ann@example.com", "bob@example.com"])
+        self.assertEqual(maria["employees"][0]["documents"][0]["effective_end"], "03/10/2026")
+
+    def test_invalid_window(self):
+        for days in ("soon", "99999999999"):
+            response = self.client.get(self.url, {"days": days})
+
+            self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_requires_staff(self):
+        user = User.objects.create_user(name="Staff", email="staff@example.com", password="pa$$w0rd!")
+        self.client.force_authenticate(user=user)
+
+        self.assertEqual(self.client.get(self.url).status_code, status.HTTP_403_FORBIDDEN)
+
+    def test_admin_ignores_a_malformed_expiry_filter(self):
+        self.client.force_login(self.admin)
+
+        for value in ("abc", "99999999999"):
+            response = self.client.get("/admin/settings/document/", {"expiring": value})
+
+            self.assertRedirects(response, "/admin/settings/document/?e=1", fetch_redirect_response=False)
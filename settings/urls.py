@@ -1,7 +1,8 @@
 from django.urls import path
-from .views import UserSettingsDetail, UserSettingsCreate
+from .views import UserSettingsDetail, UserSettingsCreate, ExpiringDocumentsReport
 
 urlpatterns = [
     path('settings/', UserSettingsDetail.as_view(), name='user-settings'),
     path('settings/create/', UserSettingsCreate.as_view(), name='create-settings'),
+    path('documents/expiring/', ExpiringDocumentsReport.as_view(), name='expiring-documents'),
 ]
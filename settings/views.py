@@ -1,19 +1,72 @@
-from rest_framework import generics, permissions
+from django.shortcuts import get_object_or_404
+from django.utils.dateparse import parse_datetime
+from rest_framework import generics, permissions, serializers, status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from Attendance_Backend.api.conditional import ConditionalGetMixin
+from Attendance_Backend.api.fieldsets import is_sparse_request
+from .cache import cache_user_settings, get_cached_user_settings
 from .models import UserSettings
+from .reports import expiring_documents_report, expiry_window
 from .serializers import UserSettingsSerializer
 
-class UserSettingsDetail(generics.RetrieveUpdateDestroyAPIView):
+class UserSettingsDetail(ConditionalGetMixin, generics.RetrieveUpdateDestroyAPIView):
     serializer_class = UserSettingsSerializer
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_queryset(self):
+        return UserSettings.objects.select_related('user').prefetch_related('documents')
+
+    def get_fingerprint_queryset(self):
+        return UserSettings.objects.filter(user=self.request.user)
+
+    def get_fingerprint(self):
+        # A cached entry is current (the signals drop it on change), so its
+        # updated_at stands in for the fingerprint query
+        data = get_cached_user_settings(self.request.user.pk)
+        if data is not None:
+            return 1, parse_datetime(data['updated_at']), ()
+        return super().get_fingerprint()
+
     def get_object(self):
-        # Ensures only one settings instance per user
-        obj, created = UserSettings.objects.get_or_create(user=self.request.user)
-        return obj
+        # Settings are only created through UserSettingsCreate, never on read
+        return get_object_or_404(self.get_queryset(), user=self.request.user)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(request, self.cached_retrieve, *args, **kwargs)
+
+    def cached_retrieve(self, request, *args, **kwargs):
+        if is_sparse_request(request):
+            # Only the full representation is cached
+            return Response(self.get_serializer(self.get_object()).data)
+        data = get_cached_user_settings(request.user.pk)
+        if data is None:
+            data = self.get_serializer(self.get_object()).data
+            cache_user_settings(request.user.pk, data)
+        return Response(data)
 
 class UserSettingsCreate(generics.CreateAPIView):
     serializer_class = UserSettingsSerializer
     permission_classes = [permissions.IsAuthenticated]
 
     def perform_create(self, serializer):
+        if UserSettings.objects.filter(user=self.request.user).exists():
+            raise serializers.ValidationError({'detail': 'Settings already exist for this user.'})
         serializer.save(user=self.request.user)
+
+class ExpiringDocumentsReport(APIView):
+    """
+    GET ?start=&end= (or ?days=N from start/today): documents lapsing in the
+    window, grouped by location and manager.
+    """
+    permission_classes = [permissions.IsAdminUser]
+
+    def get(self, request):
+        try:
+            start, end = expiry_window(request.query_params)
+        except ValueError:
+            return Response(
+                {'error': 'Invalid window. Use start/end as YYYY-MM-DD or MM/DD/YYYY, or days as a number.'},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(expiring_documents_report(start, end, site=request.query_params.get('site') or None))